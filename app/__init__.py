@@ -1,6 +1,13 @@
 from flask import Flask
 from flask_login import LoginManager
+from flask_migrate import Migrate
+from flask_sqlalchemy import SQLAlchemy
 
+from app.utils.banco import SessaoRoteada
+from config.settings import get_config
+
+db = SQLAlchemy(session_options={'class_': SessaoRoteada})
+migrate = Migrate()
 login_manager = LoginManager()
 
 # ===== USUÁRIO FICTÍCIO =====
@@ -21,11 +28,27 @@ USUARIO_DEMO = UsuarioFicticio(1, 'demo@anotaai.com', 'Usuário Demo')
 
 def create_app():
     app = Flask(__name__)
+    app.config.from_object(get_config())
+    
+    # JSON com orjson quando instalado (fallback para o json padrão)
+    from app.utils.json_rapido import ProvedorJSONRapido
+    app.json = ProvedorJSONRapido(app)
     
     # Configuração mínima necessária
     app.config['SECRET_KEY'] = 'demo-secret-key-ficticio'
     app.config['WTF_CSRF_ENABLED'] = False
     
+    # Banco de dados: pool conforme o ambiente e PRAGMAs do SQLite em cada conexão
+    db.init_app(app)
+    # Migrações (flask db ...): os modelos precisam estar no metadata para o autogenerate
+    from app import models  # noqa: F401
+    migrate.init_app(app, db)
+    from app.utils.banco import BIND_LEITURA, aplicar_pragmas_sqlite
+    with app.app_context():
+        aplicar_pragmas_sqlite(db.engine, app.config.get('SQLITE_PRAGMAS'))
+        if BIND_LEITURA in db.engines:
+            aplicar_pragmas_sqlite(db.engines[BIND_LEITURA], app.config.get('SQLITE_PRAGMAS_LEITURA'))
+    
     # Configure Flask-Login
     login_manager.init_app(app)
     login_manager.login_view = 'main.login'
@@ -44,5 +67,22 @@ def create_app():
     
     app.register_blueprint(main_bp)
     app.register_blueprint(dashboard_api)
+    
+    # Versões dos dados dos ETags: por processo ou compartilhadas entre workers
+    from app.utils.cache_http import VERSOES_DADOS
+    VERSOES_DADOS.configurar(app.config)
+    
+    # Cache de respostas: backend conforme a configuração e dependências das rotas
+    from app.utils.cache_respostas import CACHE_RESPOSTAS
+    CACHE_RESPOSTAS.configurar(app.config)
+    CACHE_RESPOSTAS.registrar_rotas(app)
+    
+    # Cache de segundo nível dos repositórios (desligado se não configurado)
+    from app.repositories.base_repository import BaseRepository
+    BaseRepository.configurar_cache(app.config)
+    
+    # Eventos do dashboard: repasse entre workers, se configurado
+    from app.utils.eventos import BARRAMENTO_EVENTOS
+    BARRAMENTO_EVENTOS.configurar(app.config)
 
     return app
\ No newline at end of file
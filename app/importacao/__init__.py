@@ -0,0 +1,15 @@
+# Importação de extratos bancários (CSV/OFX)
+from .classificador import ClassificadorCategorias
+from .deduplicador import Deduplicador, IndiceDeduplicacao
+from .importador import ImportadorExtrato, RegistroImportacoes, detectar_formato
+from .normalizacao import LinhaInvalidaError
+
+__all__ = [
+    'ClassificadorCategorias',
+    'Deduplicador',
+    'IndiceDeduplicacao',
+    'ImportadorExtrato',
+    'RegistroImportacoes',
+    'detectar_formato',
+    'LinhaInvalidaError'
+]
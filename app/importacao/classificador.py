@@ -0,0 +1,93 @@
+import re
+from typing import Dict, Iterable, List, Optional
+
+from .leitores import normalizar_texto
+
+# Palavras-chave (sem acentos, minúsculas) -> nome da categoria
+REGRAS_PADRAO = {
+    'Alimentação': ['supermercado', 'mercado', 'restaurante', 'padaria', 'ifood', 'lanchonete',
+                    'pizzaria', 'acougue', 'hortifruti', 'atacadao', 'carrefour', 'pao de acucar'],
+    'Transporte': ['uber', '99app', '99 pop', 'posto', 'combustivel', 'gasolina', 'estacionamento',
+                   'pedagio', 'metro', 'onibus', 'sem parar'],
+    'Moradia': ['aluguel', 'condominio', 'energia', 'conta de luz', 'enel', 'cemig', 'sabesp',
+                'agua', 'internet', 'vivo fibra', 'gas'],
+    'Lazer': ['cinema', 'netflix', 'spotify', 'show', 'teatro', 'ingresso', 'steam'],
+    'Saúde': ['farmacia', 'drogaria', 'drogasil', 'hospital', 'clinica', 'laboratorio',
+              'plano de saude', 'unimed', 'academia'],
+    'Educação': ['escola', 'faculdade', 'universidade', 'curso', 'livraria', 'mensalidade escolar'],
+    'Salário': ['salario', 'folha de pagamento', 'pagto salario', 'proventos'],
+    'Freelance': ['freelance', 'freela', 'honorarios'],
+    'Investimentos': ['dividendos', 'rendimento', 'juros sobre capital', 'resgate', 'cdb', 'tesouro'],
+}
+
+
+class ClassificadorCategorias:
+    """
+    Atribui categoria_id aos lançamentos importados
+
+    Cada categoria é reconhecida pelo próprio nome e pelas palavras-chave
+    das regras. As palavras-chave de cada tipo (receita/despesa) são
+    compiladas em uma única expressão regular, então classificar um
+    lançamento é uma busca só, independentemente do número de regras.
+    """
+
+    CATEGORIA_PADRAO = 'Outros'
+
+    def __init__(self, categorias: Iterable[dict], regras: Optional[Dict[str, List[str]]] = None):
+        """
+        Inicializa o classificador
+
+        Args:
+            categorias (Iterable[dict]): Tabela de categorias (id, nome, tipo)
+            regras (Dict[str, List[str]]): Palavras-chave por nome de categoria
+        """
+        self.categorias = {categoria['id']: categoria for categoria in categorias}
+        self._por_nome = {normalizar_texto(c['nome']): c for c in self.categorias.values()}
+        padrao = self._por_nome.get(normalizar_texto(self.CATEGORIA_PADRAO))
+        self._padrao = padrao or next(iter(self.categorias.values()))
+
+        regras = REGRAS_PADRAO if regras is None else regras
+        self._palavras = {}
+        self._expressoes = {}
+        for tipo in ('receita', 'despesa'):
+            palavras = {}
+            for nome, categoria in self._por_nome.items():
+                if categoria['tipo'] not in (tipo, 'ambos') or categoria is self._padrao:
+                    continue
+                palavras[nome] = categoria
+                for palavra in regras.get(categoria['nome'], []):
+                    palavras[normalizar_texto(palavra)] = categoria
+            self._palavras[tipo] = palavras
+            # Palavras mais longas primeiro, para "conta de luz" vencer "luz"
+            alternativas = sorted(palavras, key=len, reverse=True)
+            self._expressoes[tipo] = re.compile(
+                r'\b(' + '|'.join(re.escape(p) for p in alternativas) + r')\b'
+            ) if alternativas else None
+
+    def classificar(self, lancamento: dict) -> dict:
+        """
+        Retorna a categoria do lançamento
+
+        Usa a categoria informada no arquivo quando ela existe na tabela;
+        caso contrário, procura palavras-chave na descrição e, sem nenhuma,
+        usa a categoria padrão.
+        """
+        informada = self._por_nome.get(normalizar_texto(lancamento.get('categoria') or ''))
+        if informada is not None:
+            return informada
+
+        expressao = self._expressoes.get(lancamento['tipo'])
+        if expressao is not None:
+            encontrada = expressao.search(normalizar_texto(lancamento['descricao']))
+            if encontrada:
+                return self._palavras[lancamento['tipo']][encontrada.group(1)]
+        return self._padrao
+
+    def classificar_todos(self, lancamentos):
+        """Preenche categoria_id e categoria_nome de cada lançamento do fluxo"""
+        for lancamento in lancamentos:
+            categoria = self.classificar(lancamento)
+            lancamento['categoria_id'] = categoria['id']
+            lancamento['categoria_nome'] = categoria['nome']
+            del lancamento['categoria']
+            yield lancamento
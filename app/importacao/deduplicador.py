@@ -0,0 +1,126 @@
+import threading
+from collections import Counter
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from app.stores.sincronizacao import nova_trava, sincronizado
+
+from .leitores import normalizar_texto
+
+
+def chave_conteudo(transacao: dict) -> Tuple:
+    """Chave de conteúdo: (dia, valor em centavos, tipo, descrição normalizada)"""
+    return (
+        transacao['data_transacao'][:10],
+        round(float(transacao['valor']) * 100),
+        transacao['tipo'],
+        normalizar_texto(transacao['descricao']),
+    )
+
+
+class IndiceDeduplicacao:
+    """
+    Índice das transações gravadas usado na deduplicação das importações
+
+    Guarda a quantidade de transações por chave de conteúdo e o conjunto de
+    identificadores do banco. É mantido a cada escrita (registrar/remover),
+    então uma importação consulta só as chaves do próprio extrato em vez de
+    percorrer todas as transações.
+    """
+
+    def __init__(self, transacoes: Iterable[dict] = (), trava: Optional[threading.RLock] = None):
+        """
+        Inicializa o índice
+
+        Args:
+            transacoes (Iterable[dict]): Transações já gravadas
+            trava (RLock): Trava compartilhada com os stores das transações (opcional)
+        """
+        self._trava = nova_trava(trava)
+        self._ids_externos = set()
+        self._conteudo = Counter()
+        for transacao in transacoes:
+            self.registrar(transacao)
+
+    @sincronizado
+    def registrar(self, transacao: dict) -> None:
+        """Inclui uma transação gravada no índice"""
+        if transacao.get('id_externo'):
+            self._ids_externos.add(transacao['id_externo'])
+        else:
+            self._conteudo[chave_conteudo(transacao)] += 1
+
+    @sincronizado
+    def remover(self, transacao: dict) -> None:
+        """Retira uma transação excluída (ou a versão anterior de uma atualizada) do índice"""
+        if transacao.get('id_externo'):
+            self._ids_externos.discard(transacao['id_externo'])
+            return
+        chave = chave_conteudo(transacao)
+        self._conteudo[chave] -= 1
+        if self._conteudo[chave] <= 0:
+            del self._conteudo[chave]
+
+    @sincronizado
+    def quantidade(self, chave: Tuple) -> int:
+        """Quantidade de transações gravadas com a chave de conteúdo"""
+        return self._conteudo.get(chave, 0)
+
+    @sincronizado
+    def contem_id_externo(self, id_externo: str) -> bool:
+        """Indica se já existe transação com o identificador do banco"""
+        return id_externo in self._ids_externos
+
+
+class Deduplicador:
+    """
+    Descarta lançamentos que já existem
+
+    Lançamentos com identificador do banco (FITID do OFX ou coluna de id do
+    CSV) são comparados por ele. Os demais são comparados pelo conteúdo
+    (dia, valor, tipo e descrição) como um multiconjunto: se o extrato tem
+    dois cafés iguais no mesmo dia e já existe um, apenas o segundo é
+    importado, e reimportar o mesmo arquivo não duplica nenhum.
+
+    As existentes vêm de um IndiceDeduplicacao. Como os lotes importados são
+    gravados no mesmo índice durante a importação, a quantidade existente de
+    cada chave é lida na primeira vez que a chave aparece no extrato (antes de
+    qualquer lançamento dela ser gravado) e reaproveitada depois.
+    """
+
+    def __init__(self, existentes=()):
+        """
+        Inicializa o deduplicador
+
+        Args:
+            existentes (IndiceDeduplicacao | Iterable[dict]): Índice das transações
+                gravadas, ou as próprias transações (um índice é montado com elas)
+        """
+        self._indice = existentes if isinstance(existentes, IndiceDeduplicacao) else IndiceDeduplicacao(existentes)
+        self._ids_vistos = set()
+        self._existentes: Dict[Tuple, int] = {}
+        self._vistos = Counter()
+
+    chave = staticmethod(chave_conteudo)
+
+    def duplicado(self, lancamento: dict) -> bool:
+        """Indica se o lançamento já existe, registrando-o como visto caso contrário"""
+        id_externo = lancamento.get('id_externo')
+        if id_externo:
+            if id_externo in self._ids_vistos:
+                return True
+            self._ids_vistos.add(id_externo)
+            return self._indice.contem_id_externo(id_externo)
+
+        chave = self.chave(lancamento)
+        if chave not in self._existentes:
+            self._existentes[chave] = self._indice.quantidade(chave)
+        self._vistos[chave] += 1
+        return self._vistos[chave] <= self._existentes[chave]
+
+    def filtrar(self, lancamentos: Iterable[dict], resultado: dict) -> Iterator[dict]:
+        """Repassa apenas os lançamentos novos, contando os descartados em resultado['duplicadas']"""
+        for lancamento in lancamentos:
+            if self.duplicado(lancamento):
+                resultado['duplicadas'] += 1
+            else:
+                yield lancamento
@@ -0,0 +1,180 @@
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from itertools import islice
+from typing import BinaryIO, Callable, Iterable, List, Optional
+
+from .classificador import ClassificadorCategorias
+from .deduplicador import Deduplicador
+from .leitores import LEITORES, abrir_texto
+from .normalizacao import normalizar
+
+PENDENTE = 'pendente'
+EXECUTANDO = 'executando'
+CONCLUIDO = 'concluido'
+ERRO = 'erro'
+
+
+def detectar_formato(nome_arquivo: str) -> str:
+    """Deduz o formato do extrato pela extensão do arquivo"""
+    extensao = nome_arquivo.rsplit('.', 1)[-1].lower() if '.' in nome_arquivo else ''
+    if extensao not in LEITORES:
+        raise ValueError(f'Formato não suportado: {extensao or nome_arquivo}. Use CSV ou OFX')
+    return extensao
+
+
+class ImportadorExtrato:
+    """
+    Pipeline de importação de extratos bancários
+
+    Cada etapa é um gerador que consome a anterior, de modo que o arquivo
+    é lido, normalizado, classificado e deduplicado um lançamento por vez:
+
+        leitor (CSV/OFX) -> normalizar -> classificar -> deduplicar -> lotes
+
+    Os lançamentos novos são entregues a `gravar_lote` em listas de até
+    `tamanho_lote` itens (uma transação do banco por lote, por exemplo via
+    BaseRepository.bulk_insert), e `progresso` é chamado após cada lote
+    com o resultado parcial. A memória usada não depende do tamanho do
+    extrato, apenas do lote e do índice de deduplicação.
+    """
+
+    TAMANHO_LOTE = 500
+
+    def __init__(self, classificador: ClassificadorCategorias,
+                 gravar_lote: Callable[[List[dict]], None],
+                 tamanho_lote: int = TAMANHO_LOTE,
+                 progresso: Optional[Callable[[dict], None]] = None):
+        """
+        Inicializa o importador
+
+        Args:
+            classificador (ClassificadorCategorias): Atribui as categorias
+            gravar_lote (Callable): Grava uma lista de transações normalizadas
+            tamanho_lote (int): Quantidade de transações por gravação
+            progresso (Callable): Recebe o resultado parcial após cada lote
+        """
+        self.classificador = classificador
+        self.gravar_lote = gravar_lote
+        self.tamanho_lote = tamanho_lote
+        self.progresso = progresso
+
+    @staticmethod
+    def novo_resultado() -> dict:
+        return {'lidas': 0, 'importadas': 0, 'duplicadas': 0, 'invalidas': 0, 'erros': []}
+
+    def importar(self, arquivo: BinaryIO, formato: str,
+                 transacoes_existentes: Iterable[dict] = (),
+                 resultado: Optional[dict] = None) -> dict:
+        """
+        Importa um extrato
+
+        Args:
+            arquivo (BinaryIO): Arquivo do extrato aberto em modo binário
+            formato (str): 'csv' ou 'ofx'
+            transacoes_existentes (IndiceDeduplicacao | Iterable[dict]): Índice das
+                transações já gravadas (ou as próprias transações), para deduplicação
+            resultado (dict): Resultado a preencher (opcional, permite acompanhar
+                              o progresso de outra thread)
+
+        Returns:
+            dict: Contagem de lidas, importadas, duplicadas e inválidas, e as
+                  mensagens das linhas inválidas
+        """
+        if formato not in LEITORES:
+            raise ValueError(f'Formato não suportado: {formato}')
+        resultado = resultado if resultado is not None else self.novo_resultado()
+
+        registros = self._contar_lidas(LEITORES[formato](abrir_texto(arquivo)), resultado)
+        lancamentos = normalizar(registros, resultado)
+        lancamentos = self.classificador.classificar_todos(lancamentos)
+        lancamentos = Deduplicador(transacoes_existentes).filtrar(lancamentos, resultado)
+
+        while True:
+            lote = list(islice(lancamentos, self.tamanho_lote))
+            if not lote:
+                break
+            for lancamento in lote:
+                del lancamento['linha']
+            self.gravar_lote(lote)
+            resultado['importadas'] += len(lote)
+            if self.progresso:
+                self.progresso(resultado)
+
+        return resultado
+
+    @staticmethod
+    def _contar_lidas(registros, resultado: dict):
+        for registro in registros:
+            resultado['lidas'] += 1
+            yield registro
+
+
+class RegistroImportacoes:
+    """
+    Execução de importações em segundo plano, com consulta do progresso
+
+    Cada importação roda em uma thread e seu estado (status e resultado
+    parcial) fica disponível pelo ID até ser descartado; apenas as
+    `max_importacoes` mais recentes são mantidas.
+    """
+
+    def __init__(self, max_importacoes: int = 100):
+        self.max_importacoes = max_importacoes
+        self._importacoes = OrderedDict()
+        self._trava = threading.Lock()
+
+    def iniciar(self, usuario_id: int, executar: Callable[[dict], None], **dados) -> dict:
+        """
+        Inicia uma importação em segundo plano
+
+        Args:
+            usuario_id (int): Dono da importação
+            executar (Callable): Recebe o dicionário de resultado e o preenche
+            **dados: Informações extras exibidas no estado (ex.: nome do arquivo)
+
+        Returns:
+            dict: Estado inicial da importação
+        """
+        estado = {
+            'id': uuid.uuid4().hex,
+            'usuario_id': usuario_id,
+            'status': PENDENTE,
+            'criado_em': datetime.now().isoformat(),
+            'concluido_em': None,
+            'erro': None,
+            'resultado': ImportadorExtrato.novo_resultado(),
+            **dados,
+        }
+        with self._trava:
+            self._importacoes[estado['id']] = estado
+            while len(self._importacoes) > self.max_importacoes:
+                self._importacoes.popitem(last=False)
+
+        threading.Thread(target=self._executar, args=(estado, executar), daemon=True).start()
+        return self._copiar(estado)
+
+    def obter(self, importacao_id: str, usuario_id: int) -> Optional[dict]:
+        """Retorna o estado da importação do usuário ou None"""
+        estado = self._importacoes.get(importacao_id)
+        if estado is None or estado['usuario_id'] != usuario_id:
+            return None
+        return self._copiar(estado)
+
+    @staticmethod
+    def _executar(estado: dict, executar: Callable[[dict], None]) -> None:
+        estado['status'] = EXECUTANDO
+        try:
+            executar(estado['resultado'])
+            estado['status'] = CONCLUIDO
+        except Exception as e:
+            estado['status'] = ERRO
+            estado['erro'] = str(e)
+        estado['concluido_em'] = datetime.now().isoformat()
+
+    @staticmethod
+    def _copiar(estado: dict) -> dict:
+        copia = dict(estado)
+        copia['resultado'] = dict(estado['resultado'], erros=list(estado['resultado']['erros']))
+        return copia
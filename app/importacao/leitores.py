@@ -0,0 +1,152 @@
+import codecs
+import csv
+import io
+import re
+import unicodedata
+from itertools import chain
+from typing import BinaryIO, Dict, Iterator, TextIO
+
+# Tamanho dos blocos lidos do arquivo
+TAMANHO_BLOCO = 64 * 1024
+
+# Nome normalizado do cabeçalho -> campo do pipeline
+COLUNAS_CSV = {
+    'data': 'data', 'date': 'data', 'data_transacao': 'data', 'data lancamento': 'data',
+    'data movimento': 'data', 'dt lancamento': 'data',
+    'descricao': 'descricao', 'description': 'descricao', 'historico': 'descricao',
+    'lancamento': 'descricao', 'memo': 'descricao', 'estabelecimento': 'descricao',
+    'valor': 'valor', 'amount': 'valor', 'valor (r$)': 'valor', 'valor r$': 'valor',
+    'tipo': 'tipo', 'natureza': 'tipo', 'd/c': 'tipo',
+    'categoria': 'categoria', 'category': 'categoria',
+    'id': 'id_externo', 'fitid': 'id_externo', 'documento': 'id_externo',
+    'observacoes': 'observacoes', 'observacao': 'observacoes',
+}
+
+_PADRAO_TAG_OFX = re.compile(r'<(/?)([A-Za-z0-9.]+)>([^<]*)')
+
+# Tags de STMTTRN aproveitadas -> campo do pipeline
+TAGS_OFX = {
+    'FITID': 'id_externo',
+    'DTPOSTED': 'data',
+    'TRNAMT': 'valor',
+    'TRNTYPE': 'tipo',
+    'NAME': 'descricao',
+    'MEMO': 'memo',
+}
+
+
+def normalizar_texto(texto: str) -> str:
+    """Remove acentos, converte para minúsculas e colapsa espaços"""
+    sem_acentos = unicodedata.normalize('NFKD', texto)
+    sem_acentos = ''.join(c for c in sem_acentos if not unicodedata.combining(c))
+    return ' '.join(sem_acentos.lower().split())
+
+
+def abrir_texto(arquivo: BinaryIO) -> TextIO:
+    """
+    Envolve um arquivo binário em um leitor de texto com a codificação detectada
+
+    Extratos de bancos brasileiros costumam vir em UTF-8 ou Windows-1252;
+    o primeiro bloco do arquivo é usado para escolher entre os dois, sem
+    carregar o restante em memória.
+
+    Args:
+        arquivo (BinaryIO): Arquivo aberto em modo binário (ex.: upload do Flask)
+
+    Returns:
+        TextIO: Leitor de texto sobre o mesmo arquivo
+    """
+    leitor = io.BufferedReader(arquivo) if not hasattr(arquivo, 'peek') else arquivo
+    inicio = leitor.peek(TAMANHO_BLOCO)[:TAMANHO_BLOCO]
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(inicio, final=False)
+        codificacao = 'utf-8-sig'
+    except UnicodeDecodeError:
+        codificacao = 'cp1252'
+    return io.TextIOWrapper(leitor, encoding=codificacao, errors='replace', newline='')
+
+
+def ler_csv(texto: TextIO) -> Iterator[Dict[str, str]]:
+    """
+    Lê um extrato CSV linha a linha
+
+    O delimitador (',' ou ';') é detectado pelo cabeçalho e as colunas são
+    renomeadas para os campos do pipeline (data, descricao, valor, tipo,
+    categoria, id_externo, observacoes); colunas desconhecidas são ignoradas.
+
+    Args:
+        texto (TextIO): Conteúdo do arquivo
+
+    Yields:
+        dict: Campos brutos (texto) de cada lançamento, com 'linha' = número da linha
+    """
+    cabecalho = texto.readline()
+    if not cabecalho.strip():
+        return
+    delimitador = ';' if cabecalho.count(';') > cabecalho.count(',') else ','
+    leitor = csv.reader(chain([cabecalho], texto), delimiter=delimitador)
+    campos = [COLUNAS_CSV.get(normalizar_texto(coluna)) for coluna in next(leitor)]
+    if 'data' not in campos or 'valor' not in campos:
+        raise ValueError('O CSV precisa das colunas de data e valor')
+
+    for numero, valores in enumerate(leitor, start=2):
+        if not any(valor.strip() for valor in valores):
+            continue
+        registro = {campo: valor.strip() for campo, valor in zip(campos, valores) if campo}
+        registro['linha'] = numero
+        yield registro
+
+
+def ler_ofx(texto: TextIO) -> Iterator[Dict[str, str]]:
+    """
+    Lê os lançamentos (STMTTRN) de um extrato OFX
+
+    Funciona tanto com OFX 1.x (SGML, sem tags de fechamento) quanto com
+    OFX 2.x (XML). O arquivo é lido em blocos e cada lançamento é emitido
+    assim que sua tag de fechamento (ou a abertura do próximo) é encontrada.
+
+    Args:
+        texto (TextIO): Conteúdo do arquivo
+
+    Yields:
+        dict: Campos brutos de cada lançamento, com 'linha' = posição no extrato
+    """
+    atual = None
+    numero = 0
+    resto = ''
+    while True:
+        bloco = texto.read(TAMANHO_BLOCO)
+        conteudo = resto + bloco
+        # Mantém a última tag (possivelmente incompleta) para o próximo bloco
+        corte = conteudo.rfind('<') if bloco else len(conteudo)
+        resto, conteudo = conteudo[corte:], conteudo[:corte]
+
+        for fechamento, tag, valor in _PADRAO_TAG_OFX.findall(conteudo):
+            tag = tag.upper()
+            if tag == 'STMTTRN':
+                if atual is not None:
+                    numero += 1
+                    atual['linha'] = numero
+                    yield atual
+                atual = None if fechamento else {}
+            elif atual is not None and not fechamento and tag in TAGS_OFX:
+                atual[TAGS_OFX[tag]] = valor.strip()
+            elif tag == 'BANKTRANLIST' and fechamento and atual is not None:
+                numero += 1
+                atual['linha'] = numero
+                yield atual
+                atual = None
+
+        if not bloco:
+            break
+
+    if atual is not None:
+        numero += 1
+        atual['linha'] = numero
+        yield atual
+
+
+LEITORES = {
+    'csv': ler_csv,
+    'ofx': ler_ofx,
+}
@@ -0,0 +1,139 @@
+import re
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Iterable, Iterator
+
+from .leitores import normalizar_texto
+
+FORMATOS_DATA = ('%d/%m/%Y', '%d/%m/%y', '%Y-%m-%d', '%d-%m-%Y', '%Y/%m/%d')
+
+# Indicadores de crédito/débito em colunas de tipo (CSV) e TRNTYPE (OFX)
+TIPOS_RECEITA = {'c', 'credito', 'credit', 'receita', 'entrada', 'dep', 'deposit', 'int', 'div', 'directdep'}
+TIPOS_DESPESA = {'d', 'debito', 'debit', 'despesa', 'saida', 'payment', 'fee', 'srvchg', 'atm', 'pos', 'check'}
+
+# Quantidade máxima de mensagens de erro guardadas no resultado
+MAX_ERROS = 100
+
+_PADRAO_VALOR = re.compile(r'[^0-9,.\-()]')
+
+
+class LinhaInvalidaError(ValueError):
+    """Lançamento que não pôde ser normalizado"""
+
+    def __init__(self, linha, mensagem: str):
+        super().__init__(f'Linha {linha}: {mensagem}')
+        self.linha = linha
+
+
+def converter_data(texto: str) -> datetime:
+    """
+    Converte datas de extrato para datetime
+
+    Aceita o formato OFX (AAAAMMDD[HHMMSS[.XXX]][fuso]), ISO 8601 e os
+    formatos brasileiros mais comuns (dd/mm/aaaa, dd/mm/aa).
+    """
+    texto = texto.strip()
+    if texto[:8].isdigit():
+        digitos = re.match(r'\d+', texto).group()
+        if len(digitos) >= 14:
+            return datetime.strptime(digitos[:14], '%Y%m%d%H%M%S')
+        return datetime.strptime(digitos[:8], '%Y%m%d')
+    try:
+        return datetime.fromisoformat(texto)
+    except ValueError:
+        pass
+    for formato in FORMATOS_DATA:
+        try:
+            return datetime.strptime(texto, formato)
+        except ValueError:
+            continue
+    raise ValueError(f'data inválida: {texto!r}')
+
+
+def converter_valor(texto: str) -> Decimal:
+    """
+    Converte valores monetários para Decimal
+
+    Trata "R$", separador de milhar ('.' ou ','), vírgula decimal e valores
+    negativos com sinal ou entre parênteses. Quando os dois separadores
+    aparecem, o último é o decimal.
+    """
+    limpo = _PADRAO_VALOR.sub('', texto)
+    negativo = limpo.startswith('-') or limpo.endswith('-') or limpo.startswith('(')
+    limpo = limpo.strip('-()')
+    if ',' in limpo and '.' in limpo:
+        decimal = ',' if limpo.rfind(',') > limpo.rfind('.') else '.'
+        milhar = '.' if decimal == ',' else ','
+        limpo = limpo.replace(milhar, '').replace(decimal, '.')
+    else:
+        limpo = limpo.replace(',', '.')
+    try:
+        valor = Decimal(limpo)
+    except InvalidOperation:
+        raise ValueError(f'valor inválido: {texto!r}')
+    return -valor if negativo else valor
+
+
+def normalizar_lancamento(registro: Dict[str, str]) -> dict:
+    """
+    Converte os campos brutos de um lançamento para o formato das transações
+
+    O tipo vem da coluna de tipo quando ela indica crédito/débito e, caso
+    contrário, do sinal do valor; o valor armazenado é sempre positivo.
+
+    Raises:
+        LinhaInvalidaError: Se data ou valor estiverem ausentes ou inválidos
+    """
+    linha = registro.get('linha')
+    if not registro.get('data') or not registro.get('valor'):
+        raise LinhaInvalidaError(linha, 'data e valor são obrigatórios')
+    try:
+        data = converter_data(registro['data'])
+        valor = converter_valor(registro['valor'])
+    except ValueError as e:
+        raise LinhaInvalidaError(linha, str(e))
+
+    indicador = normalizar_texto(registro.get('tipo', ''))
+    if indicador in TIPOS_RECEITA:
+        tipo = 'receita'
+    elif indicador in TIPOS_DESPESA:
+        tipo = 'despesa'
+    else:
+        tipo = 'receita' if valor > 0 else 'despesa'
+
+    descricao = ' '.join((registro.get('descricao') or registro.get('memo') or 'Sem descrição').split())
+    observacoes = registro.get('observacoes', '')
+    if registro.get('memo') and registro.get('descricao') and registro['memo'] != registro['descricao']:
+        observacoes = observacoes or registro['memo']
+
+    return {
+        'descricao': descricao[:200],
+        'valor': float(abs(valor)),
+        'tipo': tipo,
+        'data_transacao': data.isoformat(),
+        'categoria': registro.get('categoria', ''),
+        'id_externo': registro.get('id_externo') or None,
+        'observacoes': observacoes,
+        'linha': linha,
+    }
+
+
+def normalizar(registros: Iterable[Dict[str, str]], resultado: dict) -> Iterator[dict]:
+    """
+    Normaliza os lançamentos, contando os inválidos no resultado da importação
+
+    Args:
+        registros: Lançamentos brutos dos leitores
+        resultado (dict): Resultado da importação; recebe 'invalidas' e as
+                          mensagens em 'erros' (até MAX_ERROS)
+
+    Yields:
+        dict: Lançamentos normalizados
+    """
+    for registro in registros:
+        try:
+            yield normalizar_lancamento(registro)
+        except LinhaInvalidaError as e:
+            resultado['invalidas'] += 1
+            if len(resultado['erros']) < MAX_ERROS:
+                resultado['erros'].append(str(e))
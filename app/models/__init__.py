@@ -1,14 +1,8 @@
 # Modelos da aplicação
 from .base_model import BaseModel
 from .usuario import Usuario
-from .categoria import Categoria, CATEGORIAS_PADRAO
-from .despesa import Despesa, TipoDespesa
-from .dicas import Dica, CategoriaDica, DICAS_PADRAO
 
 __all__ = [
     'BaseModel',
-    'Usuario', 
-    'Categoria', 'CATEGORIAS_PADRAO',
-    'Despesa', 'TipoDespesa',
-    'Dica', 'CategoriaDica', 'DICAS_PADRAO'
+    'Usuario'
 ]
@@ -1,15 +1,19 @@
 from datetime import datetime, timezone
 from flask_sqlalchemy import SQLAlchemy
 from app import db
+from app.utils.serializacao import SerializadorModelo
 
 class BaseModel(db.Model):
     """Classe base para todos os modelos"""
     
     __abstract__ = True
     
+    # Colunas omitidas de to_dict/to_dicts (ex.: senha_hash)
+    __campos_ocultos__ = ()
+    
     id = db.Column(db.Integer, primary_key=True)
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
-    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False, index=True)
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False, index=True)
     
     def save(self):
         """Salva o modelo no banco de dados"""
@@ -31,12 +35,34 @@ class BaseModel(db.Model):
         db.session.commit()
         return self
     
-    def to_dict(self):
-        """Converte o modelo para dicionário"""
-        return {
-            column.name: getattr(self, column.name)
-            for column in self.__table__.columns
-        }
+    @classmethod
+    def serializador(cls):
+        """Retorna o SerializadorModelo do modelo, criado no primeiro uso"""
+        serializador = cls.__dict__.get('_serializador')
+        if serializador is None:
+            serializador = SerializadorModelo(cls, excluir=cls.__campos_ocultos__)
+            cls._serializador = serializador
+        return serializador
+    
+    def to_dict(self, datas_iso=False):
+        """Converte o modelo para dicionário (datas como datetime/date, ou ISO 8601 com datas_iso=True)"""
+        return type(self).serializador().serializar(self, datas_iso)
+    
+    @classmethod
+    def to_dicts(cls, rows, datas_iso=False):
+        """
+        Converte vários registros para dicionários
+        
+        Args:
+            rows: Instâncias do modelo ou tuplas na ordem de
+                  cls.serializador().colunas (ex.: de db.session.query(*colunas)),
+                  que dispensam a criação de instâncias do ORM
+            datas_iso (bool): Converte as datas para texto ISO 8601
+        
+        Returns:
+            List[Dict]: Um dicionário por registro
+        """
+        return cls.serializador().serializar_muitos(rows, datas_iso)
     
     def __repr__(self):
         return f'<{self.__class__.__name__} {self.id}>'
@@ -16,12 +16,24 @@ class CaretakerUsuario:
         """
         Inicializa o caretaker
         
+        O histórico é um buffer circular de capacidade fixa: salvar, desfazer,
+        refazer e remover o memento mais antigo são operações O(1), sem cópias
+        de lista. Os estados futuros descartados têm suas posições limpas, para
+        que os mementos possam ser coletados.
+        
         Args:
             max_historico (int): Número máximo de mementos no histórico
+        
+        Raises:
+            ValueError: Se max_historico for menor que 1
         """
-        self._historico: List[UsuarioMemento] = []
-        self._indice_atual: int = -1
+        if max_historico < 1:
+            raise ValueError(f'max_historico deve ser pelo menos 1, recebido {max_historico}')
         self._max_historico: int = max_historico
+        self._buffer: List[Optional[UsuarioMemento]] = [None] * max_historico
+        self._inicio: int = 0       # Posição física do memento mais antigo
+        self._tamanho: int = 0      # Quantidade de mementos válidos
+        self._indice_atual: int = -1
     
     def salvar_estado(self, usuario) -> None:
         """
@@ -30,18 +42,22 @@ class CaretakerUsuario:
         Args:
             usuario: Instância do usuário para salvar o estado
         """
-        memento = usuario.criar_memento()
+        memento = usuario.criar_memento(anterior=self.obter_memento_atual())
         
-        # Se estamos no meio do histórico (após undo), remove estados futuros
-        if self._indice_atual < len(self._historico) - 1:
-            self._historico = self._historico[:self._indice_atual + 1]
+        # Se estamos no meio do histórico (após undo), descarta os estados futuros
+        for indice in range(self._indice_atual + 1, self._tamanho):
+            self._buffer[self._posicao(indice)] = None
+        self._tamanho = self._indice_atual + 1
         
-        # Adiciona o novo memento
-        self._historico.append(memento)
-        self._indice_atual += 1
+        if self._tamanho < self._max_historico:
+            self._buffer[self._posicao(self._tamanho)] = memento
+            self._tamanho += 1
+        else:
+            # Histórico cheio: o novo memento ocupa a posição do mais antigo
+            self._buffer[self._inicio] = memento
+            self._inicio = (self._inicio + 1) % self._max_historico
         
-        # Limita o tamanho do histórico
-        self._limitar_historico()
+        self._indice_atual = self._tamanho - 1
     
     def desfazer(self, usuario) -> bool:
         """
@@ -57,8 +73,7 @@ class CaretakerUsuario:
             return False
         
         self._indice_atual -= 1
-        memento = self._historico[self._indice_atual]
-        usuario.restaurar_memento(memento)
+        usuario.restaurar_memento(self._obter(self._indice_atual))
         return True
     
     def refazer(self, usuario) -> bool:
@@ -75,52 +90,66 @@ class CaretakerUsuario:
             return False
         
         self._indice_atual += 1
-        memento = self._historico[self._indice_atual]
-        usuario.restaurar_memento(memento)
+        usuario.restaurar_memento(self._obter(self._indice_atual))
         return True
     
-    def obter_historico(self) -> List[UsuarioMemento]:
+    def obter_historico(self, usuario_id: Optional[int] = None) -> List[UsuarioMemento]:
         """
         Retorna o histórico de alterações
         
+        Args:
+            usuario_id (int): Aceito pela mesma assinatura do CaretakerUsuarioPersistente;
+                              este caretaker guarda o histórico de um único usuário
+        
         Returns:
-            List[UsuarioMemento]: Lista com todos os mementos do histórico
+            List[UsuarioMemento]: Lista com todos os mementos do histórico, do mais antigo ao mais recente
         """
-        return self._historico.copy()
+        return [self._obter(indice) for indice in range(self._tamanho)]
     
-    def obter_memento_atual(self) -> Optional[UsuarioMemento]:
+    def obter_memento_atual(self, usuario_id: Optional[int] = None) -> Optional[UsuarioMemento]:
         """
         Retorna o memento atual (onde estamos no histórico)
         
+        Args:
+            usuario_id (int): Ignorado (ver obter_historico)
+        
         Returns:
             UsuarioMemento: Memento atual ou None se histórico vazio
         """
-        if self._indice_atual >= 0 and self._indice_atual < len(self._historico):
-            return self._historico[self._indice_atual]
+        if 0 <= self._indice_atual < self._tamanho:
+            return self._obter(self._indice_atual)
         return None
     
-    def limpar_historico(self) -> None:
-        """Limpa todo o histórico"""
-        self._historico.clear()
+    def limpar_historico(self, usuario_id: Optional[int] = None) -> None:
+        """Limpa todo o histórico (usuario_id é ignorado, ver obter_historico)"""
+        self._buffer = [None] * self._max_historico
+        self._inicio = 0
+        self._tamanho = 0
         self._indice_atual = -1
     
-    def pode_desfazer(self) -> bool:
+    def pode_desfazer(self, usuario_id: Optional[int] = None) -> bool:
         """
         Verifica se é possível desfazer
         
+        Args:
+            usuario_id (int): Ignorado (ver obter_historico)
+        
         Returns:
             bool: True se pode desfazer, False caso contrário
         """
         return self._indice_atual > 0
     
-    def pode_refazer(self) -> bool:
+    def pode_refazer(self, usuario_id: Optional[int] = None) -> bool:
         """
         Verifica se é possível refazer
         
+        Args:
+            usuario_id (int): Ignorado (ver obter_historico)
+        
         Returns:
             bool: True se pode refazer, False caso contrário
         """
-        return self._indice_atual < len(self._historico) - 1
+        return self._indice_atual < self._tamanho - 1
     
     def obter_tamanho_historico(self) -> int:
         """
@@ -129,7 +158,7 @@ class CaretakerUsuario:
         Returns:
             int: Número de mementos no histórico
         """
-        return len(self._historico)
+        return self._tamanho
     
     def obter_indice_atual(self) -> int:
         """
@@ -151,24 +180,18 @@ class CaretakerUsuario:
         Returns:
             bool: True se conseguiu navegar, False caso contrário
         """
-        if 0 <= indice < len(self._historico):
+        if 0 <= indice < self._tamanho:
             self._indice_atual = indice
-            memento = self._historico[self._indice_atual]
-            usuario.restaurar_memento(memento)
+            usuario.restaurar_memento(self._obter(indice))
             return True
         return False
     
-    def _limitar_historico(self) -> None:
-        """Limita o histórico ao tamanho máximo configurado"""
-        if len(self._historico) > self._max_historico:
-            # Remove os mementos mais antigos
-            excesso = len(self._historico) - self._max_historico
-            self._historico = self._historico[excesso:]
-            self._indice_atual -= excesso
-            
-            # Garante que o índice não fique negativo
-            if self._indice_atual < 0:
-                self._indice_atual = 0
+    def _posicao(self, indice: int) -> int:
+        """Converte um índice lógico (0 = mais antigo) na posição do buffer"""
+        return (self._inicio + indice) % self._max_historico
+    
+    def _obter(self, indice: int) -> UsuarioMemento:
+        return self._buffer[self._posicao(indice)]
     
     def obter_estatisticas(self) -> dict:
         """
@@ -178,19 +201,19 @@ class CaretakerUsuario:
             dict: Dicionário com estatísticas do caretaker
         """
         return {
-            'total_mementos': len(self._historico),
+            'total_mementos': self._tamanho,
             'indice_atual': self._indice_atual,
             'pode_desfazer': self.pode_desfazer(),
             'pode_refazer': self.pode_refazer(),
             'max_historico': self._max_historico,
-            'primeiro_memento': self._historico[0].timestamp if self._historico else None,
-            'ultimo_memento': self._historico[-1].timestamp if self._historico else None,
+            'primeiro_memento': self._obter(0).timestamp if self._tamanho else None,
+            'ultimo_memento': self._obter(self._tamanho - 1).timestamp if self._tamanho else None,
             'memento_atual': self.obter_memento_atual().timestamp if self.obter_memento_atual() else None
         }
     
     def __str__(self) -> str:
         """Representação string do caretaker"""
-        return f"CaretakerUsuario(historico={len(self._historico)}, atual={self._indice_atual})"
+        return f"CaretakerUsuario(historico={self._tamanho}, atual={self._indice_atual})"
     
     def __repr__(self) -> str:
         """Representação para debug"""
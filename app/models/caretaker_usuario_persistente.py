@@ -0,0 +1,95 @@
+from typing import List, Optional
+from app.models.usuario_memento import UsuarioMemento
+
+
+class CaretakerUsuarioPersistente:
+    """
+    Caretaker com o histórico de mementos persistido em banco
+    
+    Mesmas operações do CaretakerUsuario, mas o histórico de cada usuário
+    fica no HistoricoUsuarioRepository em vez da memória do processo, então
+    é compartilhado entre requisições e workers. Um único caretaker atende
+    todos os usuários (as operações recebem o usuário ou seu ID).
+    
+    Assim como no CaretakerUsuario, os mementos do histórico reaproveitam os
+    valores que não mudaram em relação ao anterior: o histórico lido do
+    banco é reconstruído em ordem com UsuarioMemento.encadear. No banco cada
+    estado é gravado completo, já que a retenção remove os mais antigos.
+    """
+    
+    def __init__(self, repositorio, max_historico: int = 50):
+        """
+        Inicializa o caretaker
+        
+        Args:
+            repositorio (HistoricoUsuarioRepository): Armazenamento do histórico
+            max_historico (int): Número máximo de mementos mantidos por usuário
+        
+        Raises:
+            ValueError: Se max_historico for menor que 1
+        """
+        if max_historico < 1:
+            raise ValueError(f'max_historico deve ser pelo menos 1, recebido {max_historico}')
+        self._repositorio = repositorio
+        self._max_historico = max_historico
+    
+    def salvar_estado(self, usuario) -> None:
+        """
+        Salva o estado atual do usuário
+        
+        Args:
+            usuario: Instância do usuário para salvar o estado
+        """
+        memento = usuario.criar_memento()
+        self._repositorio.anexar(usuario.id, memento.to_dict(), self._max_historico)
+    
+    def desfazer(self, usuario) -> bool:
+        """
+        Desfaz a última alteração (undo)
+        
+        Returns:
+            bool: True se conseguiu desfazer, False caso contrário
+        """
+        return self._restaurar(usuario, self._repositorio.mover(usuario.id, -1))
+    
+    def refazer(self, usuario) -> bool:
+        """
+        Refaz uma alteração desfeita (redo)
+        
+        Returns:
+            bool: True se conseguiu refazer, False caso contrário
+        """
+        return self._restaurar(usuario, self._repositorio.mover(usuario.id, 1))
+    
+    def obter_historico(self, usuario_id: int) -> List[UsuarioMemento]:
+        """Retorna os mementos do usuário, do mais antigo ao mais recente"""
+        return UsuarioMemento.encadear(self._repositorio.listar(usuario_id))
+    
+    def obter_memento_atual(self, usuario_id: int) -> Optional[UsuarioMemento]:
+        """Retorna o memento na posição atual do histórico do usuário"""
+        estado = self._repositorio.obter_atual(usuario_id)
+        return UsuarioMemento(**estado) if estado else None
+    
+    def limpar_historico(self, usuario_id: int) -> None:
+        """Limpa todo o histórico do usuário"""
+        self._repositorio.limpar(usuario_id)
+    
+    def pode_desfazer(self, usuario_id: int) -> bool:
+        """Verifica se existe estado anterior ao atual"""
+        anteriores, _ = self._repositorio.contar_vizinhos(usuario_id)
+        return anteriores > 0
+    
+    def pode_refazer(self, usuario_id: int) -> bool:
+        """Verifica se existe estado desfeito que pode ser refeito"""
+        _, posteriores = self._repositorio.contar_vizinhos(usuario_id)
+        return posteriores > 0
+    
+    @staticmethod
+    def _restaurar(usuario, estado: Optional[dict]) -> bool:
+        if estado is None:
+            return False
+        usuario.restaurar_memento(UsuarioMemento(**estado))
+        return True
+    
+    def __repr__(self) -> str:
+        return f"CaretakerUsuarioPersistente(max_historico={self._max_historico})"
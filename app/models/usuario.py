@@ -8,6 +8,12 @@ class Usuario(BaseModel):
     """Modelo de usuário com padrão Memento para histórico de alterações"""
     
     __tablename__ = 'usuarios'
+    __table_args__ = (
+        # buscar_ativos/buscar_inativos: WHERE ativo = ? ORDER BY id
+        db.Index('ix_usuarios_ativo_id', 'ativo', 'id'),
+    )
+    # A senha nunca sai em to_dict/to_dicts
+    __campos_ocultos__ = ('senha_hash',)
     
     nome = db.Column(db.String(100), nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
@@ -35,8 +41,13 @@ class Usuario(BaseModel):
         return check_password_hash(self.senha_hash, senha)
     
     # Métodos para o padrão Memento
-    def criar_memento(self):
-        """Cria um memento com o estado atual do usuário"""
+    def criar_memento(self, anterior=None):
+        """
+        Cria um memento com o estado atual do usuário
+        
+        Args:
+            anterior (UsuarioMemento): Último memento salvo, para compartilhar valores iguais
+        """
         # Import local para evitar dependência circular
         from app.models.usuario_memento import UsuarioMemento
         
@@ -47,7 +58,8 @@ class Usuario(BaseModel):
             telefone=self.telefone,
             endereco=self.endereco,
             ativo=self.ativo,
-            timestamp=datetime.now()
+            timestamp=datetime.now(),
+            anterior=anterior
         )
     
     def restaurar_memento(self, memento):
@@ -66,10 +78,3 @@ class Usuario(BaseModel):
         
         # Atualiza o timestamp de modificação
         self.updated_at = datetime.now()
-    
-    def to_dict(self):
-        """Converte o modelo para dicionário (sem a senha)"""
-        data = super().to_dict()
-        data.pop('senha_hash', None)
-        return data
-
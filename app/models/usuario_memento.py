@@ -2,13 +2,25 @@ from datetime import datetime
 
 
 class UsuarioMemento:
-    """Memento que armazena o estado do usuário em um momento específico"""
-    
-    def __init__(self, nome, email, data_nascimento=None, telefone=None, 
-                 endereco=None, ativo=True, timestamp=None):
+    """
+    Memento que armazena o estado do usuário em um momento específico
+
+    Representação compacta: sem __dict__ (apenas dois slots) e com os campos
+    guardados em uma única tupla. Quando o memento é criado a partir do
+    anterior, os valores que não mudaram reaproveitam os mesmos objetos
+    (e, se nada mudou, a mesma tupla), de modo que um histórico com o mesmo
+    endereço em 50 mementos guarda a string apenas uma vez.
+    """
+
+    __slots__ = ('_valores', '_timestamp')
+
+    CAMPOS = ('nome', 'email', 'data_nascimento', 'telefone', 'endereco', 'ativo')
+
+    def __init__(self, nome, email, data_nascimento=None, telefone=None,
+                 endereco=None, ativo=True, timestamp=None, anterior=None):
         """
         Inicializa um memento com o estado do usuário
-        
+
         Args:
             nome (str): Nome do usuário
             email (str): Email do usuário
@@ -17,67 +29,89 @@ class UsuarioMemento:
             endereco (str): Endereço do usuário
             ativo (bool): Status ativo/inativo
             timestamp (datetime): Momento da criação do memento
+            anterior (UsuarioMemento): Memento anterior, cujos valores iguais são reaproveitados
         """
-        self._nome = nome
-        self._email = email
-        self._data_nascimento = data_nascimento
-        self._telefone = telefone
-        self._endereco = endereco
-        self._ativo = ativo
+        valores = (nome, email, data_nascimento, telefone, endereco, ativo)
+        if anterior is not None:
+            valores = self._compartilhar(valores, anterior._valores)
+        self._valores = valores
         self._timestamp = timestamp or datetime.now()
-    
+
+    @classmethod
+    def encadear(cls, estados):
+        """
+        Cria mementos a partir de estados em ordem (ex.: lidos do banco),
+        cada um compartilhando com o anterior os valores que não mudaram
+
+        Args:
+            estados (Iterable[dict]): Campos de to_dict(), do mais antigo ao mais recente
+
+        Returns:
+            List[UsuarioMemento]: Mementos na mesma ordem
+        """
+        mementos = []
+        anterior = None
+        for estado in estados:
+            anterior = cls(**estado, anterior=anterior)
+            mementos.append(anterior)
+        return mementos
+
+    @staticmethod
+    def _compartilhar(valores, anteriores):
+        """Substitui valores iguais aos do memento anterior pelos mesmos objetos"""
+        if valores == anteriores:
+            return anteriores
+        return tuple(
+            anterior if valor == anterior else valor
+            for valor, anterior in zip(valores, anteriores)
+        )
+
     # Getters para acessar o estado armazenado (somente leitura)
     @property
     def nome(self):
         """Retorna o nome armazenado no memento"""
-        return self._nome
-    
+        return self._valores[0]
+
     @property
     def email(self):
         """Retorna o email armazenado no memento"""
-        return self._email
-    
+        return self._valores[1]
+
     @property
     def data_nascimento(self):
         """Retorna a data de nascimento armazenada no memento"""
-        return self._data_nascimento
-    
+        return self._valores[2]
+
     @property
     def telefone(self):
         """Retorna o telefone armazenado no memento"""
-        return self._telefone
-    
+        return self._valores[3]
+
     @property
     def endereco(self):
         """Retorna o endereço armazenado no memento"""
-        return self._endereco
-    
+        return self._valores[4]
+
     @property
     def ativo(self):
         """Retorna o status ativo armazenado no memento"""
-        return self._ativo
-    
+        return self._valores[5]
+
     @property
     def timestamp(self):
         """Retorna o timestamp de criação do memento"""
         return self._timestamp
-    
+
     def to_dict(self):
         """Converte o memento para dicionário"""
-        return {
-            'nome': self._nome,
-            'email': self._email,
-            'data_nascimento': self._data_nascimento,
-            'telefone': self._telefone,
-            'endereco': self._endereco,
-            'ativo': self._ativo,
-            'timestamp': self._timestamp
-        }
-    
+        dados = dict(zip(self.CAMPOS, self._valores))
+        dados['timestamp'] = self._timestamp
+        return dados
+
     def __str__(self):
         """Representação string do memento"""
-        return f"UsuarioMemento({self._nome}, {self._email}, {self._timestamp.strftime('%Y-%m-%d %H:%M:%S')})"
-    
+        return f"UsuarioMemento({self.nome}, {self.email}, {self._timestamp.strftime('%Y-%m-%d %H:%M:%S')})"
+
     def __repr__(self):
         """Representação para debug"""
-        return self.__str__()
\ No newline at end of file
+        return self.__str__()
@@ -1,14 +1,10 @@
 # Repositórios da aplicação
 from .base_repository import BaseRepository
 from .usuario_repository import UsuarioRepository
-from .categoria_repository import CategoriaRepository
-from .despesas_repository import DespesaRepository
-from .dicas_repository import DicaRepository
+from .historico_usuario_repository import HistoricoUsuarioRepository
 
 __all__ = [
     'BaseRepository',
     'UsuarioRepository',
-    'CategoriaRepository', 
-    'DespesaRepository',
-    'DicaRepository'
+    'HistoricoUsuarioRepository'
 ]
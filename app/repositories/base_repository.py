@@ -1,13 +1,81 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Dict, Sequence
+from flask import g, has_app_context
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, func, inspect, insert, select, tuple_, update
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
 from app import db
+from app.utils.banco import SessaoRoteada, em_replica
+from app.utils.cache import AUSENTE, CacheMemoria, CacheRedis, CacheSqlite
+from app.utils.paginacao import codificar_cursor, decodificar_cursor, CursorInvalidoError
 
 class BaseRepository(ABC):
-    """Classe base para todos os repositórios"""
+    """
+    Classe base para todos os repositórios
+    
+    Leituras por ID e por campo passam por dois níveis de cache:
+    - o mapa de identidade da sessão (escopo da requisição), que devolve a
+      mesma instância sem nova consulta;
+    - o cache de segundo nível `cache`, que guarda os valores das colunas.
+      Fica desligado (None) até configurar_cache escolher um backend.
+    
+    A invalidação acontece nos eventos da sessão, então vale para qualquer
+    escrita do ORM confirmada pelo commit: métodos do repositório,
+    BaseModel.save/update/delete e alterações diretas na sessão. Escritas
+    feitas por SQL direto ou por outra aplicação só aparecem quando a entrada
+    expira (REPOSITORIO_CACHE_TTL).
+    
+    Os métodos de leitura (@em_replica) consultam a réplica de leitura quando
+    SQLALCHEMY_BINDS['leitura'] está configurado; escritas e leituras logo
+    após uma escrita usam o primário (ver app.utils.banco.SessaoRoteada).
+    """
+    
+    # Cache de segundo nível compartilhado pelos repositórios (None = desligado)
+    cache = None
+    # Segundos até uma contagem de fast_count ser refeita no banco
+    count_ttl = 60
+    # Bancos com INSERT ... ON CONFLICT DO UPDATE (os demais usam o upsert linha a linha)
+    NATIVE_UPSERT_DIALECTS = ('sqlite', 'postgresql')
+    
+    # Por tabela, compartilhados entre as instâncias de repositório do mesmo modelo
+    _cached_fields_by_table: Dict[str, set] = {}
+    _count_filters_by_table: Dict[str, set] = {}
     
     def __init__(self, model):
         self.model = model
+        # Campos já consultados por get_by_field, cujas chaves são invalidadas nas escritas
+        self._cached_fields = self._cached_fields_by_table.setdefault(model.__tablename__, set())
+        # Conjuntos de filtros já usados em fast_count, cujos contadores as escritas ajustam
+        self._count_filters = self._count_filters_by_table.setdefault(model.__tablename__, {()})
+    
+    @classmethod
+    def configurar_cache(cls, config) -> None:
+        """
+        Escolhe o cache de segundo nível a partir da configuração da aplicação
+        
+        REPOSITORIO_CACHE_BACKEND: '' (padrão, desligado), 'memoria' (por
+        processo: só é consistente com um único worker, pois a invalidação
+        não chega aos outros processos), 'sqlite' (arquivo em
+        REPOSITORIO_CACHE_URL, compartilhado pelos processos da máquina) ou
+        'redis' (URL em REPOSITORIO_CACHE_URL, compartilhado entre máquinas);
+        REPOSITORIO_CACHE_TTL e REPOSITORIO_CACHE_MAX_ITENS definem validade
+        e tamanho.
+        """
+        tipo = config.get('REPOSITORIO_CACHE_BACKEND', '')
+        ttl = config.get('REPOSITORIO_CACHE_TTL', 300)
+        max_itens = config.get('REPOSITORIO_CACHE_MAX_ITENS', 10000)
+        if not tipo:
+            BaseRepository.cache = None
+        elif tipo == 'memoria':
+            BaseRepository.cache = CacheMemoria(max_itens=max_itens, ttl=ttl)
+        elif tipo == 'sqlite':
+            BaseRepository.cache = CacheSqlite(config['REPOSITORIO_CACHE_URL'], max_itens=max_itens, ttl=ttl)
+        elif tipo == 'redis':
+            BaseRepository.cache = CacheRedis(config['REPOSITORIO_CACHE_URL'], ttl=ttl)
+        else:
+            raise ValueError(f'Backend de cache dos repositórios desconhecido: {tipo}')
     
     def create(self, **kwargs) -> Any:
         """Cria um novo registro"""
@@ -20,10 +88,27 @@ class BaseRepository(ABC):
             db.session.rollback()
             raise e
     
+    @em_replica
     def get_by_id(self, id: int) -> Optional[Any]:
-        """Busca um registro pelo ID"""
-        return self.model.query.get(id)
+        """Busca um registro pelo ID (mapa de identidade -> cache -> banco)"""
+        if self.cache is None:
+            return db.session.get(self.model, id)
+        
+        instance = db.session.identity_map.get(identity_key(self.model, id))
+        if instance is not None:
+            return instance
+        
+        key = self._id_key(id)
+        values = self.cache.obter(key)
+        if values is not AUSENTE:
+            return self._from_cache(values)
+        
+        instance = db.session.get(self.model, id)
+        if instance is not None:
+            self.cache.definir(key, self._to_cache(instance))
+        return instance
     
+    @em_replica
     def get_all(self, page: int = None, per_page: int = None) -> List[Any]:
         """Retorna todos os registros com paginação opcional"""
         query = self.model.query
@@ -31,6 +116,19 @@ class BaseRepository(ABC):
             return query.paginate(page=page, per_page=per_page, error_out=False).items
         return query.all()
     
+    @em_replica
+    def get_dicts(self, datas_iso: bool = False, **filters) -> List[Dict[str, Any]]:
+        """
+        Retorna os registros já serializados (model.to_dicts), em ordem de id
+        
+        Seleciona apenas as colunas do serializador e converte as tuplas
+        diretamente, sem criar instâncias do ORM; indicado para listagens
+        JSON grandes (datas_iso=True já entrega as datas em ISO 8601).
+        """
+        serializador = self.model.serializador()
+        query = db.session.query(*serializador.colunas).filter_by(**filters)
+        return serializador.serializar_linhas(query.order_by(self.model.id).all(), datas_iso)
+    
     def update(self, instance: Any, **kwargs) -> Any:
         """Atualiza um registro"""
         try:
@@ -60,28 +158,147 @@ class BaseRepository(ABC):
             return self.delete(instance)
         return False
     
+    @em_replica
     def get_by_field(self, field: str, value: Any) -> Optional[Any]:
-        """Busca um registro por um campo específico"""
-        return self.model.query.filter(getattr(self.model, field) == value).first()
+        """
+        Busca um registro por um campo específico
+        
+        O cache guarda apenas campo/valor -> ID; a instância vem de get_by_id e
+        só é devolvida se o campo ainda tiver o valor buscado.
+        """
+        if self.cache is None:
+            return self.model.query.filter(getattr(self.model, field) == value).first()
+        
+        self._cached_fields.add(field)
+        key = self._field_key(field, value)
+        request_map = self._request_map()
+        id = request_map.get(key)
+        if id is None:
+            id = self.cache.obter(key, None)
+        if id is not None:
+            instance = self.get_by_id(id)
+            if instance is not None and getattr(instance, field) == value:
+                request_map[key] = id
+                return instance
+        
+        instance = self.model.query.filter(getattr(self.model, field) == value).first()
+        if instance is not None:
+            request_map[key] = instance.id
+            self.cache.definir(key, instance.id)
+            self.cache.definir(self._id_key(instance.id), self._to_cache(instance))
+        return instance
     
+    @em_replica
     def filter_by(self, **kwargs) -> List[Any]:
         """Filtra registros por campos específicos"""
         return self.model.query.filter_by(**kwargs).all()
     
+    @em_replica
     def count(self) -> int:
-        """Retorna a contagem total de registros"""
+        """Retorna a contagem total de registros (COUNT(*) exato)"""
         return self.model.query.count()
     
+    @em_replica
+    def fast_count(self, **filters) -> int:
+        """
+        Contagem mantida em cache, para paginação e totais exibidos
+        
+        O COUNT(*) só é executado quando o contador não está no cache; depois
+        disso as escritas do ORM confirmadas somam ou subtraem 1 dos
+        contadores afetados (total da tabela e, por exemplo, usuario_id=X).
+        Escritas por SQL direto só aparecem após count_ttl segundos, por isso
+        a contagem é aproximada.
+        
+        Args:
+            **filters: Filtros de igualdade (ex.: usuario_id=1)
+        
+        Returns:
+            int: Quantidade de registros
+        """
+        if self.cache is None:
+            return self._exact_count(filters)
+        
+        self._count_filters.add(tuple(sorted(filters)))
+        key = self._count_key(filters)
+        total = self.cache.obter(key)
+        if total is AUSENTE:
+            total = self._exact_count(filters)
+            self.cache.definir(key, total, ttl=self.count_ttl)
+        return total
+    
+    @em_replica
     def exists(self, **kwargs) -> bool:
-        """Verifica se existe um registro com os critérios especificados"""
-        return self.model.query.filter_by(**kwargs).first() is not None
+        """Verifica se existe um registro com os critérios especificados (SELECT EXISTS, sem carregar a linha)"""
+        return db.session.query(self.model.query.filter_by(**kwargs).exists()).scalar()
+    
+    @em_replica
+    def get_paginated(self, page: int = 1, per_page: int = 10, count: bool = True, **filters):
+        """
+        Retorna registros paginados com filtros opcionais
+        
+        O total vem de fast_count; count=False não calcula o total.
+        """
+        query = self.model.query
+        if filters:
+            query = query.filter_by(**filters)
+        pagination = query.paginate(page=page, per_page=per_page, error_out=False, count=False)
+        if count:
+            pagination.total = self.fast_count(**filters)
+        return pagination
     
-    def get_paginated(self, page: int = 1, per_page: int = 10, **filters):
-        """Retorna registros paginados com filtros opcionais"""
+    @em_replica
+    def get_keyset_paginated(self, cursor: Optional[str] = None, per_page: int = 10,
+                             order_by: Sequence[str] = ('created_at', 'id'), descending: bool = True,
+                             with_count: bool = False, **filters) -> Dict[str, Any]:
+        """
+        Retorna uma página usando paginação por chave (keyset/cursor)
+        
+        Em vez de OFFSET, filtra pelas colunas de ordenação a partir da última
+        linha da página anterior (WHERE (created_at, id) < (:c, :i)), então o
+        custo de uma página não depende de quão fundo ela está. As colunas de
+        ordenação devem formar uma chave única e ter índice.
+        
+        Args:
+            cursor: Cursor opaco retornado na página anterior (None para a primeira)
+            per_page: Quantidade de registros por página
+            order_by: Colunas de ordenação; a última deve desempatar (ex.: id)
+            descending: Ordem decrescente (mais recentes primeiro)
+            with_count: Se True, também retorna o total (fast_count)
+            **filters: Filtros de igualdade (filter_by)
+        
+        Returns:
+            Dict: items, next_cursor (None na última página), has_next e total (ou None)
+        """
+        columns = [getattr(self.model, name) for name in order_by]
         query = self.model.query
         if filters:
             query = query.filter_by(**filters)
-        return query.paginate(page=page, per_page=per_page, error_out=False)
+        
+        total = self.fast_count(**filters) if with_count else None
+        
+        if cursor:
+            values = decodificar_cursor(cursor)
+            if len(values) != len(columns):
+                raise CursorInvalidoError('Cursor de paginação inválido')
+            key = tuple_(*columns)
+            query = query.filter(key < tuple_(*values) if descending else key > tuple_(*values))
+        
+        query = query.order_by(*[column.desc() if descending else column.asc() for column in columns])
+        
+        # Busca uma linha extra só para saber se existe próxima página
+        rows = query.limit(per_page + 1).all()
+        has_next = len(rows) > per_page
+        items = rows[:per_page]
+        next_cursor = None
+        if has_next:
+            next_cursor = codificar_cursor([getattr(items[-1], name) for name in order_by])
+        
+        return {
+            'items': items,
+            'next_cursor': next_cursor,
+            'has_next': has_next,
+            'total': total
+        }
     
     def bulk_create(self, data_list: List[Dict]) -> List[Any]:
         """Cria múltiplos registros em uma única transação"""
@@ -93,3 +310,275 @@ class BaseRepository(ABC):
         except Exception as e:
             db.session.rollback()
             raise e
+    
+    def bulk_insert(self, data_list, batch_size: int = 1000, upsert: bool = False,
+                    conflict_columns: Sequence[str] = ('id',), update_columns: Sequence[str] = None,
+                    returning: bool = False, commit_per_batch: bool = False) -> List[Any]:
+        """
+        Insere registros em lote sem criar instâncias do ORM
+        
+        Usa insert() do SQLAlchemy Core com executemany por lote, evitando o
+        unit-of-work por objeto do add_all. Defaults das colunas (ex.:
+        created_at) continuam sendo aplicados pelo Core.
+        
+        Por padrão todos os lotes formam uma única transação: se um lote
+        falhar, nada é gravado. Com commit_per_batch=True cada lote é
+        confirmado separadamente (menos tempo segurando a trava de escrita),
+        e uma falha deixa gravados os lotes anteriores.
+        
+        Args:
+            data_list: Iterável de dicionários (pode ser um gerador)
+            batch_size: Quantidade de linhas por executemany
+            upsert: Se True, atualiza a linha existente em caso de conflito
+                    (ON CONFLICT no SQLite e PostgreSQL; nos demais bancos,
+                    UPDATE seguido de INSERT linha a linha)
+            conflict_columns: Colunas da restrição única usada no upsert
+            update_columns: Colunas atualizadas no upsert (padrão: todas as
+                            informadas, exceto as de conflito)
+            returning: Se True, retorna os IDs na ordem de data_list (com
+                       RETURNING em executemany quando o banco suporta, ou
+                       linha a linha caso contrário)
+            commit_per_batch: Confirma cada lote em vez de uma transação única
+        
+        Returns:
+            List: IDs das linhas se returning=True, senão lista vazia
+        """
+        table = self.model.__table__
+        dialect = db.engine.dialect
+        native_upsert = dialect.name in self.NATIVE_UPSERT_DIALECTS
+        row_by_row = (upsert and not native_upsert) or (returning and not dialect.insert_executemany_returning)
+        ids = []
+        batch = []
+        
+        def flush():
+            if row_by_row:
+                ids.extend(self._insert_rows(table, batch, upsert, conflict_columns, update_columns, returning))
+            else:
+                statement = self._bulk_insert_statement(table, dialect.name, batch[0].keys(), upsert,
+                                                        conflict_columns, update_columns)
+                if returning:
+                    # Sem sort_by_parameter_order os IDs podem vir fora da ordem dos parâmetros
+                    statement = statement.returning(table.c.id, sort_by_parameter_order=True)
+                    ids.extend(db.session.execute(statement, batch).scalars().all())
+                else:
+                    db.session.execute(statement, batch)
+            if commit_per_batch:
+                db.session.commit()
+            batch.clear()
+        
+        try:
+            for data in data_list:
+                batch.append(data)
+                if len(batch) >= batch_size:
+                    flush()
+            if batch:
+                flush()
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            raise e
+        finally:
+            if upsert and self.cache is not None:
+                # Não se sabe quais linhas o upsert alterou
+                self.cache.limpar(f'{table.name}:')
+            elif self.cache is not None:
+                self.cache.limpar(f'{table.name}:count:')
+        return ids
+    
+    @staticmethod
+    def _bulk_insert_statement(table, dialect_name: str, columns, upsert: bool,
+                               conflict_columns: Sequence[str], update_columns: Sequence[str]):
+        """Monta o INSERT (ou INSERT ... ON CONFLICT DO UPDATE) do lote"""
+        if not upsert:
+            return insert(table)
+        
+        if dialect_name == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        
+        statement = dialect_insert(table)
+        updates = update_columns or [column for column in columns if column not in conflict_columns]
+        return statement.on_conflict_do_update(
+            index_elements=list(conflict_columns),
+            set_={column: statement.excluded[column] for column in updates}
+        )
+    
+    @staticmethod
+    def _insert_rows(table, rows: List[Dict], upsert: bool, conflict_columns: Sequence[str],
+                     update_columns: Sequence[str], returning: bool) -> List[Any]:
+        """
+        Caminho genérico, uma linha por vez: para bancos sem ON CONFLICT ou
+        sem RETURNING em executemany
+        
+        No upsert, tenta o UPDATE pelas colunas de conflito e só insere se
+        nenhuma linha foi alterada. Roda na transação do bulk_insert.
+        """
+        ids = []
+        for row in rows:
+            if upsert:
+                condition = [table.c[column] == row[column] for column in conflict_columns]
+                updates = update_columns or [column for column in row if column not in conflict_columns]
+                if updates:
+                    changed = db.session.execute(
+                        update(table).where(*condition).values({column: row[column] for column in updates})
+                    ).rowcount
+                else:
+                    changed = db.session.execute(select(func.count()).select_from(table).where(*condition)).scalar()
+                if changed:
+                    if returning:
+                        ids.append(db.session.execute(select(table.c.id).where(*condition)).scalar())
+                    continue
+            result = db.session.execute(insert(table).values(row))
+            if returning:
+                ids.append(result.inserted_primary_key[0])
+        return ids
+    
+    # ===== CACHE =====
+    
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Retorna as métricas de acerto/falha do cache de segundo nível"""
+        return self.cache.estatisticas() if self.cache is not None else None
+    
+    def _id_key(self, id: Any) -> str:
+        return self._cache_key(self.model.__tablename__, 'id', id)
+    
+    def _field_key(self, field: str, value: Any) -> str:
+        return self._cache_key(self.model.__tablename__, field, value)
+    
+    def _count_key(self, filters: Dict[str, Any]) -> str:
+        return self._table_count_key(self.model.__tablename__, filters)
+    
+    @staticmethod
+    def _cache_key(table: str, field: str, value: Any) -> str:
+        return f'{table}:{field}:{value!r}'
+    
+    @staticmethod
+    def _table_count_key(table: str, filters: Dict[str, Any]) -> str:
+        return f'{table}:count:{sorted(filters.items())!r}'
+    
+    def _exact_count(self, filters: Dict[str, Any]) -> int:
+        query = self.model.query
+        if filters:
+            query = query.filter_by(**filters)
+        return query.order_by(None).count()
+    
+    # ===== INVALIDAÇÃO =====
+    
+    @classmethod
+    def _collect_changes(cls, session, flush_context, instances) -> None:
+        """
+        before_flush: anota as chaves afetadas pelas alterações pendentes
+        
+        Roda antes do flush para ainda ter os valores anteriores das colunas
+        alteradas; as anotações ficam na sessão até o commit (aplicadas) ou
+        o rollback (descartadas).
+        """
+        if cls.cache is None:
+            return
+        pending = session.info.setdefault('_repository_cache', {'keys': set(), 'counts': [], 'tables': set()})
+        for instance in session.new:
+            cls._collect_instance(pending, instance, 1)
+        for instance in session.deleted:
+            cls._collect_instance(pending, instance, -1)
+        for instance in session.dirty:
+            if session.is_modified(instance, include_collections=False):
+                cls._collect_instance(pending, instance, 0)
+    
+    @classmethod
+    def _collect_instance(cls, pending: Dict[str, Any], instance: Any, delta: int) -> None:
+        """Chaves (ID e campos consultados) e ajustes de contadores de uma instância"""
+        table = getattr(instance, '__tablename__', None)
+        if table is None:
+            return
+        state = inspect(instance)
+        fields = cls._cached_fields_by_table.get(table, set())
+        count_fields = {field for filters in cls._count_filters_by_table.get(table, {()}) for field in filters}
+        
+        if state.identity:
+            pending['keys'].add(cls._cache_key(table, 'id', state.identity[0]))
+        if delta < 0:
+            # Recarrega colunas expiradas (ex.: por um commit anterior) para conhecer os valores removidos
+            for field in fields | count_fields:
+                getattr(instance, field, None)
+        previous = cls._column_values(state, fields | count_fields, previous=True) if delta <= 0 else None
+        current = cls._column_values(state, fields | count_fields) if delta >= 0 else None
+        for values in (previous, current):
+            for field in fields:
+                if values is not None and field in values:
+                    pending['keys'].add(cls._cache_key(table, field, values[field]))
+        
+        if delta > 0:
+            changes = [(current, 1)]
+        elif delta < 0:
+            changes = [(previous, -1)]
+        else:
+            changes = [(previous, -1), (current, 1)]
+            if previous is not None and current is not None and all(
+                    previous.get(field) == current.get(field) for field in count_fields):
+                changes = []
+        for values, sign in changes:
+            if values is None or not count_fields <= values.keys():
+                # Valor desconhecido (coluna não carregada): recontar a tabela
+                pending['tables'].add(table)
+            else:
+                pending['counts'].append((table, values, sign))
+    
+    @staticmethod
+    def _column_values(state, fields, previous: bool = False) -> Dict[str, Any]:
+        """Valores carregados dos campos; com previous=True, os anteriores às alterações pendentes"""
+        values = {}
+        for field in fields:
+            if field not in state.mapper.column_attrs:
+                continue
+            history = state.attrs[field].history
+            if previous and history.has_changes():
+                if history.deleted:
+                    values[field] = history.deleted[0]
+            elif field in state.dict:
+                values[field] = state.dict[field]
+        return values
+    
+    @classmethod
+    def _apply_changes(cls, session) -> None:
+        """after_commit: remove as chaves anotadas e ajusta os contadores em cache"""
+        pending = session.info.pop('_repository_cache', None)
+        if pending is None or cls.cache is None:
+            return
+        if pending['keys']:
+            cls.cache.remover(*pending['keys'])
+        for table in pending['tables']:
+            cls.cache.limpar(f'{table}:count:')
+        for table, values, sign in pending['counts']:
+            if table in pending['tables']:
+                continue
+            for filters in list(cls._count_filters_by_table.get(table, {()})):
+                cls.cache.incrementar(cls._table_count_key(table, {field: values[field] for field in filters}), sign)
+    
+    @staticmethod
+    def _discard_changes(session, previous_transaction=None) -> None:
+        """after_rollback: as alterações anotadas não foram gravadas"""
+        session.info.pop('_repository_cache', None)
+    
+    def _request_map(self) -> Dict[str, Any]:
+        """Mapa campo/valor -> ID válido durante a requisição (contexto da aplicação)"""
+        if not has_app_context():
+            return {}
+        maps = g.setdefault('_repository_field_map', {})
+        return maps.setdefault(self.model.__tablename__, {})
+    
+    def _to_cache(self, instance: Any) -> Dict[str, Any]:
+        return {attr.key: getattr(instance, attr.key) for attr in inspect(self.model).column_attrs}
+    
+    def _from_cache(self, values: Dict[str, Any]) -> Any:
+        """Recria a instância a partir dos valores em cache e a associa à sessão sem consultar o banco"""
+        instance = inspect(self.model).class_manager.new_instance()
+        for key, value in values.items():
+            set_committed_value(instance, key, value)
+        make_transient_to_detached(instance)
+        return db.session.merge(instance, load=False)
+
+
+event.listen(SessaoRoteada, 'before_flush', BaseRepository._collect_changes)
+event.listen(SessaoRoteada, 'after_commit', BaseRepository._apply_changes)
+event.listen(SessaoRoteada, 'after_rollback', BaseRepository._discard_changes)
@@ -0,0 +1,197 @@
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+
+from config.settings import DATA_DIR
+
+
+class HistoricoUsuarioRepository:
+    """
+    Repositório do histórico de alterações de perfil (mementos) em SQLite
+
+    O histórico de cada usuário é uma sequência de posições crescentes na
+    tabela historico_usuario, indexada por (usuario_id, posicao); a posição
+    atual de cada usuário fica em historico_usuario_cursor. Como o estado
+    está no banco, desfazer/refazer funcionam entre requisições e entre
+    processos, sem que cada worker mantenha o histórico em memória.
+
+    Cada operação de escrita (inserir o memento, descartar estados futuros,
+    aplicar a retenção e mover o cursor) é feita em uma única transação.
+    """
+
+    def __init__(self, caminho_banco: Optional[str] = None):
+        """
+        Inicializa o repositório
+
+        Args:
+            caminho_banco (str): Arquivo SQLite do histórico
+        """
+        self.caminho_banco = caminho_banco or os.path.join(DATA_DIR, 'historico_usuarios.db')
+        self._criar_tabelas()
+
+    # ===== ESCRITA =====
+
+    def anexar(self, usuario_id: int, estado: dict, max_historico: int) -> None:
+        """
+        Anexa um estado após a posição atual e o torna o estado atual
+
+        Estados posteriores à posição atual (desfeitos) são descartados e
+        apenas os `max_historico` estados mais recentes são mantidos.
+        """
+        with self._transacao() as conexao:
+            atual, _ = self._cursor(conexao, usuario_id)
+            nova = atual + 1
+            conexao.execute(
+                'DELETE FROM historico_usuario WHERE usuario_id = ? AND posicao >= ?',
+                (usuario_id, nova)
+            )
+            conexao.execute(
+                'INSERT INTO historico_usuario (usuario_id, posicao, estado) VALUES (?, ?, ?)',
+                (usuario_id, nova, self._serializar(estado))
+            )
+            conexao.execute(
+                'DELETE FROM historico_usuario WHERE usuario_id = ? AND posicao <= ?',
+                (usuario_id, nova - max_historico)
+            )
+            self._gravar_cursor(conexao, usuario_id, nova, nova)
+
+    def mover(self, usuario_id: int, passo: int) -> Optional[dict]:
+        """
+        Move a posição atual para o estado anterior (-1) ou seguinte (+1)
+
+        Returns:
+            dict: Estado da nova posição ou None se não for possível mover
+        """
+        with self._transacao() as conexao:
+            atual, ultima = self._cursor(conexao, usuario_id)
+            if passo < 0:
+                linha = conexao.execute(
+                    'SELECT posicao, estado FROM historico_usuario '
+                    'WHERE usuario_id = ? AND posicao < ? ORDER BY posicao DESC LIMIT 1',
+                    (usuario_id, atual)
+                ).fetchone()
+            else:
+                linha = conexao.execute(
+                    'SELECT posicao, estado FROM historico_usuario '
+                    'WHERE usuario_id = ? AND posicao > ? AND posicao <= ? ORDER BY posicao LIMIT 1',
+                    (usuario_id, atual, ultima)
+                ).fetchone()
+            if linha is None:
+                return None
+            self._gravar_cursor(conexao, usuario_id, linha[0], ultima)
+            return self._desserializar(linha[1])
+
+    def limpar(self, usuario_id: int) -> None:
+        """Remove todo o histórico do usuário"""
+        with self._transacao() as conexao:
+            conexao.execute('DELETE FROM historico_usuario WHERE usuario_id = ?', (usuario_id,))
+            conexao.execute('DELETE FROM historico_usuario_cursor WHERE usuario_id = ?', (usuario_id,))
+
+    # ===== LEITURA =====
+
+    def listar(self, usuario_id: int) -> List[dict]:
+        """Retorna os estados do usuário, do mais antigo ao mais recente"""
+        with self._conectar() as conexao:
+            linhas = conexao.execute(
+                'SELECT estado FROM historico_usuario WHERE usuario_id = ? ORDER BY posicao',
+                (usuario_id,)
+            ).fetchall()
+        return [self._desserializar(linha[0]) for linha in linhas]
+
+    def obter_atual(self, usuario_id: int) -> Optional[dict]:
+        """Retorna o estado na posição atual do usuário"""
+        with self._conectar() as conexao:
+            atual, _ = self._cursor(conexao, usuario_id)
+            linha = conexao.execute(
+                'SELECT estado FROM historico_usuario WHERE usuario_id = ? AND posicao = ?',
+                (usuario_id, atual)
+            ).fetchone()
+        return self._desserializar(linha[0]) if linha else None
+
+    def contar_vizinhos(self, usuario_id: int) -> Tuple[int, int]:
+        """Retorna quantos estados existem antes e depois da posição atual"""
+        with self._conectar() as conexao:
+            atual, ultima = self._cursor(conexao, usuario_id)
+            anteriores, posteriores = conexao.execute(
+                'SELECT '
+                ' COALESCE(SUM(posicao < ?), 0),'
+                ' COALESCE(SUM(posicao > ? AND posicao <= ?), 0) '
+                'FROM historico_usuario WHERE usuario_id = ?',
+                (atual, atual, ultima, usuario_id)
+            ).fetchone()
+        return anteriores, posteriores
+
+    # ===== AUXILIARES =====
+
+    @contextmanager
+    def _conectar(self):
+        conexao = sqlite3.connect(self.caminho_banco, timeout=30, isolation_level=None)
+        try:
+            yield conexao
+        finally:
+            conexao.close()
+
+    @contextmanager
+    def _transacao(self):
+        """Transação com trava de escrita desde o início (serializa entre processos)"""
+        with self._conectar() as conexao:
+            conexao.execute('BEGIN IMMEDIATE')
+            try:
+                yield conexao
+            except Exception:
+                conexao.execute('ROLLBACK')
+                raise
+            conexao.execute('COMMIT')
+
+    @staticmethod
+    def _cursor(conexao, usuario_id: int) -> Tuple[int, int]:
+        linha = conexao.execute(
+            'SELECT atual, ultima FROM historico_usuario_cursor WHERE usuario_id = ?',
+            (usuario_id,)
+        ).fetchone()
+        return linha if linha else (0, 0)
+
+    @staticmethod
+    def _gravar_cursor(conexao, usuario_id: int, atual: int, ultima: int) -> None:
+        conexao.execute(
+            'INSERT INTO historico_usuario_cursor (usuario_id, atual, ultima) VALUES (?, ?, ?) '
+            'ON CONFLICT(usuario_id) DO UPDATE SET atual = excluded.atual, ultima = excluded.ultima',
+            (usuario_id, atual, ultima)
+        )
+
+    @staticmethod
+    def _serializar(estado: dict) -> str:
+        return json.dumps(
+            estado,
+            default=lambda valor: valor.isoformat() if isinstance(valor, (date, datetime)) else str(valor)
+        )
+
+    @staticmethod
+    def _desserializar(texto: str) -> dict:
+        estado = json.loads(texto)
+        if estado.get('data_nascimento'):
+            estado['data_nascimento'] = date.fromisoformat(estado['data_nascimento'])
+        if estado.get('timestamp'):
+            estado['timestamp'] = datetime.fromisoformat(estado['timestamp'])
+        return estado
+
+    def _criar_tabelas(self) -> None:
+        with self._conectar() as conexao:
+            conexao.execute('PRAGMA journal_mode=WAL')
+            conexao.execute(
+                'CREATE TABLE IF NOT EXISTS historico_usuario ('
+                ' usuario_id INTEGER NOT NULL,'
+                ' posicao INTEGER NOT NULL,'
+                ' estado TEXT NOT NULL,'
+                ' PRIMARY KEY (usuario_id, posicao)'
+                ') WITHOUT ROWID'
+            )
+            conexao.execute(
+                'CREATE TABLE IF NOT EXISTS historico_usuario_cursor ('
+                ' usuario_id INTEGER PRIMARY KEY,'
+                ' atual INTEGER NOT NULL,'
+                ' ultima INTEGER NOT NULL)'
+            )
@@ -3,6 +3,9 @@ from abc import ABC, abstractmethod
 class RelatorioStrategy(ABC):
     """Interface Strategy para geração de relatórios."""
     
+    extensao = None
+    mimetype = 'application/octet-stream'
+    
     @abstractmethod
     def gerar_relatorio(self, dados):
         """Gera um relatório com os dados fornecidos."""
@@ -1,20 +1,72 @@
 import csv
+import io
+from itertools import chain, islice
 from .estrategia_relatorio import RelatorioStrategy
 
 class RelatorioCsvStrategy(RelatorioStrategy):
     """Estratégia para gerar relatórios em CSV."""
-    
-    def gerar_relatorio(self, dados):
-        """Gera um relatório em formato CSV."""
-        if not dados:
+
+    extensao = 'csv'
+    mimetype = 'text/csv'
+
+    TAMANHO_LOTE = 1000
+
+    def __init__(self, tamanho_lote: int = TAMANHO_LOTE):
+        """
+        Inicializa a estratégia
+
+        Args:
+            tamanho_lote (int): Quantidade de linhas escritas por bloco
+        """
+        self.tamanho_lote = tamanho_lote
+
+    def gerar_relatorio(self, dados, nome_arquivo="relatorio.csv"):
+        """
+        Gera um relatório em formato CSV.
+
+        Aceita uma lista ou qualquer iterador de dicionários (ex.: cursor do banco);
+        as linhas são gravadas em blocos, sem materializar o conjunto completo.
+        """
+        blocos = self.gerar_stream(dados)
+        primeiro_bloco = next(blocos, None)
+        if primeiro_bloco is None:
             print("Nenhum dado fornecido para o relatório")
             return
-            
-        nome_arquivo = "relatorio.csv"
-        
+
         with open(nome_arquivo, 'w', newline='', encoding='utf-8') as arquivo:
-            writer = csv.DictWriter(arquivo, fieldnames=dados[0].keys())
-            writer.writeheader()
-            writer.writerows(dados)
-        
-        print(f"Relatório CSV gerado: {nome_arquivo}")
\ No newline at end of file
+            arquivo.write(primeiro_bloco)
+            for bloco in blocos:
+                arquivo.write(bloco)
+
+        print(f"Relatório CSV gerado: {nome_arquivo}")
+        return nome_arquivo
+
+    def gerar_stream(self, dados):
+        """
+        Gera o CSV em blocos de texto, com memória constante.
+
+        O cabeçalho é obtido da primeira linha. Cada bloco contém até
+        `tamanho_lote` linhas, de modo que o gerador pode ser entregue
+        diretamente a um Response do Flask:
+
+            Response(stream_with_context(estrategia.gerar_stream(cursor)),
+                     mimetype='text/csv')
+        """
+        linhas = iter(dados)
+        primeira = next(linhas, None)
+        if primeira is None:
+            return
+
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=list(primeira.keys()))
+        writer.writeheader()
+        linhas = chain([primeira], linhas)
+
+        while True:
+            lote = list(islice(linhas, self.tamanho_lote))
+            if not lote:
+                break
+            writer.writerows(lote)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
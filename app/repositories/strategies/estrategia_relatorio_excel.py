@@ -1,22 +1,55 @@
+from datetime import date, time
+from decimal import Decimal
+from itertools import chain
 from .estrategia_relatorio import RelatorioStrategy
 
 class RelatorioExcelStrategy(RelatorioStrategy):
     """Estratégia para gerar relatórios em Excel."""
-    
-    def gerar_relatorio(self, dados):
-        """Gera um relatório em formato Excel."""
+
+    extensao = 'xlsx'
+    mimetype = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+    def gerar_relatorio(self, dados, nome_arquivo="relatorio.xlsx"):
+        """
+        Gera um relatório em formato Excel.
+
+        Usa o modo write-only do openpyxl: as linhas são gravadas uma a uma
+        em disco, sem montar um DataFrame, e aceita qualquer iterador de
+        dicionários. O openpyxl só é importado quando um relatório é gerado.
+        """
         try:
-            import pandas as pd
-            
-            if not dados:
-                print("Nenhum dado fornecido para o relatório")
-                return
-                
-            nome_arquivo = "relatorio.xlsx"
-            df = pd.DataFrame(dados)
-            df.to_excel(nome_arquivo, index=False)
-            
-            print(f"Relatório Excel gerado: {nome_arquivo}")
-            
+            from openpyxl import Workbook
         except ImportError:
-            print("pandas não está instalado. Instale com: pip install pandas openpyxl")
\ No newline at end of file
+            print("openpyxl não está instalado. Instale com: pip install openpyxl")
+            return
+
+        linhas = iter(dados)
+        primeira = next(linhas, None)
+        if primeira is None:
+            print("Nenhum dado fornecido para o relatório")
+            return
+
+        colunas = list(primeira.keys())
+        workbook = Workbook(write_only=True)
+        planilha = workbook.create_sheet('Relatório')
+        planilha.append(colunas)
+
+        for linha in chain([primeira], linhas):
+            planilha.append([self._valor_celula(linha.get(coluna)) for coluna in colunas])
+
+        workbook.save(nome_arquivo)
+
+        print(f"Relatório Excel gerado: {nome_arquivo}")
+        return nome_arquivo
+
+    @staticmethod
+    def _valor_celula(valor):
+        """Converte valores sem representação nativa no Excel para texto"""
+        if valor is None or isinstance(valor, (str, int, float, bool)):
+            return valor
+        if isinstance(valor, Decimal):
+            return float(valor)
+        if isinstance(valor, (date, time)):
+            # O Excel não armazena fuso horário
+            return valor.replace(tzinfo=None) if getattr(valor, 'tzinfo', None) else valor
+        return str(valor)
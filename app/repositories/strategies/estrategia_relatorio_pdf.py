@@ -1,33 +1,139 @@
+import textwrap
+from itertools import chain, islice
 from .estrategia_relatorio import RelatorioStrategy
 
 class RelatorioPdfStrategy(RelatorioStrategy):
     """Estratégia para gerar relatórios em PDF."""
-    
-    def gerar_relatorio(self, dados):
-        """Gera um relatório em formato PDF."""
+
+    extensao = 'pdf'
+    mimetype = 'application/pdf'
+
+    LINHAS_POR_PAGINA = 45
+    MARGEM = 36
+    TAMANHO_FONTE = 8
+    ALTURA_LINHA_TEXTO = TAMANHO_FONTE + 2
+    PADDING_VERTICAL = 4
+
+    def __init__(self, linhas_por_pagina: int = LINHAS_POR_PAGINA, truncar: bool = False):
+        """
+        Inicializa a estratégia
+
+        Args:
+            linhas_por_pagina (int): Linhas de texto de dados em cada página
+            truncar (bool): Se True, corta os textos longos com '…' e cada registro
+                            ocupa uma única linha; por padrão o texto é quebrado
+                            em várias linhas dentro da célula, sem perder dados
+        """
+        self.linhas_por_pagina = linhas_por_pagina
+        self.truncar = truncar
+
+    def gerar_relatorio(self, dados, nome_arquivo="relatorio.pdf"):
+        """
+        Gera um relatório em formato PDF.
+
+        As linhas são consumidas sob demanda e agrupadas em páginas de até
+        `linhas_por_pagina` linhas de texto; cada página vira uma tabela
+        desenhada diretamente no canvas, então apenas uma página de dados fica
+        em memória por vez e o tempo de layout cresce de forma linear com o
+        número de linhas. As larguras das colunas são calculadas a partir da
+        primeira página de cada relatório.
+        """
         try:
             from reportlab.lib.pagesizes import A4
-            from reportlab.platypus import SimpleDocTemplate, Table
-            
-            if not dados:
-                print("Nenhum dado fornecido para o relatório")
-                return
-                
-            nome_arquivo = "relatorio.pdf"
-            doc = SimpleDocTemplate(nome_arquivo, pagesize=A4)
-            
-            # Prepara os dados para a tabela
-            colunas = list(dados[0].keys())
-            dados_tabela = [colunas]
-            
-            for linha in dados:
-                dados_tabela.append([str(linha.get(col, '')) for col in colunas])
-            
-            # Cria a tabela
-            tabela = Table(dados_tabela)
-            doc.build([tabela])
-            
-            print(f"Relatório PDF gerado: {nome_arquivo}")
-            
+            from reportlab.pdfgen.canvas import Canvas
         except ImportError:
-            print("reportlab não está instalado. Instale com: pip install reportlab")
\ No newline at end of file
+            print("reportlab não está instalado. Instale com: pip install reportlab")
+            return
+
+        linhas = iter(dados)
+        amostra = list(islice(linhas, self.linhas_por_pagina))
+        if not amostra:
+            print("Nenhum dado fornecido para o relatório")
+            return
+
+        colunas = list(amostra[0].keys())
+        largura_pagina, altura_pagina = A4
+        larguras = self._larguras_colunas(colunas, amostra, largura_pagina - 2 * self.MARGEM)
+        limites = [self._limite_caracteres(largura) for largura in larguras]
+        cabecalho = [self._celula(coluna, limite) for coluna, limite in zip(colunas, limites)]
+
+        canvas = Canvas(nome_arquivo, pagesize=A4)
+        for pagina in self._paginas(chain(amostra, linhas), colunas, limites):
+            tabela = self._criar_tabela([cabecalho] + pagina, larguras)
+            _, altura_tabela = tabela.wrapOn(canvas, largura_pagina, altura_pagina)
+            tabela.drawOn(canvas, self.MARGEM, altura_pagina - self.MARGEM - altura_tabela)
+            canvas.showPage()
+
+        canvas.save()
+
+        print(f"Relatório PDF gerado: {nome_arquivo}")
+        return nome_arquivo
+
+    def _paginas(self, linhas, colunas, limites):
+        """
+        Agrupa os registros em páginas de até `linhas_por_pagina` linhas de texto
+
+        Um registro mais alto que uma página inteira é dividido em partes
+        consecutivas, de modo que nenhum texto fica fora da área desenhada.
+        """
+        pagina, usadas = [], 0
+        for linha in linhas:
+            celulas = [self._celula(linha.get(coluna, ''), limite) for coluna, limite in zip(colunas, limites)]
+            altura = max(len(celula) for celula in celulas)
+            for inicio in range(0, altura, self.linhas_por_pagina):
+                parte = [celula[inicio:inicio + self.linhas_por_pagina] for celula in celulas]
+                altura_parte = min(altura - inicio, self.linhas_por_pagina)
+                if pagina and usadas + altura_parte > self.linhas_por_pagina:
+                    yield pagina
+                    pagina, usadas = [], 0
+                pagina.append(parte)
+                usadas += altura_parte
+        if pagina:
+            yield pagina
+
+    def _criar_tabela(self, linhas_celulas, larguras):
+        from reportlab.platypus import Table, TableStyle
+
+        dados_tabela = [['\n'.join(celula) for celula in linha] for linha in linhas_celulas]
+        alturas = [
+            max(len(celula) for celula in linha) * self.ALTURA_LINHA_TEXTO + self.PADDING_VERTICAL
+            for linha in linhas_celulas
+        ]
+        tabela = Table(dados_tabela, colWidths=larguras, rowHeights=alturas)
+        tabela.setStyle(TableStyle([
+            ('FONTSIZE', (0, 0), (-1, -1), self.TAMANHO_FONTE),
+            ('LEADING', (0, 0), (-1, -1), self.ALTURA_LINHA_TEXTO),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('LINEBELOW', (0, 0), (-1, 0), 0.5, '#000000'),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('TOPPADDING', (0, 0), (-1, -1), self.PADDING_VERTICAL / 2),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), self.PADDING_VERTICAL / 2),
+        ]))
+        return tabela
+
+    @staticmethod
+    def _larguras_colunas(colunas, amostra, largura_disponivel):
+        """Distribui a largura da página proporcionalmente ao tamanho dos textos da amostra"""
+        pesos = [
+            min(max(len(str(coluna)), *(len(str(linha.get(coluna, ''))) for linha in amostra), 4), 40)
+            for coluna in colunas
+        ]
+        total = sum(pesos)
+        return [largura_disponivel * peso / total for peso in pesos]
+
+    def _limite_caracteres(self, largura):
+        # Largura média de um caractere Helvetica ~ metade do tamanho da fonte
+        return max(int(largura / (self.TAMANHO_FONTE * 0.5)) - 1, 1)
+
+    def _celula(self, valor, limite):
+        """Linhas de texto de uma célula: quebradas na largura da coluna ou truncadas, se configurado"""
+        texto = '' if valor is None else str(valor)
+        if self.truncar:
+            texto = ' '.join(texto.split())
+            return [texto[:limite - 1] + '…' if len(texto) > limite else texto]
+        linhas = [
+            parte
+            for paragrafo in texto.splitlines()
+            for parte in (textwrap.wrap(paragrafo, limite) or [''])
+        ]
+        return linhas or ['']
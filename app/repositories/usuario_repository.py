@@ -1,3 +1,4 @@
+from app import db
 from app.repositories.base_repository import BaseRepository
 from app.models.usuario import Usuario
 
@@ -10,28 +11,34 @@ class UsuarioRepository(BaseRepository):
     
     def buscar_por_email(self, email):
         """Busca um usuário pelo email"""
-        pass
+        return self.get_by_field('email', email)
     
     def buscar_ativos(self):
         """Retorna todos os usuários ativos"""
-        pass
+        return self.model.query.filter_by(ativo=True).order_by(self.model.id).all()
     
     def buscar_inativos(self):
         """Retorna todos os usuários inativos"""
-        pass
+        return self.model.query.filter_by(ativo=False).order_by(self.model.id).all()
     
     def email_existe(self, email, excluir_id=None):
         """Verifica se um email já está em uso"""
-        pass
+        query = self.model.query.filter(self.model.email == email)
+        if excluir_id is not None:
+            query = query.filter(self.model.id != excluir_id)
+        return db.session.query(query.exists()).scalar()
     
     def atualizar_senha(self, usuario_id, nova_senha_hash):
         """Atualiza a senha do usuário"""
-        pass
+        usuario = self.get_by_id(usuario_id)
+        return self.update(usuario, senha_hash=nova_senha_hash) if usuario else None
     
     def desativar(self, usuario_id):
         """Desativa um usuário"""
-        pass
+        usuario = self.get_by_id(usuario_id)
+        return self.update(usuario, ativo=False) if usuario else None
     
     def ativar(self, usuario_id):
         """Ativa um usuário"""
-        pass
\ No newline at end of file
+        usuario = self.get_by_id(usuario_id)
+        return self.update(usuario, ativo=True) if usuario else None
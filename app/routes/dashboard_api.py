@@ -1,7 +1,29 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, current_app, jsonify, request, send_file, stream_with_context
 from flask_login import login_required, current_user
 from datetime import datetime, timedelta
+from functools import wraps
+import os
 import random
+import re
+import threading
+import uuid
+
+from config.settings import DATA_DIR
+
+from app import USUARIO_DEMO, db
+from app.stores import TransacaoStore, AgregadosTransacoes, RelatorioColunar
+from app.importacao import (
+    ClassificadorCategorias, ImportadorExtrato, IndiceDeduplicacao, RegistroImportacoes, detectar_formato
+)
+from app.services.relatorio_jobs import FilaRelatorios, registrar_consulta
+from app.services.relatorio_service import RelatoriosService
+from app.utils.banco import estatisticas_pool
+from app.utils.cache_http import VERSOES_DADOS, cache_http
+from app.utils.cache_respostas import CACHE_RESPOSTAS
+from app.utils.carregador_lotes import carregador_da_requisicao
+from app.utils.eventos import BARRAMENTO_EVENTOS
+from app.utils.json_rapido import resposta_json_em_fluxo
+from app.utils.paginacao import codificar_cursor, decodificar_cursor, CursorInvalidoError
 
 dashboard_api = Blueprint('dashboard_api', __name__, url_prefix='/api')
 
@@ -21,6 +43,59 @@ CATEGORIAS_FICTICIAS = [
     {'id': 10, 'nome': 'Outros', 'tipo': 'ambos', 'cor': '#FFD93D'},
 ]
 
+# Índices da tabela de categorias
+CATEGORIAS_POR_ID = {categoria['id']: categoria for categoria in CATEGORIAS_FICTICIAS}
+CATEGORIAS_POR_NOME = {categoria['nome']: categoria for categoria in CATEGORIAS_FICTICIAS}
+
+def carregar_categorias(ids):
+    """Resolve um lote de IDs de categoria de uma vez (com banco: um único WHERE id IN (...))"""
+    return {categoria_id: CATEGORIAS_POR_ID[categoria_id] for categoria_id in ids if categoria_id in CATEGORIAS_POR_ID}
+
+def carregador_categorias():
+    """Carregador de categorias em lote da requisição atual"""
+    return carregador_da_requisicao('categorias', carregar_categorias)
+
+def enriquecer_categorias(transacoes):
+    """
+    Preenche categoria_nome das transações resolvendo todas as categorias em um único lote
+    
+    Returns:
+        list: Cópias das transações com o nome atual da categoria
+    """
+    categorias = carregador_categorias().carregar_muitos({t['categoria_id'] for t in transacoes})
+    return [
+        dict(t, categoria_nome=categorias[t['categoria_id']]['nome']) if categorias[t['categoria_id']] else t
+        for t in transacoes
+    ]
+
+# Forma estendida AAAA-MM-DD[THH:MM[:SS[.ffffff]]]: os stores comparam as datas
+# como texto e usam os prefixos [:7] (mês) e [:10] (dia)
+FORMATO_DATA_TRANSACAO = re.compile(r'\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}(:\d{2}(\.\d{1,6})?)?)?')
+
+def validar_data_transacao(valor):
+    """
+    Valida a data de uma transação recebida pela API antes de qualquer gravação
+    
+    Formas ISO que datetime.fromisoformat também aceita, como a básica
+    ('20261018') e a de semana ('2026-W42-1'), são recusadas.
+    
+    Args:
+        valor (str): Data ou data e hora em formato ISO ('2026-10-18' ou '2026-10-18T10:30:00')
+    
+    Returns:
+        str: O próprio valor, já validado
+    
+    Raises:
+        ValueError: Se o valor não for uma data ISO na forma estendida
+    """
+    try:
+        if not FORMATO_DATA_TRANSACAO.fullmatch(valor):
+            raise ValueError
+        datetime.fromisoformat(valor)
+    except (TypeError, ValueError):
+        raise ValueError(f'data_transacao inválida: {valor!r}. Use o formato AAAA-MM-DD')
+    return valor
+
 # Transações fictícias
 def gerar_transacoes_ficticias():
     transacoes = []
@@ -57,14 +132,12 @@ def gerar_transacoes_ficticias():
         valor_final = base['valor'] * valor_variacao
         
         # Encontrar categoria_id baseado no nome
-        categoria_id = 1
-        for cat in CATEGORIAS_FICTICIAS:
-            if cat['nome'] == base['categoria_nome']:
-                categoria_id = cat['id']
-                break
+        categoria = CATEGORIAS_POR_NOME.get(base['categoria_nome'])
+        categoria_id = categoria['id'] if categoria else 1
         
         transacao = {
             'id': i + 1,
+            'usuario_id': USUARIO_DEMO.id,
             'descricao': base['descricao'],
             'valor': round(valor_final, 2),
             'tipo': base['tipo'],
@@ -80,22 +153,112 @@ def gerar_transacoes_ficticias():
     
     return sorted(transacoes, key=lambda x: x['data_transacao'], reverse=True)
 
-TRANSACOES_FICTICIAS = gerar_transacoes_ficticias()
+# Trava compartilhada pelos stores das transações: cada método de um store é
+# atômico e as rotas de escrita (e a thread de importação) seguram a mesma
+# trava para atualizar todos os stores juntos
+TRAVA_TRANSACOES = threading.RLock()
 
-def calcular_resumo_mes():
-    hoje = datetime.now()
-    inicio_mes = hoje.replace(day=1)
+TRANSACOES_FICTICIAS = TransacaoStore(gerar_transacoes_ficticias(), trava=TRAVA_TRANSACOES)
+
+# Totais mantidos incrementalmente pelas rotas de escrita
+AGREGADOS_TRANSACOES = AgregadosTransacoes(trava=TRAVA_TRANSACOES)
+for _transacao in TRANSACOES_FICTICIAS:
+    AGREGADOS_TRANSACOES.registrar(_transacao)
+
+# Cópia colunar das transações usada pelas páginas de relatório
+RELATORIO_COLUNAR = RelatorioColunar(CATEGORIAS_FICTICIAS, TRANSACOES_FICTICIAS, trava=TRAVA_TRANSACOES)
+
+# Chaves de conteúdo e ids do banco das transações, consultados pelas importações
+INDICE_DEDUPLICACAO = IndiceDeduplicacao(TRANSACOES_FICTICIAS, trava=TRAVA_TRANSACOES)
+
+def gravar_transacao(transacao):
+    """Adiciona uma transação a todos os stores (chamar com TRAVA_TRANSACOES)"""
+    TRANSACOES_FICTICIAS.adicionar(transacao)
+    AGREGADOS_TRANSACOES.registrar(transacao)
+    RELATORIO_COLUNAR.adicionar(transacao)
+    INDICE_DEDUPLICACAO.registrar(transacao)
+
+# Server-Sent Events do dashboard
+INTERVALO_PING_SSE = 15  # segundos sem eventos até enviar um comentário (mantém proxies abertos)
+RECONEXAO_SSE_MS = 5000
+
+def canal_usuario(usuario_id):
+    """Canal do barramento de eventos com as alterações do usuário"""
+    return f'usuario:{usuario_id}'
+
+def transacoes_alteradas(usuario_id, tipo, **dados):
+    """
+    Chamado pelas rotas de escrita de transações
+    
+    Gera nova versão das transações (ETag), descarta as respostas em cache
+    do usuário e publica o delta para os dashboards abertos, com os totais
+    do mês já atualizados.
     
-    receitas_mes = 0
-    despesas_mes = 0
+    Args:
+        usuario_id (int): Dono das transações alteradas
+        tipo (str): 'transacao_criada', 'transacao_atualizada', 'transacao_excluida'
+                    ou 'transacoes_importadas'
+        **dados: Conteúdo do delta (ex.: transacao=..., id=..., quantidade=...)
+    """
+    VERSOES_DADOS.incrementar('transacoes')
+    CACHE_RESPOSTAS.invalidar('transacoes', usuario_id)
     
-    for transacao in TRANSACOES_FICTICIAS:
-        data_transacao = datetime.fromisoformat(transacao['data_transacao'])
-        if data_transacao >= inicio_mes:
-            if transacao['tipo'] == 'receita':
-                receitas_mes += transacao['valor']
-            else:
-                despesas_mes += transacao['valor']
+    totais_mes = AGREGADOS_TRANSACOES.totais_mes(usuario_id, datetime.now().strftime('%Y-%m'))
+    BARRAMENTO_EVENTOS.publicar(canal_usuario(usuario_id), {
+        'tipo': tipo,
+        **dados,
+        'resumo': {'receitas_mes': totais_mes['receitas'], 'despesas_mes': totais_mes['despesas']}
+    })
+
+# Importação de extratos em segundo plano
+CLASSIFICADOR_CATEGORIAS = ClassificadorCategorias(CATEGORIAS_FICTICIAS)
+IMPORTACOES = RegistroImportacoes()
+DIRETORIO_IMPORTACOES = os.path.join(DATA_DIR, 'importacoes')
+
+# Exportação de relatórios em segundo plano
+TRAVA_FILA_RELATORIOS = threading.Lock()
+
+@registrar_consulta('transacoes_usuario')
+def consulta_transacoes_usuario(usuario_id, inicio=None, fim=None):
+    """
+    Linhas do relatório de transações de um usuário, da mais recente para a mais antiga
+    
+    Args:
+        usuario_id (int): Dono das transações
+        inicio (str): Primeiro dia incluído ('AAAA-MM-DD'), None para não limitar
+        fim (str): Último dia incluído ('AAAA-MM-DD'), None para não limitar
+    """
+    for transacao in TRANSACOES_FICTICIAS.listar_por_usuario(usuario_id):
+        dia = transacao['data_transacao'][:10]
+        if (inicio and dia < inicio) or (fim and dia > fim):
+            continue
+        categoria = CATEGORIAS_POR_ID.get(transacao['categoria_id'])
+        yield {
+            'data': dia,
+            'descricao': transacao['descricao'],
+            'categoria': categoria['nome'] if categoria else transacao.get('categoria_nome', ''),
+            'tipo': transacao['tipo'],
+            'valor': transacao['valor']
+        }
+
+def servico_relatorios():
+    """Serviço de relatórios com a fila da aplicação (criada no primeiro uso)"""
+    with TRAVA_FILA_RELATORIOS:
+        fila = current_app.extensions.get('fila_relatorios')
+        if fila is None:
+            fila = current_app.extensions['fila_relatorios'] = FilaRelatorios(
+                current_app.config.get('RELATORIOS_DIRETORIO') or None,
+                processos=current_app.config.get('RELATORIOS_EXECUTOR') == 'processos',
+                aplicacao=current_app._get_current_object()
+            )
+    return RelatoriosService(fila=fila)
+
+def calcular_resumo_mes(usuario_id):
+    mes_atual = datetime.now().strftime('%Y-%m')
+    
+    totais_mes = AGREGADOS_TRANSACOES.totais_mes(usuario_id, mes_atual)
+    receitas_mes = totais_mes['receitas']
+    despesas_mes = totais_mes['despesas']
     
     saldo_atual = receitas_mes - despesas_mes + random.uniform(1000, 5000)  # Saldo anterior fictício
     
@@ -120,12 +283,12 @@ def calcular_resumo_mes():
         'receitas_mes': round(receitas_mes, 2),
         'despesas_mes': round(despesas_mes, 2),
         'saldo_atual': round(saldo_atual, 2),
-        'transacoes_recentes': TRANSACOES_FICTICIAS[:10],
+        'transacoes_recentes': enriquecer_categorias(TRANSACOES_FICTICIAS.listar_por_usuario(usuario_id, 0, 10)),
         'fluxo_caixa': fluxo_caixa,
         'gastos_por_categoria': gastos_por_categoria
     }
 
-def gerar_estatisticas_ficticias():
+def gerar_estatisticas_ficticias(usuario_id):
     # Dados para gráficos
     hoje = datetime.now()
     
@@ -139,18 +302,18 @@ def gerar_estatisticas_ficticias():
             'valor': round(valor, 2)
         })
     
-    # Por categoria - com estrutura correta
-    categorias_nomes = ['Alimentação', 'Transporte', 'Moradia', 'Lazer', 'Saúde', 'Outros']
-    cores_categorias = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', '#FFD93D']
+    # Por categoria - despesas do mês atual a partir dos totais acumulados
+    totais_categoria = AGREGADOS_TRANSACOES.totais_por_categoria(usuario_id, hoje.strftime('%Y-%m'))
     
     gastos_categoria = []
-    for i, categoria in enumerate(categorias_nomes):
-        valor = random.uniform(100, 1000)
-        gastos_categoria.append({
-            'categoria': categoria,
-            'valor': round(valor, 2),
-            'cor': cores_categorias[i]
-        })
+    for categoria in CATEGORIAS_FICTICIAS:
+        totais = totais_categoria.get(categoria['id'])
+        if totais and totais['despesas'] > 0:
+            gastos_categoria.append({
+                'categoria': categoria['nome'],
+                'valor': totais['despesas'],
+                'cor': categoria['cor']
+            })
     
     # Comparativo mensal
     meses = []
@@ -189,39 +352,75 @@ def gerar_estatisticas_ficticias():
 
 @dashboard_api.route('/dashboard/resumo')
 @login_required
+@CACHE_RESPOSTAS.em_cache('transacoes')
 def dashboard_resumo():
     """Retorna resumo do dashboard com dados fictícios"""
     try:
-        resumo = calcular_resumo_mes()
+        resumo = calcular_resumo_mes(current_user.id)
         return jsonify(resumo)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @dashboard_api.route('/dashboard/estatisticas')
 @login_required
+@cache_http('transacoes', 'categorias')
+@CACHE_RESPOSTAS.em_cache('transacoes', 'categorias')
 def dashboard_estatisticas():
     """Retorna estatísticas para gráficos com dados fictícios"""
     try:
-        estatisticas = gerar_estatisticas_ficticias()
+        estatisticas = gerar_estatisticas_ficticias(current_user.id)
         return jsonify(estatisticas)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@dashboard_api.route('/dashboard/eventos')
+@login_required
+def dashboard_eventos():
+    """
+    Server-Sent Events com as alterações das transações do usuário
+    
+    Substitui o polling de /dashboard/resumo e /dashboard/estatisticas: a
+    conexão fica aberta e recebe um evento por escrita (transacao_criada,
+    transacao_atualizada, transacao_excluida, transacoes_importadas) com o
+    delta e os totais do mês. 'resincronizar' pede ao cliente que recarregue
+    o resumo completo. Cada conexão ocupa uma thread (ou greenlet) do
+    servidor enquanto estiver aberta.
+    """
+    canal = canal_usuario(current_user.id)
+    dumps = current_app.json.dumps
+    
+    def gerar():
+        # Assina só quando o fluxo começa a ser consumido: se o cliente
+        # desconectar antes, o gerador é fechado sem deixar assinatura
+        with BARRAMENTO_EVENTOS.assinar(canal) as assinatura:
+            yield f'retry: {RECONEXAO_SSE_MS}\n\n'
+            while True:
+                evento = assinatura.proximo(timeout=INTERVALO_PING_SSE)
+                if evento is None:
+                    yield ': ping\n\n'
+                    continue
+                yield f"event: {evento['tipo']}\ndata: {dumps(evento)}\n\n"
+    
+    return Response(stream_with_context(gerar()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 @dashboard_api.route('/categorias')
 @login_required
+@cache_http('categorias')
 def get_categorias():
     """Retorna categorias fictícias"""
     try:
-        return jsonify(CATEGORIAS_FICTICIAS)
+        return resposta_json_em_fluxo(CATEGORIAS_FICTICIAS)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @dashboard_api.route('/categorias/<int:categoria_id>')
 @login_required
+@cache_http('categorias')
 def get_categoria(categoria_id):
     """Retorna uma categoria específica"""
     try:
-        categoria = next((c for c in CATEGORIAS_FICTICIAS if c['id'] == categoria_id), None)
+        categoria = carregador_categorias().carregar(categoria_id)
         if not categoria:
             return jsonify({'error': 'Categoria não encontrada'}), 404
         return jsonify(categoria)
@@ -236,25 +435,51 @@ def get_despesas():
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 10, type=int)
         
+        # Paginação por cursor: ?cursor= (vazio na primeira página)
+        if 'cursor' in request.args:
+            return get_despesas_cursor(request.args['cursor'], per_page)
+        
         # Simular paginação
         inicio = (page - 1) * per_page
         fim = inicio + per_page
         
-        transacoes_pagina = TRANSACOES_FICTICIAS[inicio:fim]
+        transacoes_pagina = TRANSACOES_FICTICIAS.listar(inicio, fim)
         
-        return jsonify(transacoes_pagina)
+        # Categorias resolvidas e serializadas bloco a bloco durante o envio
+        return resposta_json_em_fluxo(transacoes_pagina, transformar_lote=enriquecer_categorias)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def get_despesas_cursor(cursor, per_page):
+    """Página de transações a partir de um cursor opaco (data_transacao, id)"""
+    try:
+        chave = decodificar_cursor(cursor) if cursor else None
+        if chave is not None and not (len(chave) == 2 and isinstance(chave[0], str) and isinstance(chave[1], int)):
+            raise CursorInvalidoError('Cursor de paginação inválido')
+    except CursorInvalidoError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    # Uma transação extra indica se existe próxima página
+    transacoes = TRANSACOES_FICTICIAS.listar_apos_chave(chave, per_page + 1)
+    pagina = transacoes[:per_page]
+    proximo_cursor = None
+    if len(transacoes) > per_page:
+        proximo_cursor = codificar_cursor([pagina[-1]['data_transacao'], pagina[-1]['id']])
+    
+    return jsonify({
+        'transacoes': enriquecer_categorias(pagina),
+        'proximo_cursor': proximo_cursor
+    })
+
 @dashboard_api.route('/despesas/<int:transacao_id>')
 @login_required
 def get_despesa(transacao_id):
     """Retorna uma transação específica"""
     try:
-        transacao = next((t for t in TRANSACOES_FICTICIAS if t['id'] == transacao_id), None)
+        transacao = TRANSACOES_FICTICIAS.obter(transacao_id)
         if not transacao:
             return jsonify({'error': 'Transação não encontrada'}), 404
-        return jsonify(transacao)
+        return jsonify(enriquecer_categorias([transacao])[0])
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -264,20 +489,24 @@ def create_despesa():
     """Cria uma nova transação fictícia"""
     try:
         data = request.get_json()
+        categoria_id = int(data.get('categoria_id', 1))
+        categoria = carregador_categorias().carregar(categoria_id)
         
         # Simular criação
         nova_transacao = {
-            'id': len(TRANSACOES_FICTICIAS) + 1,
+            'usuario_id': current_user.id,
             'descricao': data.get('descricao', 'Nova transação'),
             'valor': float(data.get('valor', 0)),
             'tipo': data.get('tipo', 'despesa'),
-            'data_transacao': data.get('data_transacao', datetime.now().isoformat()),
-            'categoria_id': int(data.get('categoria_id', 1)),
-            'categoria_nome': next((c['nome'] for c in CATEGORIAS_FICTICIAS if c['id'] == int(data.get('categoria_id', 1))), 'Outros'),
+            'data_transacao': validar_data_transacao(data.get('data_transacao', datetime.now().isoformat())),
+            'categoria_id': categoria_id,
+            'categoria_nome': categoria['nome'] if categoria else 'Outros',
             'observacoes': data.get('observacoes', '')
         }
         
-        TRANSACOES_FICTICIAS.insert(0, nova_transacao)
+        with TRAVA_TRANSACOES:
+            gravar_transacao(nova_transacao)
+        transacoes_alteradas(current_user.id, 'transacao_criada', transacao=enriquecer_categorias([nova_transacao])[0])
         
         return jsonify({
             'success': True,
@@ -294,26 +523,37 @@ def update_despesa(transacao_id):
     try:
         data = request.get_json()
         
+        categoria_id = data.get('categoria_id')
+        categoria = carregador_categorias().carregar(int(categoria_id)) if categoria_id is not None else None
+        
         # Encontrar e atualizar transação
-        for i, transacao in enumerate(TRANSACOES_FICTICIAS):
-            if transacao['id'] == transacao_id:
-                TRANSACOES_FICTICIAS[i].update({
-                    'descricao': data.get('descricao', transacao['descricao']),
-                    'valor': float(data.get('valor', transacao['valor'])),
-                    'tipo': data.get('tipo', transacao['tipo']),
-                    'data_transacao': data.get('data_transacao', transacao['data_transacao']),
-                    'categoria_id': int(data.get('categoria_id', transacao['categoria_id'])),
-                    'categoria_nome': next((c['nome'] for c in CATEGORIAS_FICTICIAS if c['id'] == int(data.get('categoria_id', transacao['categoria_id']))), transacao['categoria_nome']),
-                    'observacoes': data.get('observacoes', transacao['observacoes'])
-                })
-                
-                return jsonify({
-                    'success': True,
-                    'message': 'Transação atualizada com sucesso',
-                    'data': TRANSACOES_FICTICIAS[i]
-                })
+        with TRAVA_TRANSACOES:
+            transacao = TRANSACOES_FICTICIAS.obter(transacao_id)
+            if not transacao:
+                return jsonify({'success': False, 'message': 'Transação não encontrada'}), 404
+            
+            anterior = dict(transacao)
+            transacao = TRANSACOES_FICTICIAS.atualizar(transacao_id, {
+                'descricao': data.get('descricao', transacao['descricao']),
+                'valor': float(data.get('valor', transacao['valor'])),
+                'tipo': data.get('tipo', transacao['tipo']),
+                'data_transacao': validar_data_transacao(data.get('data_transacao', transacao['data_transacao'])),
+                'categoria_id': int(categoria_id) if categoria_id is not None else transacao['categoria_id'],
+                'categoria_nome': categoria['nome'] if categoria else transacao['categoria_nome'],
+                'observacoes': data.get('observacoes', transacao['observacoes'])
+            })
+            AGREGADOS_TRANSACOES.substituir(anterior, transacao)
+            RELATORIO_COLUNAR.atualizar(transacao)
+            INDICE_DEDUPLICACAO.remover(anterior)
+            INDICE_DEDUPLICACAO.registrar(transacao)
+        transacoes_alteradas(transacao['usuario_id'], 'transacao_atualizada',
+                             transacao=enriquecer_categorias([transacao])[0])
         
-        return jsonify({'success': False, 'message': 'Transação não encontrada'}), 404
+        return jsonify({
+            'success': True,
+            'message': 'Transação atualizada com sucesso',
+            'data': transacao
+        })
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 400
 
@@ -322,15 +562,147 @@ def update_despesa(transacao_id):
 def delete_despesa(transacao_id):
     """Exclui uma transação fictícia"""
     try:
-        # Encontrar e remover transação
-        for i, transacao in enumerate(TRANSACOES_FICTICIAS):
-            if transacao['id'] == transacao_id:
-                del TRANSACOES_FICTICIAS[i]
-                return jsonify({
-                    'success': True,
-                    'message': 'Transação excluída com sucesso'
-                })
+        # Remover transação pelo índice de ID
+        with TRAVA_TRANSACOES:
+            transacao = TRANSACOES_FICTICIAS.remover(transacao_id)
+            if not transacao:
+                return jsonify({'success': False, 'message': 'Transação não encontrada'}), 404
+            AGREGADOS_TRANSACOES.remover(transacao)
+            RELATORIO_COLUNAR.remover(transacao_id)
+            INDICE_DEDUPLICACAO.remover(transacao)
+        transacoes_alteradas(transacao['usuario_id'], 'transacao_excluida', id=transacao_id)
         
-        return jsonify({'success': False, 'message': 'Transação não encontrada'}), 404
+        return jsonify({
+            'success': True,
+            'message': 'Transação excluída com sucesso'
+        })
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 400
+
+@dashboard_api.route('/despesas/importar', methods=['POST'])
+@login_required
+def importar_despesas():
+    """
+    Importa um extrato bancário (CSV ou OFX) em segundo plano
+    
+    O upload é gravado em disco em blocos e processado por uma thread;
+    o progresso pode ser acompanhado em /api/despesas/importacoes/<id>.
+    """
+    try:
+        arquivo = request.files.get('arquivo')
+        if arquivo is None or not arquivo.filename:
+            return jsonify({'success': False, 'message': 'Envie o extrato no campo "arquivo"'}), 400
+        formato = detectar_formato(f".{request.form['formato']}" if request.form.get('formato') else arquivo.filename)
+        
+        os.makedirs(DIRETORIO_IMPORTACOES, exist_ok=True)
+        caminho = os.path.join(DIRETORIO_IMPORTACOES, f'{uuid.uuid4().hex}.{formato}')
+        arquivo.save(caminho)
+        
+        usuario_id = current_user.id
+        
+        def gravar_lote(lote):
+            # Um lote por vez segurando a trava: as requisições esperam no
+            # máximo um lote e nunca veem os stores divergentes entre si
+            with TRAVA_TRANSACOES:
+                for transacao in lote:
+                    transacao['usuario_id'] = usuario_id
+                    gravar_transacao(transacao)
+            transacoes_alteradas(usuario_id, 'transacoes_importadas', quantidade=len(lote))
+        
+        def executar(resultado):
+            try:
+                with open(caminho, 'rb') as extrato:
+                    ImportadorExtrato(CLASSIFICADOR_CATEGORIAS, gravar_lote).importar(
+                        extrato, formato, INDICE_DEDUPLICACAO, resultado
+                    )
+            finally:
+                os.remove(caminho)
+        
+        importacao = IMPORTACOES.iniciar(usuario_id, executar, arquivo=arquivo.filename, formato=formato)
+        return jsonify({'success': True, 'data': importacao}), 202
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+@dashboard_api.route('/despesas/importacoes/<importacao_id>')
+@login_required
+def get_importacao(importacao_id):
+    """Retorna o status e o progresso de uma importação"""
+    importacao = IMPORTACOES.obter(importacao_id, current_user.id)
+    if importacao is None:
+        return jsonify({'error': 'Importação não encontrada'}), 404
+    return jsonify(importacao)
+
+@dashboard_api.route('/relatorios', methods=['POST'])
+@login_required
+def enviar_relatorio():
+    """
+    Enfileira a exportação das transações do usuário ('csv', 'excel' ou 'pdf')
+    
+    Corpo opcional: {"formato": "csv", "inicio": "AAAA-MM-DD", "fim": "AAAA-MM-DD"}.
+    O progresso pode ser acompanhado em /api/relatorios/<id> e o arquivo,
+    depois de concluído, baixado em /api/relatorios/<id>/arquivo.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        parametros = {'usuario_id': current_user.id}
+        for campo in ('inicio', 'fim'):
+            if data.get(campo):
+                parametros[campo] = validar_data_transacao(data[campo])[:10]
+        job_id = servico_relatorios().enviar(
+            data.get('formato', 'csv'), 'transacoes_usuario', parametros, current_user.id
+        )
+        return jsonify({'success': True, 'data': {'id': job_id}}), 202
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+@dashboard_api.route('/relatorios/<job_id>')
+@login_required
+def get_relatorio(job_id):
+    """Retorna o status e o progresso de uma exportação do usuário"""
+    job = servico_relatorios().status(job_id, current_user.id)
+    if job is None:
+        return jsonify({'error': 'Relatório não encontrado'}), 404
+    campos = ('id', 'formato', 'status', 'progresso', 'erro', 'criado_em', 'atualizado_em')
+    return jsonify({campo: job[campo] for campo in campos})
+
+@dashboard_api.route('/relatorios/<job_id>/arquivo')
+@login_required
+def get_relatorio_arquivo(job_id):
+    """Baixa o arquivo de uma exportação concluída do usuário"""
+    caminho = servico_relatorios().arquivo(job_id, current_user.id)
+    if caminho is None or not os.path.exists(caminho):
+        return jsonify({'error': 'Relatório não encontrado ou ainda não concluído'}), 404
+    return send_file(caminho, as_attachment=True, download_name=f'relatorio{os.path.splitext(caminho)[1]}')
+
+def somente_admin(view):
+    """Restringe a rota aos e-mails em ADMINS; em modo debug fica liberada para qualquer usuário logado"""
+    @wraps(view)
+    def envoltorio(*args, **kwargs):
+        if not current_app.debug and getattr(current_user, 'email', None) not in current_app.config.get('ADMINS', ()):
+            return jsonify({'error': 'Acesso restrito a administradores'}), 403
+        return view(*args, **kwargs)
+    return envoltorio
+
+@dashboard_api.route('/sistema/pool')
+@login_required
+@somente_admin
+def get_pool_banco():
+    """Retorna o estado do pool de conexões do banco"""
+    try:
+        return jsonify(estatisticas_pool(db.engine))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@dashboard_api.route('/sistema/cache')
+@login_required
+@somente_admin
+def get_cache_respostas():
+    """Retorna acertos, falhas e taxa de acerto do cache de respostas por rota"""
+    try:
+        return jsonify(CACHE_RESPOSTAS.estatisticas())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
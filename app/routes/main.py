@@ -3,6 +3,9 @@ from flask_login import login_required, current_user, login_user, logout_user
 from datetime import datetime
 import random
 
+from app.utils.cache_http import VERSOES_DADOS, cache_http
+from app.utils.cache_respostas import CACHE_RESPOSTAS
+
 main_bp = Blueprint('main', __name__)
 
 # ===== DADOS FICTÍCIOS =====
@@ -145,6 +148,8 @@ def categorias():
 @login_required
 def create_categoria():
     """Cria nova categoria"""
+    VERSOES_DADOS.incrementar('categorias')
+    CACHE_RESPOSTAS.invalidar('categorias')
     flash('Categoria criada com sucesso!', 'success')
     return redirect(url_for('main.categorias'))
 
@@ -156,8 +161,8 @@ def despesas_receitas():
     """Página de gerenciamento de despesas e receitas"""
     # Buscar algumas transações da API fictícia
     try:
-        from app.routes.dashboard_api import TRANSACOES_FICTICIAS
-        transacoes = TRANSACOES_FICTICIAS[:20]
+        from app.routes.dashboard_api import TRANSACOES_FICTICIAS, enriquecer_categorias
+        transacoes = enriquecer_categorias(TRANSACOES_FICTICIAS.listar(0, 20))
     except ImportError:
         # Fallback com transações fictícias básicas
         transacoes = [
@@ -186,6 +191,7 @@ def despesas_receitas():
 # ===== ROTAS DE DICAS =====
 
 @main_bp.route('/dicas')
+@cache_http('dicas', pagina=True)
 def dicas():
     """Página de dicas financeiras"""
     return render_template('dicas.html', dicas=DICAS_FICTICIAS)
@@ -205,28 +211,22 @@ def show_dica(dica_id):
 @login_required
 def relatorio_mensal():
     """Página de relatório mensal"""
-    # Dados fictícios para relatório
+    from app.routes.dashboard_api import RELATORIO_COLUNAR, TRANSACOES_FICTICIAS
+    
+    hoje = datetime.now().date()
+    resumo = RELATORIO_COLUNAR.resumo_mes(current_user.id, hoje)
+    
+    maior_despesa = TRANSACOES_FICTICIAS.obter(resumo['maior_despesa_id']) if resumo['maior_despesa_id'] else None
     dados = {
-        'total_receitas': 4500.00,
-        'total_despesas': 2800.00,
-        'saldo_mes': 1700.00,
-        'maior_despesa': 'Aluguel - R$ 800,00',
-        'categoria_maior_gasto': 'Moradia'
+        'total_receitas': resumo['total_receitas'],
+        'total_despesas': resumo['total_despesas'],
+        'saldo_mes': resumo['saldo_mes'],
+        'maior_despesa': f"{maior_despesa['descricao']} - R$ " + f"{maior_despesa['valor']:.2f}".replace('.', ',') if maior_despesa else '-',
+        'categoria_maior_gasto': resumo['categoria_maior_gasto'] or '-'
     }
     
-    # Dados fictícios para o gráfico mensal - estrutura correta
-    dados_grafico = {
-        'labels': ['Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun'],
-        'categorias': ['Alimentação', 'Transporte', 'Moradia', 'Lazer', 'Outros'],
-        'cores': ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFD93D'],
-        'dados': {
-            'Alimentação': [450, 520, 480, 600, 550, 600],
-            'Transporte': [300, 280, 320, 350, 300, 400],
-            'Moradia': [800, 800, 800, 800, 800, 800],
-            'Lazer': [200, 150, 300, 250, 400, 300],
-            'Outros': [150, 200, 180, 220, 200, 700]
-        }
-    }
+    # Despesas do usuário por categoria nos últimos 6 meses
+    dados_grafico = RELATORIO_COLUNAR.relatorio_mensal(current_user.id, hoje, meses=6)
     
     return render_template('relatorio_mensal.html', dados=dados, dados_grafico=dados_grafico)
 
@@ -234,19 +234,10 @@ def relatorio_mensal():
 @login_required
 def relatorio_semanal():
     """Página de relatório semanal"""
-    # Dados fictícios para o gráfico semanal
-    dados_grafico = {
-        'labels': ['Sem 1', 'Sem 2', 'Sem 3', 'Sem 4'],
-        'categorias': ['Alimentação', 'Transporte', 'Moradia', 'Lazer', 'Outros'],
-        'cores': ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFD93D'],
-        'dados': {
-            'Alimentação': [120, 150, 130, 140],
-            'Transporte': [80, 90, 85, 95],
-            'Moradia': [800, 800, 800, 800],
-            'Lazer': [200, 150, 180, 170],
-            'Outros': [100, 80, 120, 90]
-        }
-    }
+    from app.routes.dashboard_api import RELATORIO_COLUNAR
+    
+    # Despesas por categoria nas últimas 4 semanas
+    dados_grafico = RELATORIO_COLUNAR.relatorio_semanal(current_user.id, datetime.now().date(), semanas=4)
     
     return render_template('relatorio_semanal.html', dados_grafico=dados_grafico)
 
@@ -254,21 +245,17 @@ def relatorio_semanal():
 @login_required
 def relatorio_diario():
     """Página de relatório diário"""
+    from app.routes.dashboard_api import RELATORIO_COLUNAR
+    
     data = request.args.get('data', datetime.now().strftime('%Y-%m-%d'))
+    try:
+        referencia = datetime.strptime(data, '%Y-%m-%d').date()
+    except ValueError:
+        referencia = datetime.now().date()
+        data = referencia.strftime('%Y-%m-%d')
     
-    # Dados fictícios para o gráfico diário
-    dados_grafico = {
-        'labels': ['Seg', 'Ter', 'Qua', 'Qui', 'Sex', 'Sáb', 'Dom'],
-        'categorias': ['Alimentação', 'Transporte', 'Moradia', 'Lazer', 'Outros'],
-        'cores': ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFD93D'],
-        'dados': {
-            'Alimentação': [25, 30, 20, 35, 40, 50, 30],
-            'Transporte': [15, 20, 10, 25, 30, 0, 0],
-            'Moradia': [0, 0, 800, 0, 0, 0, 0],
-            'Lazer': [0, 0, 0, 0, 80, 120, 60],
-            'Outros': [10, 5, 15, 20, 25, 30, 10]
-        }
-    }
+    # Despesas por categoria em cada dia da semana da data informada
+    dados_grafico = RELATORIO_COLUNAR.relatorio_diario(current_user.id, referencia)
     
     return render_template('relatorio_diario.html', data=data, dados_grafico=dados_grafico)
 
@@ -282,11 +269,14 @@ def configuracoes():
 
 @main_bp.route('/api/categorias')
 @login_required
+@cache_http('categorias')
 def api_categorias():
     """API para obter categorias do usuário"""
     return jsonify(CATEGORIAS_FICTICIAS)
 
 @main_bp.route('/api/dicas/random')
+# Sem ETag: cada requisição sorteia uma dica; o cliente reaproveita a sorteada por 1 minuto
+@cache_http('dicas', max_age=60, publico=True, etag=False)
 def api_dicas_random():
     """API para obter dicas aleatórias"""
     dica = random.choice(DICAS_FICTICIAS)
@@ -294,13 +284,16 @@ def api_dicas_random():
 
 @main_bp.route('/api/dashboard')
 @login_required
+@CACHE_RESPOSTAS.em_cache('transacoes')
 def api_dashboard():
     """API para dados do dashboard"""
     try:
         # Tentar importar dados das transações fictícias
         try:
-            from app.routes.dashboard_api import TRANSACOES_FICTICIAS
-            transacoes_recentes = TRANSACOES_FICTICIAS[:10]
+            from app.routes.dashboard_api import TRANSACOES_FICTICIAS, enriquecer_categorias
+            transacoes_recentes = enriquecer_categorias(
+                TRANSACOES_FICTICIAS.listar_por_usuario(current_user.id, 0, 10)
+            )
         except ImportError:
             transacoes_recentes = []
         
@@ -1,16 +1,8 @@
 # Serviços da aplicação
 from .base_service import BaseService
 from .perfil_service import PerfilService
-from .categoria_service import CategoriaService
-from .despesas_service import DespesaService
-from .dicas_service import DicaService
-from .dashboard_service import DashboardService
 
 __all__ = [
     'BaseService',
-    'PerfilService',
-    'CategoriaService',
-    'DespesaService', 
-    'DicaService',
-    'DashboardService'
+    'PerfilService'
 ]
@@ -40,6 +40,14 @@ class BaseService(ABC):
             self._log_error('GET_ALL', str(e))
             raise e
     
+    def get_dicts(self, datas_iso: bool = False, **filters) -> List[Dict]:
+        """Retorna os registros já serializados, sem criar instâncias do ORM"""
+        try:
+            return self.repository.get_dicts(datas_iso, **filters)
+        except Exception as e:
+            self._log_error('GET_DICTS', str(e))
+            raise e
+    
     def update(self, id: int, data: Dict) -> Optional[Any]:
         """Atualiza um registro"""
         try:
@@ -81,6 +89,14 @@ class BaseService(ABC):
             self._log_error('GET_PAGINATED', str(e))
             raise e
     
+    def get_keyset_paginated(self, cursor: str = None, per_page: int = 10, **kwargs) -> Dict:
+        """Retorna uma página a partir de um cursor (paginação por chave)"""
+        try:
+            return self.repository.get_keyset_paginated(cursor=cursor, per_page=per_page, **kwargs)
+        except Exception as e:
+            self._log_error('GET_KEYSET_PAGINATED', str(e))
+            raise e
+    
     def count(self) -> int:
         """Retorna a contagem total de registros"""
         try:
@@ -89,6 +105,14 @@ class BaseService(ABC):
             self._log_error('COUNT', str(e))
             raise e
     
+    def fast_count(self, **filters) -> int:
+        """Retorna a contagem em cache (aproximada), para paginação e totais exibidos"""
+        try:
+            return self.repository.fast_count(**filters)
+        except Exception as e:
+            self._log_error('FAST_COUNT', str(e))
+            raise e
+    
     # Métodos para serem implementados pelas classes filhas
     def _validate_create_data(self, data: Dict) -> None:
         """Valida os dados para criação (implementar nas classes filhas)"""
@@ -1,22 +1,44 @@
+from app import db
 from app.models.usuario import Usuario
-from app.models.caretaker_usuario import CaretakerUsuario
+from app.models.caretaker_usuario_persistente import CaretakerUsuarioPersistente
+from app.repositories.historico_usuario_repository import HistoricoUsuarioRepository
 from app.repositories.usuario_repository import UsuarioRepository
 
 
 class PerfilService:
-    """Serviço para gerenciar perfis de usuário com padrão Memento"""
+    """
+    Serviço para gerenciar perfis de usuário com padrão Memento
     
-    def __init__(self):
+    O caretaker padrão persiste o histórico de todos os usuários; um
+    CaretakerUsuario (em memória) guarda o histórico de um único usuário.
+    """
+    
+    # Campos do perfil que podem ser alterados (e desfeitos)
+    CAMPOS_PERFIL = ('nome', 'email', 'data_nascimento', 'telefone', 'endereco')
+    
+    def __init__(self, caretaker=None):
         self.usuario_repository = UsuarioRepository()
-        self.caretaker = CaretakerUsuario()
+        # Histórico persistido: compartilhado entre requisições e workers
+        self.caretaker = caretaker or CaretakerUsuarioPersistente(HistoricoUsuarioRepository())
     
     def obter_usuario_por_id(self, usuario_id):
         """Obtém um usuário pelo ID"""
-        pass
+        return self.usuario_repository.get_by_id(usuario_id)
     
     def atualizar_perfil(self, usuario_id, dados_atualizacao):
         """Atualiza o perfil do usuário salvando o estado anterior"""
-        pass
+        usuario = self.obter_usuario_por_id(usuario_id)
+        if not usuario:
+            return None
+        
+        # Primeiro salvamento: registra o estado original para poder desfazer
+        if self.caretaker.obter_memento_atual(usuario_id) is None:
+            self.caretaker.salvar_estado(usuario)
+        
+        dados = {campo: valor for campo, valor in dados_atualizacao.items() if campo in self.CAMPOS_PERFIL}
+        usuario = self.usuario_repository.update(usuario, **dados)
+        self.caretaker.salvar_estado(usuario)
+        return usuario
     
     def alterar_senha(self, usuario_id, senha_atual, nova_senha):
         """Altera a senha do usuário"""
@@ -33,24 +55,43 @@ class PerfilService:
     # Métodos relacionados ao padrão Memento
     def desfazer_alteracao(self, usuario_id):
         """Desfaz a última alteração no perfil do usuário"""
-        pass
+        return self._navegar_historico(usuario_id, self.caretaker.desfazer, self.caretaker.refazer)
     
     def refazer_alteracao(self, usuario_id):
         """Refaz uma alteração desfeita no perfil"""
-        pass
+        return self._navegar_historico(usuario_id, self.caretaker.refazer, self.caretaker.desfazer)
     
     def obter_historico_alteracoes(self, usuario_id):
         """Obtém o histórico de alterações do usuário"""
-        pass
+        return [memento.to_dict() for memento in self.caretaker.obter_historico(usuario_id)]
     
     def limpar_historico(self, usuario_id):
         """Limpa o histórico de alterações do usuário"""
-        pass
+        self.caretaker.limpar_historico(usuario_id)
     
     def pode_desfazer(self, usuario_id):
         """Verifica se é possível desfazer alterações"""
-        pass
+        return self.caretaker.pode_desfazer(usuario_id)
     
     def pode_refazer(self, usuario_id):
         """Verifica se é possível refazer alterações"""
-        pass
\ No newline at end of file
+        return self.caretaker.pode_refazer(usuario_id)
+    
+    def _navegar_historico(self, usuario_id, operacao, inversa):
+        """
+        Aplica desfazer/refazer e grava o estado restaurado no banco
+        
+        O histórico e o usuário ficam em bancos diferentes, sem transação
+        comum: se a gravação do usuário falhar, a operação inversa devolve a
+        posição do histórico ao estado que continua gravado.
+        """
+        usuario = self.obter_usuario_por_id(usuario_id)
+        if not usuario or not operacao(usuario):
+            return None
+        try:
+            return self.usuario_repository.update(usuario)
+        except Exception:
+            inversa(usuario)
+            # Descarta os valores restaurados na instância; o banco não mudou
+            db.session.expire(usuario)
+            raise
\ No newline at end of file
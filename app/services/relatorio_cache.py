@@ -0,0 +1,170 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config.settings import DATA_DIR
+
+# Tamanho máximo padrão do diretório de cache (bytes)
+TAMANHO_MAXIMO_PADRAO = 512 * 1024 * 1024
+
+
+class CacheRelatorios:
+    """
+    Cache de arquivos de relatório endereçado pelo conteúdo da requisição
+
+    A chave é o SHA-256 de (usuário, estratégia, filtros, versão dos dados):
+    o mesmo relatório com os mesmos dados sempre gera o mesmo arquivo, que é
+    reaproveitado em vez de renderizado de novo. A própria chave serve de
+    ETag forte. O diretório é limitado em bytes e os arquivos menos usados
+    recentemente (pela data de modificação, atualizada a cada acerto) são
+    removidos primeiro; o arquivo que acabou de ser gerado nunca é removido,
+    mesmo que sozinho passe do limite.
+    """
+
+    def __init__(self, diretorio: Optional[str] = None, tamanho_maximo: int = TAMANHO_MAXIMO_PADRAO):
+        """
+        Inicializa o cache
+
+        Args:
+            diretorio (str): Diretório dos arquivos em cache
+            tamanho_maximo (int): Tamanho máximo do diretório em bytes
+        """
+        self.diretorio = diretorio or os.path.join(DATA_DIR, 'cache_relatorios')
+        self.tamanho_maximo = tamanho_maximo
+        os.makedirs(self.diretorio, exist_ok=True)
+        # chave -> [trava, threads usando a trava]; a entrada sai quando ninguém mais a usa
+        self._travas: Dict[str, List] = {}
+        self._trava_global = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+
+    @staticmethod
+    def gerar_chave(usuario_id, estrategia: str, filtros: Optional[dict], versao_dados) -> str:
+        """Calcula a chave do relatório a partir dos parâmetros que determinam seu conteúdo"""
+        canonico = json.dumps(
+            [usuario_id, estrategia, filtros or {}, versao_dados],
+            sort_keys=True, separators=(',', ':'), default=str
+        )
+        return hashlib.sha256(canonico.encode('utf-8')).hexdigest()
+
+    def caminho(self, chave: str, extensao: str) -> str:
+        """Retorna o caminho do arquivo de uma chave"""
+        return os.path.join(self.diretorio, f'{chave}.{extensao}')
+
+    def obter(self, chave: str, extensao: str) -> Optional[str]:
+        """Retorna o arquivo em cache (marcando-o como usado) ou None"""
+        caminho = self.caminho(chave, extensao)
+        try:
+            os.utime(caminho)
+        except FileNotFoundError:
+            return None
+        return caminho
+
+    def obter_ou_gerar(self, chave: str, extensao: str, gerar: Callable[[str], Optional[str]]) -> Tuple[Optional[str], bool]:
+        """
+        Retorna o arquivo em cache ou o gera
+
+        O arquivo é gerado em um nome temporário e movido atomicamente para o
+        destino, então requisições concorrentes nunca leem um arquivo parcial.
+        Dentro do processo, apenas uma thread gera cada chave.
+
+        Args:
+            chave (str): Chave calculada por gerar_chave
+            extensao (str): Extensão do arquivo
+            gerar (Callable): Recebe o caminho de destino e grava o relatório nele
+
+        Returns:
+            Tuple[str, bool]: Caminho do arquivo (None se nada foi gerado) e se veio do cache
+        """
+        caminho = self.obter(chave, extensao)
+        if caminho:
+            self.acertos += 1
+            return caminho, True
+
+        with self._travar_chave(chave):
+            # Outra thread pode ter gerado o arquivo enquanto esperávamos
+            caminho = self.obter(chave, extensao)
+            if caminho:
+                self.acertos += 1
+                return caminho, True
+
+            self.falhas += 1
+            descritor, temporario = tempfile.mkstemp(dir=self.diretorio, suffix=f'.{extensao}.tmp')
+            os.close(descritor)
+            try:
+                if gerar(temporario) is None:
+                    return None, False
+                caminho = self.caminho(chave, extensao)
+                os.replace(temporario, caminho)
+            finally:
+                if os.path.exists(temporario):
+                    os.remove(temporario)
+
+        self._remover_excedentes(manter=caminho)
+        return caminho, False
+
+    def invalidar(self, chave: str, extensao: str) -> None:
+        """Remove o arquivo de uma chave"""
+        try:
+            os.remove(self.caminho(chave, extensao))
+        except FileNotFoundError:
+            pass
+
+    def estatisticas(self) -> dict:
+        """Retorna acertos, falhas e ocupação do cache"""
+        arquivos = self._listar_arquivos()
+        total = self.acertos + self.falhas
+        return {
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'taxa_acerto': round(self.acertos / total, 4) if total else 0.0,
+            'arquivos': len(arquivos),
+            'bytes': sum(tamanho for _, tamanho, _ in arquivos),
+            'tamanho_maximo': self.tamanho_maximo
+        }
+
+    @contextmanager
+    def _travar_chave(self, chave: str):
+        """Segura a trava da chave, descartando-a quando a última thread que a usa termina"""
+        with self._trava_global:
+            entrada = self._travas.setdefault(chave, [threading.Lock(), 0])
+            entrada[1] += 1
+        try:
+            with entrada[0]:
+                yield
+        finally:
+            with self._trava_global:
+                entrada[1] -= 1
+                if entrada[1] == 0:
+                    del self._travas[chave]
+
+    def _listar_arquivos(self):
+        arquivos = []
+        with os.scandir(self.diretorio) as entradas:
+            for entrada in entradas:
+                if entrada.is_file() and not entrada.name.endswith('.tmp'):
+                    info = entrada.stat()
+                    arquivos.append((entrada.path, info.st_size, info.st_mtime))
+        return arquivos
+
+    def _remover_excedentes(self, manter: Optional[str] = None) -> None:
+        """Remove os arquivos usados há mais tempo até caber no tamanho máximo, exceto `manter`"""
+        arquivos = self._listar_arquivos()
+        total = sum(tamanho for _, tamanho, _ in arquivos)
+        if total <= self.tamanho_maximo:
+            return
+
+        for caminho, tamanho, _ in sorted(arquivos, key=lambda arquivo: arquivo[2]):
+            if caminho == manter:
+                continue
+            try:
+                os.remove(caminho)
+            except FileNotFoundError:
+                pass
+            total -= tamanho
+            if total <= self.tamanho_maximo:
+                break
@@ -0,0 +1,350 @@
+import importlib
+import json
+import multiprocessing
+import os
+import sqlite3
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from app.utils.banco import leitura_replica
+from config.settings import DATA_DIR
+
+PENDENTE = 'pendente'
+EXECUTANDO = 'executando'
+CONCLUIDO = 'concluido'
+ERRO = 'erro'
+
+# formato -> (classe da estratégia, extensão do arquivo)
+ESTRATEGIAS = {
+    'csv': ('RelatorioCsvStrategy', 'csv'),
+    'excel': ('RelatorioExcelStrategy', 'xlsx'),
+    'pdf': ('RelatorioPdfStrategy', 'pdf'),
+}
+
+# Frequência (em linhas) com que o progresso é gravado no banco
+INTERVALO_PROGRESSO = 1000
+
+# Jobs pendentes/em execução sem atualização há mais que isso são considerados
+# órfãos (worker encerrado) e retomados na inicialização da fila
+EXPIRACAO_JOB = timedelta(minutes=15)
+MAX_TENTATIVAS = 3
+
+# nome -> função que retorna as linhas do relatório
+CONSULTAS_RELATORIO: Dict[str, Callable] = {}
+
+# Aplicação Flask de um processo do pool, criada no primeiro job que ele executa
+_APLICACAO_DO_PROCESSO = None
+
+
+def registrar_consulta(nome: str):
+    """
+    Registra uma função como consulta de relatório
+
+    Os jobs guardam apenas o nome; somente funções registradas por este
+    decorador podem ser executadas pela fila.
+
+        @registrar_consulta('transacoes_periodo')
+        def transacoes_periodo(usuario_id, inicio, fim):
+            ...
+    """
+    def decorar(funcao: Callable) -> Callable:
+        existente = CONSULTAS_RELATORIO.get(nome)
+        if existente is not None and existente is not funcao:
+            raise ValueError(f'Consulta de relatório já registrada: {nome}')
+        CONSULTAS_RELATORIO[nome] = funcao
+        return funcao
+    return decorar
+
+
+@contextmanager
+def _conectar(caminho_banco: str):
+    """Abre uma conexão, confirma a transação ao final e fecha a conexão"""
+    conexao = sqlite3.connect(caminho_banco, timeout=30)
+    conexao.row_factory = sqlite3.Row
+    try:
+        with conexao:
+            yield conexao
+    finally:
+        conexao.close()
+
+
+def _atualizar_job(caminho_banco: str, job_id: str, **campos) -> None:
+    campos['atualizado_em'] = datetime.now().isoformat()
+    atribuicoes = ', '.join(f'{campo} = ?' for campo in campos)
+    with _conectar(caminho_banco) as conexao:
+        conexao.execute(f'UPDATE relatorio_jobs SET {atribuicoes} WHERE id = ?', (*campos.values(), job_id))
+
+
+def _carregar_consulta(nome: str, modulo: str) -> Callable:
+    """
+    Resolve uma consulta registrada
+
+    No processo do pool o registro começa vazio; `modulo` é o módulo que
+    registrou a consulta no processo web (nunca um valor vindo do job), e
+    importá-lo executa o @registrar_consulta.
+    """
+    if nome not in CONSULTAS_RELATORIO:
+        importlib.import_module(modulo)
+    try:
+        return CONSULTAS_RELATORIO[nome]
+    except KeyError:
+        raise ValueError(f'Consulta de relatório não registrada: {nome}')
+
+
+def _aplicacao_do_processo():
+    """Aplicação usada pelos jobs de um processo do pool (que não herda a do processo web)"""
+    global _APLICACAO_DO_PROCESSO
+    if _APLICACAO_DO_PROCESSO is None:
+        from app import create_app
+        _APLICACAO_DO_PROCESSO = create_app()
+    return _APLICACAO_DO_PROCESSO
+
+
+def _contar_progresso(linhas, caminho_banco: str, job_id: str):
+    """Repassa as linhas gravando periodicamente quantas já foram processadas"""
+    processadas = 0
+    for linha in linhas:
+        yield linha
+        processadas += 1
+        if processadas % INTERVALO_PROGRESSO == 0:
+            _atualizar_job(caminho_banco, job_id, progresso=processadas)
+    _atualizar_job(caminho_banco, job_id, progresso=processadas)
+
+
+def executar_job(caminho_banco: str, job_id: str, formato: str, consulta: str, modulo: str,
+                 parametros: dict, caminho_arquivo: str, aplicacao=None) -> None:
+    """
+    Executa um job de relatório (roda em um processo ou thread do pool)
+
+    A consulta registrada é chamada com os parâmetros, dentro de um contexto
+    da aplicação, e deve retornar um iterável de dicionários, que é repassado
+    à estratégia do formato escolhido. Sem `aplicacao` (processo do pool),
+    o processo cria a sua própria com create_app.
+    """
+    from app.repositories import strategies
+
+    _atualizar_job(caminho_banco, job_id, status=EXECUTANDO)
+    try:
+        classe, _ = ESTRATEGIAS[formato]
+        estrategia = getattr(strategies, classe)()
+        with (aplicacao or _aplicacao_do_processo()).app_context(), leitura_replica():
+            linhas = _carregar_consulta(consulta, modulo)(**parametros)
+            resultado = estrategia.gerar_relatorio(
+                _contar_progresso(linhas, caminho_banco, job_id),
+                nome_arquivo=caminho_arquivo
+            )
+        if resultado is None:
+            _atualizar_job(caminho_banco, job_id, status=ERRO, erro='Nenhum relatório gerado')
+        else:
+            _atualizar_job(caminho_banco, job_id, status=CONCLUIDO, arquivo=resultado)
+    except Exception as e:
+        _atualizar_job(caminho_banco, job_id, status=ERRO, erro=str(e))
+
+
+class FilaRelatorios:
+    """
+    Fila de geração de relatórios em segundo plano
+
+    Os jobs são registrados em uma tabela SQLite (compartilhada entre os
+    workers da aplicação) e executados em um pool de processos, liberando
+    os workers web durante a renderização de PDF/Excel. Consultas que leem
+    dados mantidos na memória do processo web precisam do pool de threads
+    (processos=False), que executa os jobs no contexto da própria aplicação.
+
+    Cada job guarda o nome da consulta e os parâmetros, de modo que os jobs
+    órfãos (pendentes ou em execução quando o worker morreu) são retomados
+    quando uma fila é criada; depois de MAX_TENTATIVAS, ou se a consulta não
+    estiver mais registrada, o job é marcado como erro.
+    """
+
+    def __init__(self, diretorio: Optional[str] = None, max_processos: int = 2,
+                 expiracao: timedelta = EXPIRACAO_JOB, retomar: bool = True,
+                 processos: bool = True, aplicacao=None):
+        """
+        Inicializa a fila
+
+        Args:
+            diretorio (str): Diretório do banco da fila e dos arquivos gerados
+            max_processos (int): Quantidade de processos (ou threads) do pool
+            expiracao (timedelta): Tempo sem atualização para um job ser considerado órfão
+            retomar (bool): Retoma os jobs órfãos na inicialização
+            processos (bool): Executa os jobs em processos; False usa threads
+            aplicacao (Flask): Aplicação cujo contexto os jobs em threads usam
+        """
+        self.diretorio = diretorio or os.path.join(DATA_DIR, 'relatorios')
+        os.makedirs(self.diretorio, exist_ok=True)
+        self.caminho_banco = os.path.join(self.diretorio, 'jobs.db')
+        self._max_processos = max_processos
+        self._expiracao = expiracao
+        self._processos = processos
+        self._aplicacao = aplicacao
+        self._executor: Optional[Executor] = None
+        self._criar_tabela()
+        if retomar:
+            self.retomar_orfaos()
+
+    def enviar(self, formato: str, consulta: str, parametros: Optional[Dict] = None,
+               usuario_id: Optional[int] = None) -> str:
+        """
+        Enfileira a geração de um relatório
+
+        Args:
+            formato (str): 'csv', 'excel' ou 'pdf'
+            consulta (str): Nome de uma consulta registrada com @registrar_consulta
+            parametros (dict): Argumentos nomeados da consulta (serializáveis em JSON)
+            usuario_id (int): Dono do relatório
+
+        Returns:
+            str: ID do job
+        """
+        if formato not in ESTRATEGIAS:
+            raise ValueError(f'Formato de relatório inválido: {formato}')
+        if consulta not in CONSULTAS_RELATORIO:
+            raise ValueError(f'Consulta de relatório não registrada: {consulta}')
+
+        job_id = uuid.uuid4().hex
+        parametros = parametros or {}
+        agora = datetime.now().isoformat()
+
+        with _conectar(self.caminho_banco) as conexao:
+            conexao.execute(
+                'INSERT INTO relatorio_jobs (id, usuario_id, formato, consulta, parametros, status, progresso, '
+                'criado_em, atualizado_em) VALUES (?, ?, ?, ?, ?, ?, 0, ?, ?)',
+                (job_id, usuario_id, formato, consulta, json.dumps(parametros), PENDENTE, agora, agora)
+            )
+
+        self._submeter(job_id, formato, consulta, parametros)
+        return job_id
+
+    def retomar_orfaos(self) -> int:
+        """
+        Reenfileira os jobs pendentes ou em execução sem atualização há mais que a expiração
+
+        Cada job é reivindicado com um UPDATE condicional, então vários workers
+        iniciando juntos não executam o mesmo job duas vezes.
+
+        Returns:
+            int: Quantidade de jobs reenfileirados
+        """
+        limite = (datetime.now() - self._expiracao).isoformat()
+        with _conectar(self.caminho_banco) as conexao:
+            orfaos = conexao.execute(
+                'SELECT * FROM relatorio_jobs WHERE status IN (?, ?) AND atualizado_em < ?',
+                (PENDENTE, EXECUTANDO, limite)
+            ).fetchall()
+
+        retomados = 0
+        for job in orfaos:
+            agora = datetime.now().isoformat()
+            expirado = job['tentativas'] + 1 >= MAX_TENTATIVAS or job['consulta'] not in CONSULTAS_RELATORIO
+            with _conectar(self.caminho_banco) as conexao:
+                reivindicado = conexao.execute(
+                    'UPDATE relatorio_jobs SET status = ?, erro = ?, tentativas = tentativas + 1, '
+                    'progresso = 0, atualizado_em = ? WHERE id = ? AND atualizado_em = ?',
+                    (ERRO if expirado else PENDENTE, 'Job expirado sem conclusão' if expirado else None,
+                     agora, job['id'], job['atualizado_em'])
+                ).rowcount
+            if reivindicado and not expirado:
+                self._submeter(job['id'], job['formato'], job['consulta'], json.loads(job['parametros'] or '{}'))
+                retomados += 1
+        return retomados
+
+    def obter(self, job_id: str, usuario_id: Optional[int] = None) -> Optional[dict]:
+        """
+        Retorna status, progresso e erro do job
+
+        Args:
+            job_id (str): ID do job
+            usuario_id (int): Se informado, só retorna o job desse dono
+
+        Returns:
+            dict: Linha do job, ou None se não existir (ou for de outro usuário)
+        """
+        consulta, parametros = 'SELECT * FROM relatorio_jobs WHERE id = ?', (job_id,)
+        if usuario_id is not None:
+            consulta, parametros = consulta + ' AND usuario_id = ?', (job_id, usuario_id)
+        with _conectar(self.caminho_banco) as conexao:
+            linha = conexao.execute(consulta, parametros).fetchone()
+        return dict(linha) if linha else None
+
+    def listar(self, usuario_id: int) -> List[dict]:
+        """Retorna os jobs de um usuário, do mais recente para o mais antigo"""
+        with _conectar(self.caminho_banco) as conexao:
+            linhas = conexao.execute(
+                'SELECT * FROM relatorio_jobs WHERE usuario_id = ? ORDER BY criado_em DESC',
+                (usuario_id,)
+            ).fetchall()
+        return [dict(linha) for linha in linhas]
+
+    def caminho_arquivo(self, job_id: str, usuario_id: Optional[int] = None) -> Optional[str]:
+        """Retorna o arquivo gerado se o job estiver concluído (e for do usuário, se informado)"""
+        job = self.obter(job_id, usuario_id)
+        if not job or job['status'] != CONCLUIDO:
+            return None
+        return job['arquivo']
+
+    def encerrar(self, aguardar: bool = True) -> None:
+        """Encerra o pool de processos"""
+        if self._executor:
+            self._executor.shutdown(wait=aguardar)
+            self._executor = None
+
+    def _submeter(self, job_id: str, formato: str, consulta: str, parametros: dict) -> None:
+        _, extensao = ESTRATEGIAS[formato]
+        caminho_arquivo = os.path.join(self.diretorio, f'{job_id}.{extensao}')
+        modulo = CONSULTAS_RELATORIO[consulta].__module__
+        argumentos = (self.caminho_banco, job_id, formato, consulta, modulo, parametros, caminho_arquivo)
+        if not self._processos:
+            # A aplicação não é serializável: só segue para jobs em threads
+            argumentos += (self._aplicacao,)
+        self._obter_executor().submit(executar_job, *argumentos)
+
+    def _obter_executor(self) -> Executor:
+        if self._executor is None:
+            if self._processos:
+                # 'spawn' evita herdar threads e conexões do processo web
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_processos,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_processos, thread_name_prefix='relatorios'
+                )
+        return self._executor
+
+    def _criar_tabela(self) -> None:
+        with _conectar(self.caminho_banco) as conexao:
+            conexao.execute('PRAGMA journal_mode=WAL')
+            conexao.execute(
+                'CREATE TABLE IF NOT EXISTS relatorio_jobs ('
+                ' id TEXT PRIMARY KEY,'
+                ' usuario_id INTEGER,'
+                ' formato TEXT NOT NULL,'
+                ' consulta TEXT,'
+                ' parametros TEXT,'
+                ' tentativas INTEGER NOT NULL DEFAULT 0,'
+                ' status TEXT NOT NULL,'
+                ' progresso INTEGER NOT NULL DEFAULT 0,'
+                ' arquivo TEXT,'
+                ' erro TEXT,'
+                ' criado_em TEXT NOT NULL,'
+                ' atualizado_em TEXT NOT NULL)'
+            )
+            # Bancos criados antes de a fila guardar a consulta dos jobs
+            colunas = {linha['name'] for linha in conexao.execute('PRAGMA table_info(relatorio_jobs)')}
+            for coluna, definicao in (('consulta', 'TEXT'), ('parametros', 'TEXT'),
+                                      ('tentativas', 'INTEGER NOT NULL DEFAULT 0')):
+                if coluna not in colunas:
+                    conexao.execute(f'ALTER TABLE relatorio_jobs ADD COLUMN {coluna} {definicao}')
+            conexao.execute(
+                'CREATE INDEX IF NOT EXISTS ix_relatorio_jobs_usuario '
+                'ON relatorio_jobs (usuario_id, criado_em)'
+            )
+            conexao.execute(
+                'CREATE INDEX IF NOT EXISTS ix_relatorio_jobs_status '
+                'ON relatorio_jobs (status, atualizado_em)'
+            )
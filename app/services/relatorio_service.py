@@ -1,10 +1,15 @@
 from app.repositories.strategies.estrategia_relatorio import RelatorioStrategy
+from app.utils.banco import leitura_replica
+from app.services.relatorio_cache import CacheRelatorios
+from app.services.relatorio_jobs import FilaRelatorios
 
 class RelatoriosService:
     """Serviço para geração de relatórios usando o padrão Strategy."""
     
-    def __init__(self):
+    def __init__(self, fila: FilaRelatorios = None, cache: CacheRelatorios = None):
         self._strategy = None
+        self._fila = fila
+        self._cache = cache
 
     def set_strategy(self, strategy: RelatorioStrategy):
         """Define a estratégia de geração de relatório."""
@@ -16,4 +21,78 @@ class RelatoriosService:
             print("Nenhuma estratégia de relatório definida!")
             return
         
-        self._strategy.gerar_relatorio(dados)
\ No newline at end of file
+        return self._strategy.gerar_relatorio(dados)
+
+    def gerar_com_cache(self, usuario_id, filtros, versao_dados, obter_dados):
+        """
+        Gera o relatório reaproveitando o arquivo em cache, se existir.
+
+        `obter_dados` só é chamado quando o relatório não está em cache.
+
+        Returns:
+            tuple: (caminho do arquivo, ETag) ou (None, None) se nada foi gerado
+        """
+        if not self._strategy:
+            print("Nenhuma estratégia de relatório definida!")
+            return None, None
+        
+        if self._cache is None:
+            self._cache = CacheRelatorios()
+        
+        chave = CacheRelatorios.gerar_chave(
+            usuario_id, type(self._strategy).__name__, filtros, versao_dados
+        )
+        caminho, _ = self._cache.obter_ou_gerar(
+            chave,
+            self._strategy.extensao,
+            lambda destino: self._gerar_na_replica(obter_dados, destino)
+        )
+        return (caminho, chave) if caminho else (None, None)
+
+    def _gerar_na_replica(self, obter_dados, destino):
+        """Gera o arquivo lendo os dados da réplica (as linhas podem ser consumidas sob demanda)"""
+        with leitura_replica():
+            return self._strategy.gerar_relatorio(obter_dados(), nome_arquivo=destino)
+
+    def enviar_arquivo(self, caminho, etag, nome_download=None, max_age=0):
+        """
+        Monta a resposta Flask do arquivo com ETag e suporte a GET condicional.
+
+        Requisições com If-None-Match igual ao ETag recebem 304 sem corpo.
+        """
+        from flask import send_file
+        
+        return send_file(
+            caminho,
+            mimetype=self._strategy.mimetype if self._strategy else None,
+            as_attachment=True,
+            download_name=nome_download or f'relatorio.{self._strategy.extensao}',
+            etag=etag,
+            conditional=True,
+            max_age=max_age
+        )
+
+    # Geração em segundo plano
+
+    def enviar(self, formato, consulta, parametros=None, usuario_id=None):
+        """
+        Enfileira a geração do relatório e retorna o ID do job.
+
+        A consulta é o nome de uma função registrada com @registrar_consulta
+        (app.services.relatorio_jobs); ela é executada no pool da fila,
+        então apenas seu nome e parâmetros ficam gravados no job.
+        """
+        return self._obter_fila().enviar(formato, consulta, parametros, usuario_id)
+
+    def status(self, job_id, usuario_id):
+        """Retorna status e progresso de um job do usuário (ou None se não existir)."""
+        return self._obter_fila().obter(job_id, usuario_id)
+
+    def arquivo(self, job_id, usuario_id):
+        """Retorna o caminho do arquivo gerado, se o job do usuário estiver concluído."""
+        return self._obter_fila().caminho_arquivo(job_id, usuario_id)
+
+    def _obter_fila(self):
+        if self._fila is None:
+            self._fila = FilaRelatorios()
+        return self._fila
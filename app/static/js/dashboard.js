@@ -1,10 +1,16 @@
 // ===== DASHBOARD SPECIFIC FUNCTIONALITY =====
 
+// Tamanho de transacoes_recentes em /dashboard/resumo
+const LIMITE_TRANSACOES_RECENTES = 10;
+
 class DashboardManager {
     constructor() {
         this.api = window.api;
         this.charts = {};
         this.refreshInterval = null;
+        this.eventSource = null;
+        this.summary = null;
+        this.recentTransactions = [];
         
         this.init();
     }
@@ -23,6 +29,8 @@ class DashboardManager {
             
             // Carregar dados do dashboard
             const dashboardData = await this.api.get('/dashboard/resumo');
+            this.summary = dashboardData;
+            this.recentTransactions = dashboardData.transacoes_recentes || [];
             
             this.updateSummaryCards(dashboardData);
             this.updateTransactionsList(dashboardData.transacoes_recentes);
@@ -327,6 +335,12 @@ class DashboardManager {
 
     // ===== AUTO REFRESH =====
     startAutoRefresh() {
+        // Atualizações em tempo real pelo servidor (SSE); polling só sem suporte a EventSource
+        if (window.EventSource) {
+            this.startLiveUpdates();
+            return;
+        }
+
         // Atualizar dados a cada 5 minutos
         this.refreshInterval = setInterval(() => {
             this.loadDashboardData();
@@ -338,6 +352,75 @@ class DashboardManager {
             clearInterval(this.refreshInterval);
             this.refreshInterval = null;
         }
+        if (this.eventSource) {
+            this.eventSource.close();
+            this.eventSource = null;
+        }
+    }
+
+    startLiveUpdates() {
+        this.eventSource = new EventSource('/api/dashboard/eventos');
+        let connected = false;
+
+        this.eventSource.addEventListener('open', () => {
+            // Após uma reconexão, eventos podem ter sido perdidos: recarregar tudo
+            if (connected) this.loadDashboardData();
+            connected = true;
+        });
+
+        ['transacao_criada', 'transacao_atualizada', 'transacao_excluida'].forEach(type => {
+            this.eventSource.addEventListener(type, (e) => this.applyDelta(JSON.parse(e.data)));
+        });
+        ['transacoes_importadas', 'resincronizar'].forEach(type => {
+            this.eventSource.addEventListener(type, () => this.loadDashboardData());
+        });
+    }
+
+    applyDelta(delta) {
+        if (!this.summary) return;
+
+        // Saldo acompanha a variação de receitas - despesas do mês
+        const resultadoAnterior = (this.summary.receitas_mes || 0) - (this.summary.despesas_mes || 0);
+        const resultadoAtual = delta.resumo.receitas_mes - delta.resumo.despesas_mes;
+        this.summary = {
+            ...this.summary,
+            receitas_mes: delta.resumo.receitas_mes,
+            despesas_mes: delta.resumo.despesas_mes,
+            saldo_atual: (this.summary.saldo_atual || 0) + resultadoAtual - resultadoAnterior
+        };
+        this.updateSummaryCards(this.summary);
+
+        // Com a lista cheia, transações fora dela podem ocupar a vaga aberta
+        // por uma exclusão (ou por uma edição que tornou a transação mais antiga)
+        const listaCompleta = this.recentTransactions.length < LIMITE_TRANSACOES_RECENTES;
+        let transacoes = this.recentTransactions;
+        if (delta.tipo === 'transacao_excluida') {
+            transacoes = transacoes.filter(t => t.id !== delta.id);
+            if (!listaCompleta && transacoes.length < this.recentTransactions.length) {
+                this.loadDashboardData();
+                return;
+            }
+        } else {
+            transacoes = this.insertByDate(transacoes.filter(t => t.id !== delta.transacao.id), delta.transacao);
+            const ultima = transacoes[transacoes.length - 1];
+            if (delta.tipo === 'transacao_atualizada' && !listaCompleta && ultima.id === delta.transacao.id
+                && transacoes.length <= LIMITE_TRANSACOES_RECENTES) {
+                this.loadDashboardData();
+                return;
+            }
+        }
+        this.recentTransactions = transacoes.slice(0, LIMITE_TRANSACOES_RECENTES);
+        this.updateTransactionsList(this.recentTransactions);
+    }
+
+    insertByDate(transacoes, transacao) {
+        // Mesma ordem de /dashboard/resumo: data decrescente, desempate pelo id
+        const maisRecente = (a, b) =>
+            a.data_transacao > b.data_transacao || (a.data_transacao === b.data_transacao && a.id > b.id);
+        const posicao = transacoes.findIndex(t => maisRecente(transacao, t));
+        return posicao === -1
+            ? [...transacoes, transacao]
+            : [...transacoes.slice(0, posicao), transacao, ...transacoes.slice(posicao)];
     }
 
     // ===== LOADING STATES =====
@@ -0,0 +1,10 @@
+# Stores em memória da aplicação
+from .transacao_store import TransacaoStore
+from .agregados_transacoes import AgregadosTransacoes
+from .relatorio_colunar import RelatorioColunar
+
+__all__ = [
+    'TransacaoStore',
+    'AgregadosTransacoes',
+    'RelatorioColunar'
+]
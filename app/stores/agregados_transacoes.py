@@ -0,0 +1,125 @@
+import threading
+from typing import Dict, Optional, Tuple
+
+from .sincronizacao import nova_trava, sincronizado
+
+
+class AgregadosTransacoes:
+    """
+    Totais acumulados das transações, mantidos incrementalmente
+
+    Cada escrita (criação, atualização ou exclusão) ajusta os totais em O(1),
+    de modo que o dashboard consulta receitas/despesas sem percorrer as transações.
+    Os totais são atribuídos ao dono gravado na própria transação ('usuario_id').
+
+    Totais mantidos:
+    - Por usuário e mês
+    - Por usuário, mês e categoria
+    - Por usuário (geral)
+    """
+
+    def __init__(self, trava: Optional[threading.RLock] = None):
+        """
+        Inicializa os totais
+
+        Args:
+            trava (RLock): Trava compartilhada com outros stores (opcional)
+        """
+        self._trava = nova_trava(trava)
+        self._por_mes: Dict[Tuple[int, str], Dict[str, float]] = {}
+        self._por_categoria: Dict[Tuple[int, str], Dict[int, Dict[str, float]]] = {}
+        self._por_usuario: Dict[int, Dict[str, float]] = {}
+
+    @staticmethod
+    def chave_mes(data_transacao: str) -> str:
+        """Retorna o mês ('AAAA-MM') de uma data em formato ISO"""
+        return data_transacao[:7]
+
+    # ===== ESCRITA =====
+
+    @sincronizado
+    def registrar(self, transacao: dict) -> None:
+        """Soma uma transação aos totais do seu dono (transacao['usuario_id'])"""
+        self._aplicar(transacao, 1)
+
+    @sincronizado
+    def remover(self, transacao: dict) -> None:
+        """Subtrai uma transação dos totais do seu dono"""
+        self._aplicar(transacao, -1)
+
+    @sincronizado
+    def substituir(self, anterior: dict, atual: dict) -> None:
+        """Ajusta os totais após a atualização de uma transação (inclusive troca de dono)"""
+        self.remover(anterior)
+        self.registrar(atual)
+
+    # ===== LEITURA =====
+
+    @sincronizado
+    def totais_mes(self, usuario_id: int, mes: str) -> Dict[str, float]:
+        """
+        Retorna os totais de um mês
+
+        Args:
+            usuario_id (int): ID do usuário
+            mes (str): Mês no formato 'AAAA-MM'
+
+        Returns:
+            Dict[str, float]: receitas, despesas e quantidade de transações
+        """
+        return self._arredondar(self._por_mes.get((usuario_id, mes)))
+
+    @sincronizado
+    def totais_por_categoria(self, usuario_id: int, mes: str) -> Dict[int, Dict[str, float]]:
+        """Retorna os totais do mês agrupados por categoria_id"""
+        categorias = self._por_categoria.get((usuario_id, mes), {})
+        return {
+            categoria_id: self._arredondar(totais)
+            for categoria_id, totais in categorias.items()
+        }
+
+    @sincronizado
+    def totais_usuario(self, usuario_id: int) -> Dict[str, float]:
+        """Retorna os totais gerais do usuário"""
+        return self._arredondar(self._por_usuario.get(usuario_id))
+
+    # ===== AUXILIARES =====
+
+    def _aplicar(self, transacao: dict, sinal: int) -> None:
+        usuario_id = transacao['usuario_id']
+        campo = 'receitas' if transacao['tipo'] == 'receita' else 'despesas'
+        valor = sinal * transacao['valor']
+        mes = self.chave_mes(transacao['data_transacao'])
+
+        self._somar(self._por_mes, (usuario_id, mes), campo, valor, sinal)
+        self._somar(self._por_usuario, usuario_id, campo, valor, sinal)
+
+        categorias = self._por_categoria.setdefault((usuario_id, mes), {})
+        self._somar(categorias, transacao['categoria_id'], campo, valor, sinal)
+        if not categorias:
+            del self._por_categoria[(usuario_id, mes)]
+
+    def _somar(self, destino: dict, chave, campo: str, valor: float, sinal: int) -> None:
+        totais = destino.setdefault(chave, self._vazio())
+        totais[campo] += valor
+        totais['quantidade'] += sinal
+        # Descarta chaves sem transações para não acumular resíduos de ponto flutuante
+        if totais['quantidade'] <= 0:
+            del destino[chave]
+
+    @staticmethod
+    def _vazio() -> Dict[str, float]:
+        return {'receitas': 0.0, 'despesas': 0.0, 'quantidade': 0}
+
+    @staticmethod
+    def _arredondar(totais) -> Dict[str, float]:
+        if not totais:
+            return {'receitas': 0.0, 'despesas': 0.0, 'quantidade': 0}
+        return {
+            'receitas': round(totais['receitas'], 2),
+            'despesas': round(totais['despesas'], 2),
+            'quantidade': totais['quantidade']
+        }
+
+    def __repr__(self) -> str:
+        return f"AgregadosTransacoes(usuarios={len(self._por_usuario)}, meses={len(self._por_mes)})"
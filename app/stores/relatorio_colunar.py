@@ -0,0 +1,257 @@
+import threading
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .sincronizacao import nova_trava, sincronizado
+
+MESES_ABREVIADOS = ['Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun', 'Jul', 'Ago', 'Set', 'Out', 'Nov', 'Dez']
+DIAS_SEMANA_ABREVIADOS = ['Seg', 'Ter', 'Qua', 'Qui', 'Sex', 'Sáb', 'Dom']
+
+
+class RelatorioColunar:
+    """
+    Motor de relatórios que armazena as transações em colunas NumPy
+
+    Colunas mantidas (uma posição por transação):
+    - id da transação
+    - id do dono ('usuario_id')
+    - ordinal da data (date.toordinal)
+    - índice do mês (ano * 12 + mês - 1)
+    - índice da categoria
+    - valor com sinal (receitas positivas, despesas negativas)
+
+    As matrizes categoria x período dos relatórios são calculadas com
+    np.bincount sobre as colunas, sem laços Python por transação, e cada
+    relatório considera apenas as linhas do usuário pedido.
+
+    Os métodos públicos seguram a trava do motor, então um relatório nunca
+    lê as colunas no meio de uma escrita.
+    """
+
+    CAPACIDADE_INICIAL = 1024
+
+    def __init__(self, categorias: List[dict], transacoes: Optional[Iterable[dict]] = None,
+                 trava: Optional[threading.RLock] = None):
+        """
+        Inicializa o motor
+
+        Args:
+            categorias (List[dict]): Categorias com 'id', 'nome' e 'cor'
+            transacoes (Iterable[dict]): Transações iniciais (opcional)
+            trava (RLock): Trava compartilhada com outros stores (opcional)
+        """
+        self._trava = nova_trava(trava)
+        self._categorias = list(categorias)
+        self._indice_categoria: Dict[int, int] = {
+            categoria['id']: indice for indice, categoria in enumerate(self._categorias)
+        }
+        self._posicoes: Dict[int, int] = {}
+        self._tamanho = 0
+
+        capacidade = self.CAPACIDADE_INICIAL
+        self._id = np.empty(capacidade, dtype=np.int64)
+        self._usuario = np.empty(capacidade, dtype=np.int64)
+        self._ordinal = np.empty(capacidade, dtype=np.int32)
+        self._mes = np.empty(capacidade, dtype=np.int32)
+        self._categoria = np.empty(capacidade, dtype=np.int32)
+        self._valor = np.empty(capacidade, dtype=np.float64)
+
+        for transacao in transacoes or []:
+            self.adicionar(transacao)
+
+    # ===== ESCRITA =====
+
+    @sincronizado
+    def adicionar(self, transacao: dict) -> None:
+        """Acrescenta uma transação ao final das colunas (O(1) amortizado)"""
+        if self._tamanho == len(self._id):
+            self._crescer()
+        posicao = self._tamanho
+        # Só ocupa a posição depois que a linha foi gravada por completo
+        self._gravar(posicao, transacao)
+        self._posicoes[transacao['id']] = posicao
+        self._tamanho += 1
+
+    @sincronizado
+    def atualizar(self, transacao: dict) -> None:
+        """Sobrescreve as colunas de uma transação existente"""
+        posicao = self._posicoes.get(transacao['id'])
+        if posicao is None:
+            self.adicionar(transacao)
+        else:
+            self._gravar(posicao, transacao)
+
+    @sincronizado
+    def remover(self, transacao_id: int) -> None:
+        """Remove uma transação movendo a última linha para a posição liberada"""
+        posicao = self._posicoes.pop(transacao_id, None)
+        if posicao is None:
+            return
+
+        ultima = self._tamanho - 1
+        if posicao != ultima:
+            for coluna in self._colunas():
+                coluna[posicao] = coluna[ultima]
+            self._posicoes[int(self._id[posicao])] = posicao
+        self._tamanho = ultima
+
+    # ===== RELATÓRIOS =====
+
+    @sincronizado
+    def relatorio_mensal(self, usuario_id: int, referencia: date, meses: int = 6) -> dict:
+        """
+        Despesas por categoria nos últimos meses até o mês de referência
+
+        Args:
+            usuario_id (int): Dono das transações consideradas
+            referencia (date): Data dentro do último mês do relatório
+            meses (int): Quantidade de meses
+
+        Returns:
+            dict: Estrutura 'dados_grafico' dos templates de relatório
+        """
+        mes_final = referencia.year * 12 + referencia.month - 1
+        mes_inicial = mes_final - meses + 1
+        labels = [MESES_ABREVIADOS[mes % 12] for mes in range(mes_inicial, mes_final + 1)]
+        return self._grafico(usuario_id, self._mes, mes_inicial, meses, 1, labels)
+
+    @sincronizado
+    def relatorio_semanal(self, usuario_id: int, referencia: date, semanas: int = 4) -> dict:
+        """Despesas do usuário por categoria nas últimas semanas (de 7 dias) até a data de referência"""
+        inicio = referencia.toordinal() - semanas * 7 + 1
+        labels = [f'Sem {numero}' for numero in range(1, semanas + 1)]
+        return self._grafico(usuario_id, self._ordinal, inicio, semanas, 7, labels)
+
+    @sincronizado
+    def relatorio_diario(self, usuario_id: int, referencia: date) -> dict:
+        """Despesas do usuário por categoria em cada dia da semana (segunda a domingo) da data de referência"""
+        inicio = (referencia - timedelta(days=referencia.weekday())).toordinal()
+        return self._grafico(usuario_id, self._ordinal, inicio, 7, 1, list(DIAS_SEMANA_ABREVIADOS))
+
+    @sincronizado
+    def resumo_mes(self, usuario_id: int, referencia: date) -> dict:
+        """
+        Totais do usuário no mês de referência
+
+        Returns:
+            dict: total_receitas, total_despesas, saldo_mes, id da maior despesa
+                  e nome da categoria de maior gasto
+        """
+        mes = referencia.year * 12 + referencia.month - 1
+        n = self._tamanho
+        mascara = (self._mes[:n] == mes) & (self._usuario[:n] == usuario_id)
+        valores = self._valor[:n][mascara]
+
+        receitas = float(valores[valores > 0].sum())
+        despesas = float(-valores[valores < 0].sum())
+
+        maior_despesa_id = None
+        categoria_maior_gasto = None
+        if (valores < 0).any():
+            maior_despesa_id = int(self._id[:n][mascara][np.argmin(valores)])
+            gastos = np.bincount(
+                self._categoria[:n][mascara],
+                weights=np.minimum(valores, 0) * -1,
+                minlength=len(self._categorias)
+            )
+            categoria_maior_gasto = self._categorias[int(np.argmax(gastos))]['nome']
+
+        return {
+            'total_receitas': round(receitas, 2),
+            'total_despesas': round(despesas, 2),
+            'saldo_mes': round(receitas - despesas, 2),
+            'maior_despesa_id': maior_despesa_id,
+            'categoria_maior_gasto': categoria_maior_gasto
+        }
+
+    @sincronizado
+    def __len__(self) -> int:
+        return self._tamanho
+
+    def __repr__(self) -> str:
+        return f"RelatorioColunar(transacoes={self._tamanho}, capacidade={len(self._id)})"
+
+    # ===== AUXILIARES =====
+
+    def _grafico(self, usuario_id: int, chave: np.ndarray, inicio: int, periodos: int,
+                 largura: int, labels: List[str]) -> dict:
+        """
+        Agrupa as despesas do usuário por (período, categoria) com um único bincount
+
+        Args:
+            usuario_id (int): Dono das transações consideradas
+            chave (np.ndarray): Coluna usada para definir o período (ordinal ou mês)
+            inicio (int): Valor da chave no início do primeiro período
+            periodos (int): Quantidade de períodos
+            largura (int): Quantidade de unidades da chave por período
+            labels (List[str]): Rótulos dos períodos
+        """
+        n = self._tamanho
+        total_categorias = len(self._categorias)
+        deslocamento = chave[:n] - inicio
+        mascara = (
+            (deslocamento >= 0) & (deslocamento < periodos * largura)
+            & (self._valor[:n] < 0) & (self._usuario[:n] == usuario_id)
+        )
+
+        periodo = deslocamento[mascara] // largura
+        celula = periodo * total_categorias + self._categoria[:n][mascara]
+        matriz = np.bincount(
+            celula,
+            weights=-self._valor[:n][mascara],
+            minlength=periodos * total_categorias
+        ).reshape(periodos, total_categorias)
+
+        # Mantém apenas as categorias com algum gasto no intervalo
+        presentes = np.flatnonzero(matriz.sum(axis=0) > 0)
+        matriz = np.round(matriz, 2)
+        return {
+            'labels': labels,
+            'categorias': [self._categorias[i]['nome'] for i in presentes],
+            'cores': [self._categorias[i]['cor'] for i in presentes],
+            'dados': {
+                self._categorias[i]['nome']: matriz[:, i].tolist() for i in presentes
+            }
+        }
+
+    def _gravar(self, posicao: int, transacao: dict) -> None:
+        """Converte todos os campos antes de escrever, para não deixar a linha pela metade"""
+        transacao_id = int(transacao['id'])
+        usuario_id = int(transacao['usuario_id'])
+        data = date.fromisoformat(transacao['data_transacao'][:10])
+        valor = float(transacao['valor'])
+        valor = valor if transacao['tipo'] == 'receita' else -valor
+        categoria = self._obter_indice_categoria(transacao['categoria_id'])
+
+        self._id[posicao] = transacao_id
+        self._usuario[posicao] = usuario_id
+        self._ordinal[posicao] = data.toordinal()
+        self._mes[posicao] = data.year * 12 + data.month - 1
+        self._categoria[posicao] = categoria
+        self._valor[posicao] = valor
+
+    def _obter_indice_categoria(self, categoria_id: int) -> int:
+        indice = self._indice_categoria.get(categoria_id)
+        if indice is None:
+            # Categoria desconhecida: registra com nome genérico para não perder o valor
+            indice = len(self._categorias)
+            self._categorias.append({'id': categoria_id, 'nome': f'Categoria {categoria_id}', 'cor': '#CCCCCC'})
+            self._indice_categoria[categoria_id] = indice
+        return indice
+
+    def _colunas(self):
+        return (self._id, self._usuario, self._ordinal, self._mes, self._categoria, self._valor)
+
+    def _crescer(self) -> None:
+        """Dobra a capacidade das colunas"""
+        nova_capacidade = len(self._id) * 2
+        self._id, self._usuario, self._ordinal, self._mes, self._categoria, self._valor = (
+            self._copiar(coluna, nova_capacidade) for coluna in self._colunas()
+        )
+
+    def _copiar(self, coluna: np.ndarray, capacidade: int) -> np.ndarray:
+        nova = np.empty(capacidade, dtype=coluna.dtype)
+        nova[:self._tamanho] = coluna[:self._tamanho]
+        return nova
@@ -0,0 +1,17 @@
+import threading
+from functools import wraps
+from typing import Optional
+
+
+def nova_trava(trava: Optional[threading.RLock] = None) -> threading.RLock:
+    """Retorna a trava informada ou uma nova RLock (reentrante, para métodos que chamam outros métodos)"""
+    return trava if trava is not None else threading.RLock()
+
+
+def sincronizado(metodo):
+    """Executa o método segurando a trava da instância (self._trava)"""
+    @wraps(metodo)
+    def envolvido(self, *args, **kwargs):
+        with self._trava:
+            return metodo(self, *args, **kwargs)
+    return envolvido
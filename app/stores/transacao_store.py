@@ -0,0 +1,237 @@
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .sincronizacao import nova_trava, sincronizado
+
+
+class TransacaoStore:
+    """
+    Armazenamento em memória das transações com índices
+
+    Mantém quatro índices sobre os mesmos dicionários de transação:
+    - Hash pelo ID (busca, atualização e exclusão em O(1))
+    - Lista ordenada por (data_transacao, id) para listagens por data
+    - Lista ordenada por (data_transacao, id) para cada categoria
+    - Lista ordenada por (data_transacao, id) para cada dono ('usuario_id')
+
+    As listas ordenadas localizam a posição por busca binária (O(log n)), mas
+    inserir ou remover nelas desloca os elementos seguintes (O(n), um memmove
+    de ponteiros). Para os volumes mantidos em memória isso é mais rápido que
+    uma árvore balanceada em Python puro.
+
+    Os métodos públicos seguram a trava do store, então leituras e escritas
+    de threads diferentes não veem os índices pela metade. Stores que precisam
+    mudar juntos (transações, agregados, relatório) podem compartilhar a
+    mesma trava para que uma escrita composta seja atômica.
+    """
+
+    def __init__(self, transacoes: Optional[Iterable[dict]] = None,
+                 trava: Optional[threading.RLock] = None):
+        """
+        Inicializa o store
+
+        Args:
+            transacoes (Iterable[dict]): Transações iniciais (opcional)
+            trava (RLock): Trava compartilhada com outros stores (opcional)
+        """
+        self._trava = nova_trava(trava)
+        self._por_id: Dict[int, dict] = {}
+        self._por_data: List[Tuple[str, int]] = []
+        self._por_categoria: Dict[int, List[Tuple[str, int]]] = {}
+        self._por_usuario: Dict[Optional[int], List[Tuple[str, int]]] = {}
+        self._proximo_id: int = 1
+
+        for transacao in transacoes or []:
+            self._indexar(transacao)
+
+    # ===== LEITURA =====
+
+    @sincronizado
+    def obter(self, transacao_id: int) -> Optional[dict]:
+        """Retorna a transação pelo ID ou None"""
+        return self._por_id.get(transacao_id)
+
+    @sincronizado
+    def listar(self, inicio: int = 0, fim: Optional[int] = None) -> List[dict]:
+        """
+        Retorna as transações da mais recente para a mais antiga
+
+        Args:
+            inicio (int): Posição inicial (inclusiva)
+            fim (int): Posição final (exclusiva), None para ir até o fim
+
+        Returns:
+            List[dict]: Transações da faixa solicitada
+        """
+        return self._fatiar(self._por_data, inicio, fim)
+
+    @sincronizado
+    def listar_por_categoria(self, categoria_id: int, inicio: int = 0,
+                             fim: Optional[int] = None) -> List[dict]:
+        """Retorna as transações de uma categoria da mais recente para a mais antiga"""
+        return self._fatiar(self._por_categoria.get(categoria_id, []), inicio, fim)
+
+    @sincronizado
+    def listar_por_usuario(self, usuario_id: int, inicio: int = 0,
+                           fim: Optional[int] = None) -> List[dict]:
+        """Retorna as transações de um usuário da mais recente para a mais antiga"""
+        return self._fatiar(self._por_usuario.get(usuario_id, []), inicio, fim)
+
+    @sincronizado
+    def listar_apos_chave(self, chave: Optional[Tuple[str, int]], limite: int) -> List[dict]:
+        """
+        Paginação por chave: retorna até `limite` transações mais antigas que a chave
+
+        Args:
+            chave (Tuple[str, int]): (data_transacao, id) da última transação da página
+                                     anterior, ou None para a primeira página
+            limite (int): Tamanho da página
+
+        Returns:
+            List[dict]: Transações da mais recente para a mais antiga
+        """
+        fim = len(self._por_data) if chave is None else bisect_left(self._por_data, tuple(chave))
+        inicio = max(fim - limite, 0)
+        return [self._por_id[tid] for _, tid in reversed(self._por_data[inicio:fim])]
+
+    @sincronizado
+    def listar_desde(self, data_inicial: str) -> List[dict]:
+        """
+        Retorna as transações com data_transacao >= data_inicial
+
+        Args:
+            data_inicial (str): Data em formato ISO
+
+        Returns:
+            List[dict]: Transações da mais recente para a mais antiga
+        """
+        posicao = bisect_left(self._por_data, (data_inicial, -1))
+        return [self._por_id[tid] for _, tid in reversed(self._por_data[posicao:])]
+
+    # ===== ESCRITA =====
+
+    @sincronizado
+    def adicionar(self, transacao: dict) -> dict:
+        """
+        Adiciona uma transação, atribuindo um ID se necessário
+
+        Args:
+            transacao (dict): Dados da transação
+
+        Returns:
+            dict: Transação armazenada
+        """
+        if transacao.get('id') is None:
+            transacao['id'] = self._proximo_id
+        elif transacao['id'] in self._por_id:
+            raise ValueError(f"Transação {transacao['id']} já existe")
+        self._indexar(transacao)
+        return transacao
+
+    @sincronizado
+    def atualizar(self, transacao_id: int, dados: dict) -> Optional[dict]:
+        """
+        Atualiza os campos de uma transação mantendo os índices consistentes
+
+        Args:
+            transacao_id (int): ID da transação
+            dados (dict): Campos a atualizar
+
+        Returns:
+            dict: Transação atualizada ou None se não encontrada
+        """
+        transacao = self._por_id.get(transacao_id)
+        if transacao is None:
+            return None
+
+        # Valida a nova chave antes de tocar nos índices
+        self._chave({**transacao, **dados, 'id': transacao_id})
+        self._desindexar_ordenados(transacao)
+        transacao.update(dados)
+        transacao['id'] = transacao_id
+        self._indexar_ordenados(transacao)
+        return transacao
+
+    @sincronizado
+    def remover(self, transacao_id: int) -> Optional[dict]:
+        """Remove a transação pelo ID, retornando-a ou None se não encontrada"""
+        transacao = self._por_id.pop(transacao_id, None)
+        if transacao is not None:
+            self._desindexar_ordenados(transacao)
+        return transacao
+
+    # ===== PROTOCOLO DE COLEÇÃO =====
+
+    @sincronizado
+    def __len__(self) -> int:
+        return len(self._por_id)
+
+    @sincronizado
+    def __iter__(self) -> Iterator[dict]:
+        """Itera da transação mais recente para a mais antiga (sobre uma cópia da ordem atual)"""
+        return iter([self._por_id[tid] for _, tid in reversed(self._por_data)])
+
+    @sincronizado
+    def __contains__(self, transacao_id: int) -> bool:
+        return transacao_id in self._por_id
+
+    def __repr__(self) -> str:
+        return f"TransacaoStore(transacoes={len(self._por_id)})"
+
+    # ===== ÍNDICES =====
+
+    @staticmethod
+    def _chave(transacao: dict) -> Tuple[str, int]:
+        """Chave de ordenação; rejeita valores que não se comparam com as demais chaves"""
+        data_transacao = transacao['data_transacao']
+        transacao_id = transacao['id']
+        if not isinstance(data_transacao, str):
+            raise TypeError(f"data_transacao deve ser str, recebido {type(data_transacao).__name__}")
+        if not isinstance(transacao_id, int) or isinstance(transacao_id, bool):
+            raise TypeError(f"id deve ser int, recebido {type(transacao_id).__name__}")
+        if 'categoria_id' not in transacao:
+            raise KeyError('categoria_id')
+        return (data_transacao, transacao_id)
+
+    def _indexar(self, transacao: dict) -> None:
+        chave = self._chave(transacao)
+        self._por_id[transacao['id']] = transacao
+        self._proximo_id = max(self._proximo_id, transacao['id'] + 1)
+        self._indexar_ordenados(transacao, chave)
+
+    def _indexar_ordenados(self, transacao: dict, chave: Optional[Tuple[str, int]] = None) -> None:
+        chave = chave or self._chave(transacao)
+        insort(self._por_data, chave)
+        insort(self._por_categoria.setdefault(transacao['categoria_id'], []), chave)
+        insort(self._por_usuario.setdefault(transacao.get('usuario_id'), []), chave)
+
+    def _desindexar_ordenados(self, transacao: dict) -> None:
+        chave = self._chave(transacao)
+        self._remover_chave(self._por_data, chave)
+        categoria = self._por_categoria.get(transacao['categoria_id'])
+        if categoria is not None:
+            self._remover_chave(categoria, chave)
+            if not categoria:
+                del self._por_categoria[transacao['categoria_id']]
+        usuario = self._por_usuario.get(transacao.get('usuario_id'))
+        if usuario is not None:
+            self._remover_chave(usuario, chave)
+            if not usuario:
+                del self._por_usuario[transacao.get('usuario_id')]
+
+    @staticmethod
+    def _remover_chave(indice: List[Tuple[str, int]], chave: Tuple[str, int]) -> None:
+        posicao = bisect_left(indice, chave)
+        if posicao < len(indice) and indice[posicao] == chave:
+            del indice[posicao]
+
+    def _fatiar(self, indice: List[Tuple[str, int]], inicio: int,
+                fim: Optional[int]) -> List[dict]:
+        """Converte uma faixa em ordem decrescente para a faixa equivalente no índice crescente"""
+        total = len(indice)
+        fim = total if fim is None else min(fim, total)
+        inicio = max(inicio, 0)
+        if inicio >= fim:
+            return []
+        return [self._por_id[tid] for _, tid in reversed(indice[total - fim:total - inicio])]
@@ -0,0 +1,23 @@
+# Utilitários da aplicação
+from .cache import CacheMemoria, CacheRedis, CacheSqlite
+from .carregador_lotes import CarregadorLotes, carregador_da_requisicao
+from .paginacao import codificar_cursor, decodificar_cursor, CursorInvalidoError
+from .serializacao import SerializadorModelo
+from .json_rapido import ProvedorJSONRapido, resposta_json_em_fluxo
+from .eventos import BarramentoEventos, FanoutRedis
+
+__all__ = [
+    'CacheMemoria',
+    'CacheRedis',
+    'CacheSqlite',
+    'CarregadorLotes',
+    'carregador_da_requisicao',
+    'codificar_cursor',
+    'decodificar_cursor',
+    'CursorInvalidoError',
+    'SerializadorModelo',
+    'ProvedorJSONRapido',
+    'resposta_json_em_fluxo',
+    'BarramentoEventos',
+    'FanoutRedis'
+]
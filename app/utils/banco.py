@@ -0,0 +1,149 @@
+import time
+from contextlib import contextmanager
+from functools import wraps
+from contextvars import ContextVar
+from typing import Any, Dict
+
+from flask import current_app, has_request_context, session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.sql.elements import TextClause
+
+# Chave do bind somente leitura (réplica) em SQLALCHEMY_BINDS
+BIND_LEITURA = 'leitura'
+
+_usar_replica: ContextVar[bool] = ContextVar('usar_replica', default=False)
+
+
+@contextmanager
+def leitura_replica():
+    """
+    Encaminha as consultas do bloco para a réplica de leitura, se configurada
+
+    Escritas e leituras de quem acabou de escrever continuam no primário
+    (ver SessaoRoteada).
+    """
+    token = _usar_replica.set(True)
+    try:
+        yield
+    finally:
+        _usar_replica.reset(token)
+
+
+def em_replica(funcao):
+    """Decorador: executa a função dentro de leitura_replica()"""
+    @wraps(funcao)
+    def envoltorio(*args, **kwargs):
+        with leitura_replica():
+            return funcao(*args, **kwargs)
+    return envoltorio
+
+
+@contextmanager
+def somente_primario():
+    """Força as consultas do bloco a usar o primário (ex.: leitura que precisa do dado mais recente)"""
+    token = _usar_replica.set(False)
+    try:
+        yield
+    finally:
+        _usar_replica.reset(token)
+
+
+class SessaoRoteada(Session):
+    """
+    Sessão que envia leituras para a réplica e escritas para o primário
+
+    Dentro de leitura_replica(), SELECTs usam o bind BIND_LEITURA. Flushes
+    e comandos DML (inclusive SQL textual que não seja SELECT/WITH) sempre
+    vão para o primário, e a partir da primeira escrita a sessão passa a
+    ler também do primário (read-your-writes).
+    Em requisições, a escrita ainda é lembrada por
+    DB_JANELA_LEITURA_PRIMARIO segundos (cookie de sessão), cobrindo o
+    atraso de replicação para as próximas requisições do mesmo usuário.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._escreveu = False
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None:
+            if self._flushing or self._escrita(clause):
+                self._registrar_escrita()
+            elif _usar_replica.get() and not self._ler_do_primario():
+                replica = self._db.engines.get(BIND_LEITURA)
+                if replica is not None:
+                    return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    @staticmethod
+    def _escrita(clause) -> bool:
+        """DML do Core/ORM ou SQL textual que não seja uma consulta (SELECT/WITH)"""
+        if getattr(clause, 'is_dml', False):
+            return True
+        if isinstance(clause, TextClause):
+            return not clause.text.lstrip().upper().startswith(('SELECT', 'WITH'))
+        return False
+
+    def _ler_do_primario(self) -> bool:
+        if self._escreveu or self.new or self.dirty or self.deleted:
+            return True
+        return has_request_context() and session.get('_primario_ate', 0) > time.time()
+
+    def _registrar_escrita(self) -> None:
+        if self._escreveu:
+            return
+        self._escreveu = True
+        if has_request_context() and BIND_LEITURA in self._db.engines:
+            janela = current_app.config.get('DB_JANELA_LEITURA_PRIMARIO', 5)
+            session['_primario_ate'] = time.time() + janela
+
+
+def aplicar_pragmas_sqlite(engine, pragmas: Dict[str, Any]) -> None:
+    """
+    Executa os PRAGMAs em cada nova conexão SQLite do engine
+
+    PRAGMAs como synchronous e mmap_size valem por conexão, então são
+    aplicados no evento 'connect' do pool; journal_mode=WAL fica gravado
+    no arquivo do banco. Engines de outros bancos são ignorados.
+
+    Args:
+        engine: Engine do SQLAlchemy
+        pragmas (dict): Nome do PRAGMA -> valor (ex.: {'journal_mode': 'WAL'})
+    """
+    if engine.dialect.name != 'sqlite' or not pragmas:
+        return
+
+    @event.listens_for(engine, 'connect')
+    def _aplicar(conexao_dbapi, registro_conexao):
+        cursor = conexao_dbapi.cursor()
+        try:
+            for nome, valor in pragmas.items():
+                cursor.execute(f'PRAGMA {nome}={valor}')
+        finally:
+            cursor.close()
+
+
+def estatisticas_pool(engine) -> Dict[str, Any]:
+    """
+    Retorna o estado do pool de conexões do engine
+
+    Returns:
+        dict: Classe do pool, tamanho, conexões livres/em uso/excedentes e o
+              resumo textual do SQLAlchemy
+    """
+    pool = engine.pool
+    estatisticas = {
+        'banco': engine.dialect.name,
+        'pool': type(pool).__name__,
+        'status': pool.status(),
+    }
+    for campo, metodo in (('tamanho', 'size'), ('livres', 'checkedin'),
+                          ('em_uso', 'checkedout'), ('excedentes', 'overflow')):
+        if hasattr(pool, metodo):
+            estatisticas[campo] = getattr(pool, metodo)()
+    if hasattr(pool, '_max_overflow'):
+        estatisticas['max_excedentes'] = pool._max_overflow
+    if hasattr(pool, '_timeout'):
+        estatisticas['timeout'] = pool._timeout
+    return estatisticas
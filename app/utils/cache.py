@@ -0,0 +1,264 @@
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Sentinela para diferenciar "não está no cache" de um valor None armazenado
+AUSENTE = object()
+
+
+class CacheMemoria:
+    """
+    Cache em memória do processo, com expiração (TTL) e descarte LRU
+
+    As entradas ficam em um OrderedDict na ordem de uso; ao passar de
+    `max_itens`, a menos usada recentemente é descartada. Seguro para uso
+    entre threads.
+    """
+
+    def __init__(self, max_itens: int = 10000, ttl: Optional[float] = 300):
+        """
+        Inicializa o cache
+
+        Args:
+            max_itens (int): Quantidade máxima de entradas
+            ttl (float): Segundos até uma entrada expirar (None = sem expiração)
+        """
+        self.max_itens = max_itens
+        self.ttl = ttl
+        self._itens: OrderedDict = OrderedDict()
+        self._trava = threading.Lock()
+        self._acertos = 0
+        self._falhas = 0
+
+    def obter(self, chave: str, padrao: Any = AUSENTE) -> Any:
+        """Retorna o valor da chave ou `padrao` se ausente/expirado"""
+        with self._trava:
+            item = self._itens.get(chave)
+            if item is not None and (item[1] is None or item[1] > time.monotonic()):
+                self._itens.move_to_end(chave)
+                self._acertos += 1
+                return item[0]
+            if item is not None:
+                del self._itens[chave]
+            self._falhas += 1
+            return padrao
+
+    def definir(self, chave: str, valor: Any, ttl: Optional[float] = None) -> None:
+        """Armazena o valor (ttl None usa o padrão do cache)"""
+        ttl = self.ttl if ttl is None else ttl
+        expira_em = time.monotonic() + ttl if ttl else None
+        with self._trava:
+            self._itens[chave] = (valor, expira_em)
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.max_itens:
+                self._itens.popitem(last=False)
+
+    def incrementar(self, chave: str, delta: int) -> None:
+        """Soma `delta` a um contador numérico, se ele estiver no cache (sem renovar o TTL)"""
+        with self._trava:
+            item = self._itens.get(chave)
+            if item is not None:
+                self._itens[chave] = (item[0] + delta, item[1])
+
+    def remover(self, *chaves: str) -> None:
+        """Remove as chaves informadas"""
+        with self._trava:
+            for chave in chaves:
+                self._itens.pop(chave, None)
+
+    def limpar(self, prefixo: str = '') -> None:
+        """Remove todas as entradas cujas chaves começam com `prefixo`"""
+        with self._trava:
+            if not prefixo:
+                self._itens.clear()
+                return
+            for chave in [chave for chave in self._itens if chave.startswith(prefixo)]:
+                del self._itens[chave]
+
+    def estatisticas(self) -> Dict[str, Any]:
+        """Retorna acertos, falhas, taxa de acerto e quantidade de entradas"""
+        total = self._acertos + self._falhas
+        return {
+            'backend': 'memoria',
+            'acertos': self._acertos,
+            'falhas': self._falhas,
+            'taxa_acerto': self._acertos / total if total else 0.0,
+            'itens': len(self._itens),
+        }
+
+
+class CacheRedis:
+    """
+    Cache compartilhado entre processos/servidores usando Redis
+
+    Mesma interface de CacheMemoria. Os valores são serializados com pickle,
+    portanto o servidor Redis deve ser de uso exclusivo da aplicação. As
+    estatísticas são do processo atual.
+    """
+
+    def __init__(self, url: str = 'redis://localhost:6379/0', ttl: Optional[float] = 300,
+                 prefixo: str = 'anotaai:'):
+        """
+        Inicializa o cache
+
+        Args:
+            url (str): URL de conexão do Redis
+            ttl (float): Segundos até uma entrada expirar (None = sem expiração)
+            prefixo (str): Prefixo aplicado a todas as chaves
+        """
+        try:
+            import redis
+        except ImportError:
+            print("redis não está instalado. Instale com: pip install redis")
+            raise
+        self._redis = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefixo = prefixo
+        self._acertos = 0
+        self._falhas = 0
+
+    def obter(self, chave: str, padrao: Any = AUSENTE) -> Any:
+        dados = self._redis.get(self.prefixo + chave)
+        if dados is None:
+            self._falhas += 1
+            return padrao
+        self._acertos += 1
+        return pickle.loads(dados)
+
+    def definir(self, chave: str, valor: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        self._redis.set(self.prefixo + chave, pickle.dumps(valor),
+                        px=int(ttl * 1000) if ttl else None)
+
+    def incrementar(self, chave: str, delta: int) -> None:
+        # Valores são serializados; o contador é descartado e recalculado na próxima leitura
+        self.remover(chave)
+
+    def remover(self, *chaves: str) -> None:
+        if chaves:
+            self._redis.delete(*(self.prefixo + chave for chave in chaves))
+
+    def limpar(self, prefixo: str = '') -> None:
+        chaves = list(self._redis.scan_iter(match=f'{self.prefixo}{prefixo}*'))
+        if chaves:
+            self._redis.delete(*chaves)
+
+    def estatisticas(self) -> Dict[str, Any]:
+        total = self._acertos + self._falhas
+        return {
+            'backend': 'redis',
+            'acertos': self._acertos,
+            'falhas': self._falhas,
+            'taxa_acerto': self._acertos / total if total else 0.0,
+        }
+
+
+class CacheSqlite:
+    """
+    Cache compartilhado entre os processos de uma mesma máquina, em um arquivo SQLite
+
+    Alternativa ao Redis para vários workers (gunicorn) no mesmo servidor.
+    Mesma interface de CacheMemoria, com expiração por TTL e descarte das
+    entradas usadas há mais tempo ao passar de `max_itens`. Os valores são
+    serializados com pickle; as estatísticas são do processo atual.
+    """
+
+    # O descarte LRU roda a cada N gravações, não em todas
+    INTERVALO_DESCARTE = 64
+
+    def __init__(self, caminho: str, max_itens: int = 10000, ttl: Optional[float] = 300):
+        """
+        Inicializa o cache
+
+        Args:
+            caminho (str): Arquivo do banco SQLite (criado se não existir)
+            max_itens (int): Quantidade máxima de entradas
+            ttl (float): Segundos até uma entrada expirar (None = sem expiração)
+        """
+        self.caminho = caminho
+        self.max_itens = max_itens
+        self.ttl = ttl
+        self._local = threading.local()
+        self._trava = threading.Lock()
+        self._acertos = 0
+        self._falhas = 0
+        self._gravacoes = 0
+        self._conexao().execute(
+            'CREATE TABLE IF NOT EXISTS cache ('
+            'chave TEXT PRIMARY KEY, valor BLOB NOT NULL, expira_em REAL, usado_em REAL NOT NULL)'
+        )
+        self._conexao().execute('CREATE INDEX IF NOT EXISTS ix_cache_usado_em ON cache (usado_em)')
+
+    def _conexao(self):
+        # sqlite3 não compartilha conexões entre threads: uma por thread
+        conexao = getattr(self._local, 'conexao', None)
+        if conexao is None:
+            conexao = sqlite3.connect(self.caminho, timeout=5, isolation_level=None)
+            conexao.execute('PRAGMA journal_mode=WAL')
+            conexao.execute('PRAGMA synchronous=NORMAL')
+            self._local.conexao = conexao
+        return conexao
+
+    def obter(self, chave: str, padrao: Any = AUSENTE) -> Any:
+        conexao = self._conexao()
+        agora = time.time()
+        linha = conexao.execute('SELECT valor, expira_em FROM cache WHERE chave = ?', (chave,)).fetchone()
+        if linha is None or (linha[1] is not None and linha[1] <= agora):
+            if linha is not None:
+                conexao.execute('DELETE FROM cache WHERE chave = ?', (chave,))
+            with self._trava:
+                self._falhas += 1
+            return padrao
+        conexao.execute('UPDATE cache SET usado_em = ? WHERE chave = ?', (agora, chave))
+        with self._trava:
+            self._acertos += 1
+        return pickle.loads(linha[0])
+
+    def definir(self, chave: str, valor: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        agora = time.time()
+        conexao = self._conexao()
+        conexao.execute(
+            'INSERT OR REPLACE INTO cache (chave, valor, expira_em, usado_em) VALUES (?, ?, ?, ?)',
+            (chave, pickle.dumps(valor), agora + ttl if ttl else None, agora)
+        )
+        with self._trava:
+            self._gravacoes += 1
+            descartar = self._gravacoes % self.INTERVALO_DESCARTE == 0
+        if descartar:
+            conexao.execute('DELETE FROM cache WHERE expira_em <= ?', (agora,))
+            conexao.execute(
+                'DELETE FROM cache WHERE chave IN '
+                '(SELECT chave FROM cache ORDER BY usado_em DESC LIMIT -1 OFFSET ?)',
+                (self.max_itens,)
+            )
+
+    def incrementar(self, chave: str, delta: int) -> None:
+        # Valores são serializados; o contador é descartado e recalculado na próxima leitura
+        self.remover(chave)
+
+    def remover(self, *chaves: str) -> None:
+        if chaves:
+            self._conexao().executemany('DELETE FROM cache WHERE chave = ?', [(chave,) for chave in chaves])
+
+    def limpar(self, prefixo: str = '') -> None:
+        if not prefixo:
+            self._conexao().execute('DELETE FROM cache')
+            return
+        # Faixa [prefixo, prefixo + U+10FFFF) usa o índice da chave primária
+        self._conexao().execute(
+            'DELETE FROM cache WHERE chave >= ? AND chave < ?', (prefixo, prefixo + '\U0010ffff')
+        )
+
+    def estatisticas(self) -> Dict[str, Any]:
+        total = self._acertos + self._falhas
+        return {
+            'backend': 'sqlite',
+            'acertos': self._acertos,
+            'falhas': self._falhas,
+            'taxa_acerto': self._acertos / total if total else 0.0,
+            'itens': self._conexao().execute('SELECT COUNT(*) FROM cache').fetchone()[0],
+        }
@@ -0,0 +1,138 @@
+import hashlib
+import uuid
+from functools import wraps
+
+from flask import current_app, make_response, request, session
+from flask_login import current_user
+
+from app.utils.cache import CacheMemoria, CacheRedis, CacheSqlite
+
+
+class VersoesDados:
+    """
+    Versão de cada conjunto de dados (ex.: 'transacoes', 'categorias')
+
+    As rotas de escrita trocam a versão do que alteraram; o ETag das rotas
+    de leitura é calculado a partir dessas versões, sem executar a rota.
+    Cada versão é um token aleatório guardado no backend (sem expiração),
+    então não há contador para sincronizar e uma versão nunca se repete,
+    nem depois de reiniciar. Se uma versão for descartada do backend, um
+    token novo é criado e os ETags antigos apenas deixam de valer.
+
+    Com o backend 'memoria' (padrão) as versões são do processo: isso só é
+    correto com um único worker, porque uma escrita em um worker não muda
+    o ETag dos demais, que continuariam respondendo 304 com dados antigos.
+    Com vários workers use 'sqlite' (mesma máquina) ou 'redis'.
+    """
+
+    PREFIXO = 'versao:'
+
+    def __init__(self, backend=None):
+        self.backend = backend if backend is not None else CacheMemoria(max_itens=1000, ttl=None)
+
+    def configurar(self, config) -> None:
+        """
+        Escolhe o backend a partir da configuração da aplicação
+
+        VERSOES_DADOS_BACKEND: 'memoria' (padrão, por processo), 'sqlite'
+        (arquivo em VERSOES_DADOS_URL) ou 'redis' (URL em VERSOES_DADOS_URL).
+        """
+        tipo = config.get('VERSOES_DADOS_BACKEND', 'memoria')
+        if tipo == 'memoria':
+            self.backend = CacheMemoria(max_itens=1000, ttl=None)
+        elif tipo == 'sqlite':
+            self.backend = CacheSqlite(config['VERSOES_DADOS_URL'], ttl=None)
+        elif tipo == 'redis':
+            self.backend = CacheRedis(config['VERSOES_DADOS_URL'], ttl=None)
+        else:
+            raise ValueError(f'Backend das versões de dados desconhecido: {tipo}')
+
+    def obter(self, nome: str) -> str:
+        """Versão atual do conjunto de dados"""
+        versao = self.backend.obter(self.PREFIXO + nome, None)
+        if versao is None:
+            versao = self._nova_versao(nome)
+        return versao
+
+    def incrementar(self, *nomes: str) -> None:
+        """Registra uma alteração nos conjuntos de dados informados"""
+        for nome in nomes:
+            self._nova_versao(nome)
+
+    def _nova_versao(self, nome: str) -> str:
+        versao = uuid.uuid4().hex
+        self.backend.definir(self.PREFIXO + nome, versao, ttl=0)
+        return versao
+
+
+VERSOES_DADOS = VersoesDados()
+
+
+def etag_dados(*recursos: str, por_usuario: bool = True) -> str:
+    """
+    ETag forte da requisição atual a partir das versões dos dados
+
+    Combina o caminho, a query string, a versão de cada recurso e
+    (por_usuario) o usuário logado.
+    """
+    partes = [request.path, request.query_string.decode('latin-1')]
+    partes.extend(f'{recurso}={VERSOES_DADOS.obter(recurso)}' for recurso in recursos)
+    if por_usuario and current_user.is_authenticated:
+        partes.append(f'usuario={current_user.get_id()}')
+    return hashlib.sha1('|'.join(partes).encode('utf-8')).hexdigest()
+
+
+def cache_http(*recursos: str, max_age: int = 0, publico: bool = False, etag: bool = True,
+               pagina: bool = False):
+    """
+    Decorador de cache HTTP para rotas GET
+
+    Com `etag`, o ETag é calculado das versões de `recursos` antes de
+    executar a rota; se o cliente já tem essa versão (If-None-Match), a
+    resposta é 304 sem corpo e a rota não é executada. Respostas 200
+    recebem o ETag e o Cache-Control da rota. Com max_age=0 o cliente
+    sempre revalida (no-cache), então uma escrita é vista na requisição
+    seguinte.
+
+        @main_bp.route('/api/categorias')
+        @login_required
+        @cache_http('categorias')
+        def api_categorias(): ...
+
+    Args:
+        recursos (str): Conjuntos de dados dos quais a resposta depende
+        max_age (int): Segundos em que o cliente pode reutilizar a resposta sem revalidar
+        publico (bool): Resposta igual para todos os usuários (Cache-Control: public)
+        etag (bool): Se False, define apenas o Cache-Control (ex.: respostas aleatórias)
+        pagina (bool): Página HTML que exibe mensagens flash; com mensagens
+                       pendentes a página é renderizada em vez de responder 304
+    """
+    def decorador(view):
+        @wraps(view)
+        def envoltorio(*args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(*args, **kwargs)
+
+            valor_etag = etag_dados(*recursos, por_usuario=not publico) if etag else None
+            if (valor_etag and request.if_none_match.contains(valor_etag)
+                    and not (pagina and '_flashes' in session)):
+                resposta = current_app.response_class(status=304)
+            else:
+                resposta = make_response(view(*args, **kwargs))
+                if resposta.status_code != 200:
+                    return resposta
+
+            if valor_etag:
+                resposta.set_etag(valor_etag)
+            if publico:
+                resposta.cache_control.public = True
+            else:
+                resposta.cache_control.private = True
+                resposta.vary.add('Cookie')
+            if max_age:
+                resposta.cache_control.max_age = max_age
+            else:
+                resposta.cache_control.no_cache = True
+            return resposta
+        return envoltorio
+    return decorador
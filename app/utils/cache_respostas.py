@@ -0,0 +1,161 @@
+import hashlib
+import threading
+from collections import defaultdict
+from functools import wraps
+from typing import Any, Dict, Optional, Set
+
+from flask import current_app, request
+from flask_login import current_user
+
+from app.utils.cache import AUSENTE, CacheMemoria, CacheRedis, CacheSqlite
+
+
+class CacheRespostas:
+    """
+    Cache no servidor das respostas das rotas, por (usuário, rota, argumentos)
+
+    A rota decorada com `em_cache` só é executada quando não há resposta
+    válida guardada; o corpo, o status e o Content-Type da resposta 200 são
+    armazenados no backend (CacheMemoria, CacheSqlite ou CacheRedis), que
+    cuida do TTL e do descarte LRU. Cada rota declara de quais conjuntos de
+    dados depende, e as rotas de escrita chamam `invalidar` com o conjunto
+    alterado e o usuário. Acertos e falhas são contados por rota, para
+    ajustar os TTLs.
+
+        CACHE_RESPOSTAS = CacheRespostas()
+
+        @dashboard_api.route('/dashboard/resumo')
+        @login_required
+        @CACHE_RESPOSTAS.em_cache('transacoes')
+        def dashboard_resumo(): ...
+
+        CACHE_RESPOSTAS.invalidar('transacoes', current_user.id)
+    """
+
+    PREFIXO = 'resposta:'
+
+    def __init__(self, backend=None, ttl: Optional[float] = 60):
+        """
+        Inicializa o cache
+
+        Args:
+            backend: CacheMemoria, CacheSqlite ou CacheRedis (padrão: CacheMemoria)
+            ttl (float): Segundos de validade de uma resposta (None = do backend)
+        """
+        self.backend = backend if backend is not None else CacheMemoria(max_itens=5000, ttl=ttl)
+        self.ttl = ttl
+        self._dependentes: Dict[str, Set[str]] = defaultdict(set)
+        self._contadores: Dict[str, Dict[str, int]] = defaultdict(lambda: {'acertos': 0, 'falhas': 0})
+        self._trava = threading.Lock()
+
+    def configurar(self, config) -> None:
+        """
+        Escolhe o backend a partir da configuração da aplicação
+
+        CACHE_RESPOSTAS_BACKEND: 'memoria' (padrão), 'sqlite' (arquivo em
+        CACHE_RESPOSTAS_URL, compartilhado pelos processos da máquina) ou
+        'redis' (URL em CACHE_RESPOSTAS_URL); CACHE_RESPOSTAS_TTL e
+        CACHE_RESPOSTAS_MAX_ITENS definem validade e tamanho.
+        """
+        tipo = config.get('CACHE_RESPOSTAS_BACKEND', 'memoria')
+        self.ttl = config.get('CACHE_RESPOSTAS_TTL', self.ttl)
+        max_itens = config.get('CACHE_RESPOSTAS_MAX_ITENS', 5000)
+        if tipo == 'memoria':
+            self.backend = CacheMemoria(max_itens=max_itens, ttl=self.ttl)
+        elif tipo == 'sqlite':
+            self.backend = CacheSqlite(config['CACHE_RESPOSTAS_URL'], max_itens=max_itens, ttl=self.ttl)
+        elif tipo == 'redis':
+            self.backend = CacheRedis(config['CACHE_RESPOSTAS_URL'], ttl=self.ttl)
+        else:
+            raise ValueError(f'Backend de cache de respostas desconhecido: {tipo}')
+
+    def em_cache(self, *recursos: str, ttl: Optional[float] = None):
+        """
+        Decorador que guarda a resposta GET da rota
+
+        Args:
+            recursos (str): Conjuntos de dados dos quais a resposta depende
+                            (invalidar(recurso) descarta as respostas da rota)
+            ttl (float): Validade específica da rota (None = self.ttl)
+        """
+        def decorador(view):
+            @wraps(view)
+            def envoltorio(*args, **kwargs):
+                if request.method != 'GET':
+                    return view(*args, **kwargs)
+
+                chave = self._chave(request.endpoint)
+                guardada = self.backend.obter(chave)
+                if guardada is not AUSENTE:
+                    self._contar(request.endpoint, 'acertos')
+                    corpo, status, mimetype = guardada
+                    return current_app.response_class(corpo, status=status, mimetype=mimetype)
+
+                self._contar(request.endpoint, 'falhas')
+                resposta = current_app.make_response(view(*args, **kwargs))
+                if resposta.status_code == 200 and not resposta.is_streamed:
+                    self.backend.definir(
+                        chave, (resposta.get_data(), resposta.status_code, resposta.mimetype),
+                        ttl=ttl if ttl is not None else self.ttl
+                    )
+                return resposta
+
+            envoltorio.recursos_cache = recursos
+            return envoltorio
+        return decorador
+
+    def registrar(self, endpoint: str, *recursos: str) -> None:
+        """Associa o endpoint aos conjuntos de dados dos quais ele depende"""
+        with self._trava:
+            for recurso in recursos:
+                self._dependentes[recurso].add(endpoint)
+
+    def registrar_rotas(self, app) -> None:
+        """Registra as dependências de todas as rotas decoradas com em_cache"""
+        for endpoint, view in app.view_functions.items():
+            # login_required e demais decoradores preservam o atributo via @wraps
+            recursos = getattr(view, 'recursos_cache', None)
+            if recursos:
+                self.registrar(endpoint, *recursos)
+
+    def invalidar(self, recurso: str, usuario_id: Any = None) -> None:
+        """
+        Descarta as respostas das rotas que dependem do conjunto de dados
+
+        Args:
+            recurso (str): Conjunto de dados alterado (ex.: 'transacoes')
+            usuario_id: Descarta só as respostas desse usuário (None = de todos)
+        """
+        for endpoint in list(self._dependentes.get(recurso, ())):
+            prefixo = f'{self.PREFIXO}{endpoint}:'
+            if usuario_id is not None:
+                prefixo += f'{usuario_id}:'
+            self.backend.limpar(prefixo)
+
+    def estatisticas(self) -> Dict[str, Any]:
+        """Acertos, falhas e taxa de acerto por rota, mais as estatísticas do backend"""
+        with self._trava:
+            rotas = {
+                endpoint: dict(contadores, taxa_acerto=(
+                    contadores['acertos'] / (contadores['acertos'] + contadores['falhas'])
+                ))
+                for endpoint, contadores in self._contadores.items()
+            }
+        return {'ttl': self.ttl, 'rotas': rotas, 'backend': self.backend.estatisticas()}
+
+    def limpar(self) -> None:
+        """Descarta todas as respostas guardadas"""
+        self.backend.limpar(self.PREFIXO)
+
+    def _chave(self, endpoint: str) -> str:
+        usuario = current_user.get_id() if current_user.is_authenticated else 'anonimo'
+        argumentos = '&'.join(f'{nome}={valor}' for nome, valor in sorted(request.args.items(multi=True)))
+        resumo = hashlib.sha1(f'{request.path}?{argumentos}'.encode('utf-8')).hexdigest()
+        return f'{self.PREFIXO}{endpoint}:{usuario}:{resumo}'
+
+    def _contar(self, endpoint: str, campo: str) -> None:
+        with self._trava:
+            self._contadores[endpoint][campo] += 1
+
+
+CACHE_RESPOSTAS = CacheRespostas()
@@ -0,0 +1,85 @@
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+from flask import g, has_app_context
+
+
+class CarregadorLotes:
+    """
+    Carregador em lote (DataLoader) para evitar consultas N+1
+
+    Em vez de resolver cada chave separadamente, o chamador registra todas
+    as chaves de que precisa (preparar) e as resolve em uma única chamada
+    de `funcao_lote` (uma consulta IN no banco ou uma busca em dicionário).
+    Os valores resolvidos ficam em cache na instância, então chaves
+    repetidas dentro da mesma requisição não são buscadas de novo.
+
+        carregador = CarregadorLotes(lambda ids: {c.id: c for c in Categoria.query.filter(Categoria.id.in_(ids))})
+        categorias = carregador.carregar_muitos(t['categoria_id'] for t in transacoes)
+    """
+
+    def __init__(self, funcao_lote: Callable[[List[Hashable]], Dict[Hashable, Any]]):
+        """
+        Inicializa o carregador
+
+        Args:
+            funcao_lote (Callable): Recebe a lista de chaves pendentes e retorna
+                                    um dicionário chave -> valor (chaves
+                                    ausentes resultam em None)
+        """
+        self.funcao_lote = funcao_lote
+        self._valores: Dict[Hashable, Any] = {}
+        self._pendentes: Dict[Hashable, None] = {}
+        self.lotes = 0
+
+    def preparar(self, chaves: Iterable[Hashable]) -> None:
+        """Registra chaves para serem resolvidas no próximo despacho"""
+        for chave in chaves:
+            if chave not in self._valores:
+                self._pendentes[chave] = None
+
+    def despachar(self) -> None:
+        """Resolve todas as chaves pendentes em uma única chamada"""
+        if not self._pendentes:
+            return
+        chaves = list(self._pendentes)
+        self._pendentes.clear()
+        resolvidos = self.funcao_lote(chaves)
+        self.lotes += 1
+        for chave in chaves:
+            self._valores[chave] = resolvidos.get(chave)
+
+    def carregar(self, chave: Hashable) -> Optional[Any]:
+        """Retorna o valor de uma chave, despachando as pendentes se necessário"""
+        if chave not in self._valores:
+            self._pendentes[chave] = None
+            self.despachar()
+        return self._valores[chave]
+
+    def carregar_muitos(self, chaves: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """Resolve várias chaves com no máximo uma chamada de `funcao_lote`"""
+        chaves = list(chaves)
+        self.preparar(chaves)
+        self.despachar()
+        return {chave: self._valores[chave] for chave in chaves}
+
+    def limpar(self, chave: Optional[Hashable] = None) -> None:
+        """Descarta o valor em cache de uma chave (ou de todas)"""
+        if chave is None:
+            self._valores.clear()
+        else:
+            self._valores.pop(chave, None)
+
+
+def carregador_da_requisicao(nome: str, funcao_lote: Callable) -> CarregadorLotes:
+    """
+    Retorna o carregador `nome` da requisição atual, criando-o na primeira chamada
+
+    Fora de um contexto da aplicação retorna um carregador novo a cada chamada.
+    """
+    if not has_app_context():
+        return CarregadorLotes(funcao_lote)
+    carregadores = g.setdefault('_carregadores_lotes', {})
+    carregador = carregadores.get(nome)
+    if carregador is None:
+        carregador = carregadores[nome] = CarregadorLotes(funcao_lote)
+    return carregador
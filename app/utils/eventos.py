@@ -0,0 +1,199 @@
+import json
+import queue
+import threading
+import uuid
+from collections import defaultdict
+from typing import Any, Callable, Dict, Optional, Set
+
+# Evento entregue a uma assinatura que perdeu eventos por estar atrasada
+EVENTO_RESINCRONIZAR = {'tipo': 'resincronizar'}
+
+
+class Assinatura:
+    """
+    Fila de eventos de um assinante (ex.: uma conexão SSE aberta)
+
+    A fila é limitada: se o assinante não consome (conexão lenta), os
+    eventos pendentes são descartados e ele recebe EVENTO_RESINCRONIZAR,
+    sinal para recarregar o estado completo em vez de aplicar deltas.
+    Pode ser usada como gerenciador de contexto, que cancela ao sair.
+    """
+
+    def __init__(self, barramento: 'BarramentoEventos', canal: str, max_pendentes: int):
+        self.barramento = barramento
+        self.canal = canal
+        self._fila: queue.Queue = queue.Queue(maxsize=max_pendentes)
+        self._trava = threading.Lock()
+
+    def entregar(self, evento: Dict[str, Any]) -> None:
+        """Enfileira o evento (chamado pelo barramento)"""
+        with self._trava:
+            try:
+                self._fila.put_nowait(evento)
+            except queue.Full:
+                with self._fila.mutex:
+                    self._fila.queue.clear()
+                self._fila.put_nowait(EVENTO_RESINCRONIZAR)
+
+    def proximo(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Aguarda o próximo evento; None se `timeout` segundos passarem sem eventos"""
+        try:
+            return self._fila.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def cancelar(self) -> None:
+        """Deixa de receber eventos"""
+        self.barramento.cancelar(self)
+
+    def __enter__(self) -> 'Assinatura':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cancelar()
+
+
+class BarramentoEventos:
+    """
+    Pub/sub em memória do processo, por canal (ex.: 'usuario:1')
+
+    `publicar` entrega o evento a todas as assinaturas locais do canal e,
+    se houver um fanout configurado (ex.: FanoutRedis), repassa aos demais
+    processos/servidores, que entregam às suas assinaturas locais. Sem
+    fanout, só as conexões do próprio worker são avisadas.
+
+        with BARRAMENTO_EVENTOS.assinar('usuario:1') as assinatura:
+            evento = assinatura.proximo(timeout=15)
+
+        BARRAMENTO_EVENTOS.publicar('usuario:1', {'tipo': 'transacao_criada', ...})
+    """
+
+    def __init__(self, fanout=None):
+        """
+        Inicializa o barramento
+
+        Args:
+            fanout: Objeto com iniciar(entregar) e enviar(canal, evento) que
+                    leva os eventos aos outros processos (None = só este processo)
+        """
+        self._assinaturas: Dict[str, Set[Assinatura]] = defaultdict(set)
+        self._trava = threading.Lock()
+        self.fanout = None
+        if fanout is not None:
+            self.configurar_fanout(fanout)
+
+    def configurar(self, config) -> None:
+        """
+        Configura o fanout a partir da configuração da aplicação
+
+        EVENTOS_FANOUT: '' (padrão, apenas este processo) ou 'redis' (URL em
+        EVENTOS_FANOUT_URL).
+        """
+        tipo = config.get('EVENTOS_FANOUT', '')
+        if not tipo:
+            return
+        if tipo == 'redis':
+            self.configurar_fanout(FanoutRedis(config['EVENTOS_FANOUT_URL']))
+        else:
+            raise ValueError(f'Fanout de eventos desconhecido: {tipo}')
+
+    def configurar_fanout(self, fanout) -> None:
+        """Passa a repassar os eventos pelo fanout e a entregar os recebidos dele"""
+        if self.fanout is not None:
+            return
+        self.fanout = fanout
+        fanout.iniciar(self._entregar_local)
+
+    def assinar(self, canal: str, max_pendentes: int = 100) -> Assinatura:
+        """
+        Cria uma assinatura do canal
+
+        Args:
+            canal (str): Canal de eventos (ex.: 'usuario:1')
+            max_pendentes (int): Eventos não consumidos antes de pedir resincronização
+
+        Returns:
+            Assinatura: Fila de eventos do assinante (cancelar() ao terminar)
+        """
+        assinatura = Assinatura(self, canal, max_pendentes)
+        with self._trava:
+            self._assinaturas[canal].add(assinatura)
+        return assinatura
+
+    def cancelar(self, assinatura: Assinatura) -> None:
+        """Remove a assinatura do canal"""
+        with self._trava:
+            assinaturas = self._assinaturas.get(assinatura.canal)
+            if assinaturas is not None:
+                assinaturas.discard(assinatura)
+                if not assinaturas:
+                    del self._assinaturas[assinatura.canal]
+
+    def publicar(self, canal: str, evento: Dict[str, Any]) -> None:
+        """Entrega o evento aos assinantes do canal, neste e nos demais processos"""
+        self._entregar_local(canal, evento)
+        if self.fanout is not None:
+            self.fanout.enviar(canal, evento)
+
+    def estatisticas(self) -> Dict[str, Any]:
+        """Canais com assinantes e total de assinaturas deste processo"""
+        with self._trava:
+            return {
+                'fanout': type(self.fanout).__name__ if self.fanout is not None else None,
+                'canais': len(self._assinaturas),
+                'assinaturas': sum(len(assinaturas) for assinaturas in self._assinaturas.values()),
+            }
+
+    def _entregar_local(self, canal: str, evento: Dict[str, Any]) -> None:
+        with self._trava:
+            assinaturas = list(self._assinaturas.get(canal, ()))
+        for assinatura in assinaturas:
+            assinatura.entregar(evento)
+
+
+class FanoutRedis:
+    """
+    Repassa os eventos do barramento aos outros processos pelo pub/sub do Redis
+
+    Cada processo publica em um único canal Redis e mantém uma thread
+    escutando esse canal; mensagens publicadas pelo próprio processo são
+    ignoradas, pois já foram entregues localmente. Os eventos trafegam
+    como JSON.
+    """
+
+    def __init__(self, url: str = 'redis://localhost:6379/0', canal: str = 'anotaai:eventos'):
+        """
+        Inicializa o fanout
+
+        Args:
+            url (str): URL de conexão do Redis
+            canal (str): Canal Redis compartilhado pelos processos
+        """
+        try:
+            import redis
+        except ImportError:
+            print("redis não está instalado. Instale com: pip install redis")
+            raise
+        self._redis = redis.Redis.from_url(url)
+        self.canal = canal
+        self._origem = uuid.uuid4().hex
+
+    def iniciar(self, entregar: Callable[[str, Dict[str, Any]], None]) -> None:
+        """Começa a escutar o canal em uma thread, entregando os eventos recebidos"""
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(self.canal)
+
+        def escutar():
+            for mensagem in pubsub.listen():
+                dados = json.loads(mensagem['data'])
+                if dados['origem'] != self._origem:
+                    entregar(dados['canal'], dados['evento'])
+
+        threading.Thread(target=escutar, name='fanout-eventos', daemon=True).start()
+
+    def enviar(self, canal: str, evento: Dict[str, Any]) -> None:
+        """Publica o evento para os demais processos"""
+        self._redis.publish(self.canal, json.dumps({'origem': self._origem, 'canal': canal, 'evento': evento}))
+
+
+BARRAMENTO_EVENTOS = BarramentoEventos()
@@ -0,0 +1,110 @@
+from itertools import islice
+from typing import Any, Callable, Iterable, List, Optional
+
+from flask import Response, current_app, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # sem orjson, o provedor usa o json da biblioteca padrão
+    orjson = None
+
+# Datas continuam passando pelo `default` do Flask (mesmo formato do json padrão)
+_OPCOES_ORJSON = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if orjson else 0
+
+
+class ProvedorJSONRapido(DefaultJSONProvider):
+    """
+    Provedor JSON do Flask que serializa com orjson quando instalado
+
+    Produz o mesmo JSON que o provedor padrão (chaves não-string,
+    datas, Decimal, UUID e dataclasses passam pelo mesmo `default`), mas
+    codifica em C e entrega bytes diretamente para a resposta. Sem orjson,
+    ou quando a chamada pede opções que ele não suporta (indent, cls, ...),
+    usa o json da biblioteca padrão.
+
+        app.json = ProvedorJSONRapido(app)
+    """
+
+    def _opcoes(self) -> int:
+        return _OPCOES_ORJSON | (orjson.OPT_SORT_KEYS if self.sort_keys else 0)
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        """Serializa `obj` para bytes UTF-8"""
+        if orjson is not None:
+            try:
+                return orjson.dumps(obj, default=self.default, option=self._opcoes())
+            except orjson.JSONEncodeError:
+                # Ex.: inteiros acima de 64 bits; o json padrão decide se é serializável
+                pass
+        return super().dumps(obj).encode('utf-8')
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        # Saída indentada (debug) fica com o json padrão
+        if orjson is None or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj), mimetype=self.mimetype)
+
+
+def _blocos(itens: Iterable[Any], tamanho: int):
+    iterador = iter(itens)
+    while True:
+        bloco = list(islice(iterador, tamanho))
+        if not bloco:
+            return
+        yield bloco
+
+
+def resposta_json_em_fluxo(itens: Iterable[Any], tamanho_bloco: int = 500,
+                           transformar_lote: Optional[Callable[[List[Any]], List[Any]]] = None) -> Response:
+    """
+    Resposta com um array JSON emitido aos poucos (Transfer-Encoding: chunked)
+
+    Os itens são lidos e serializados em blocos de `tamanho_bloco`, então a
+    lista completa nunca é montada em memória, nem como objetos nem como
+    texto. O gerador roda dentro do contexto da requisição (current_user,
+    g e carregadores em lote continuam disponíveis). Erros durante o envio
+    não podem mais mudar o status da resposta, portanto validações devem
+    acontecer antes de chamar esta função.
+
+    Args:
+        itens: Iterável com os elementos do array (pode ser um gerador)
+        tamanho_bloco (int): Quantidade de itens serializados por vez
+        transformar_lote (callable): Função aplicada a cada bloco antes da
+                                     serialização (ex.: enriquecer_categorias)
+
+    Returns:
+        Response: Resposta application/json em fluxo
+    """
+    provedor = current_app.json
+    if isinstance(provedor, ProvedorJSONRapido):
+        serializar = provedor.dumps_bytes
+    else:
+        serializar = lambda obj: provedor.dumps(obj).encode('utf-8')
+
+    def gerar():
+        yield b'['
+        primeiro = True
+        for bloco in _blocos(itens, tamanho_bloco):
+            if transformar_lote is not None:
+                bloco = transformar_lote(bloco)
+            # "[a,b,c]" do bloco sem os colchetes, separado do bloco anterior por vírgula
+            corpo = serializar(bloco)[1:-1].strip()
+            if not corpo:
+                continue
+            yield corpo if primeiro else b',' + corpo
+            primeiro = False
+        yield b']'
+
+    return current_app.response_class(stream_with_context(gerar()), mimetype=provedor.mimetype)
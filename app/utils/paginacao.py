@@ -0,0 +1,61 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, List
+
+
+class CursorInvalidoError(ValueError):
+    """Cursor de paginação malformado ou adulterado"""
+
+
+def _codificar_valor(valor: Any):
+    if isinstance(valor, datetime):
+        return {'dt': valor.isoformat()}
+    if isinstance(valor, date):
+        return {'d': valor.isoformat()}
+    return valor
+
+
+def _decodificar_valor(valor: Any):
+    if isinstance(valor, dict):
+        if 'dt' in valor:
+            return datetime.fromisoformat(valor['dt'])
+        if 'd' in valor:
+            return date.fromisoformat(valor['d'])
+    return valor
+
+
+def codificar_cursor(valores: List[Any]) -> str:
+    """
+    Codifica os valores da chave da última linha de uma página em um cursor opaco
+
+    Args:
+        valores (List): Valores das colunas de ordenação (ex.: [created_at, id])
+
+    Returns:
+        str: Cursor em base64 url-safe
+    """
+    texto = json.dumps([_codificar_valor(valor) for valor in valores], separators=(',', ':'))
+    return base64.urlsafe_b64encode(texto.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decodificar_cursor(cursor: str) -> List[Any]:
+    """
+    Decodifica um cursor gerado por codificar_cursor
+
+    Raises:
+        CursorInvalidoError: Se o cursor não puder ser decodificado
+    """
+    try:
+        texto = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('utf-8')
+        valores = json.loads(texto)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise CursorInvalidoError('Cursor de paginação inválido') from e
+    if not isinstance(valores, list):
+        raise CursorInvalidoError('Cursor de paginação inválido')
+    try:
+        return [_decodificar_valor(valor) for valor in valores]
+    except (TypeError, ValueError) as e:
+        # Valores tipados malformados, ex.: {'dt': 'ontem'}
+        raise CursorInvalidoError('Cursor de paginação inválido') from e
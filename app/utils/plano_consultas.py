@@ -0,0 +1,133 @@
+import re
+from contextlib import contextmanager
+from typing import Any, Dict, List
+
+from sqlalchemy import event
+
+# "SCAN tabela" (SQLite >= 3.36) ou "SCAN TABLE tabela" sem "USING ... INDEX"
+_VARREDURA_COMPLETA = re.compile(r'^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$')
+
+_COMANDOS_ANALISADOS = ('SELECT', 'UPDATE', 'DELETE', 'WITH')
+
+
+class VarreduraCompletaError(AssertionError):
+    """Uma consulta não permitida fez varredura completa de tabela"""
+
+
+class VerificadorPlanos:
+    """
+    Verifica o plano de execução (EXPLAIN QUERY PLAN) das consultas executadas
+
+    Dentro de `capturar`, todo SQL enviado ao engine é registrado; ao sair
+    do bloco, cada comando é reexecutado com EXPLAIN QUERY PLAN e com os
+    mesmos parâmetros, e os passos "SCAN <tabela>" (varredura completa, sem
+    índice) são anotados. Consultas que de fato precisam ler a tabela
+    inteira (listagens completas, COUNT(*) sem filtro) são capturadas com
+    permitir_varredura=True.
+
+        verificador = VerificadorPlanos(db.engine)
+        with verificador.capturar('buscar_ativos'):
+            repositorio.buscar_ativos()
+        verificador.verificar()  # VarreduraCompletaError se houver varredura
+
+    Conexões sqlite3 abertas fora do SQLAlchemy (ex.: HistoricoUsuarioRepository)
+    entram na captura com `rastrear(conexao)`; seus comandos chegam com os
+    parâmetros já substituídos, e o engine deve apontar para o mesmo arquivo.
+
+    Suporta apenas SQLite, que é o banco usado em desenvolvimento e no CI.
+    """
+
+    def __init__(self, engine):
+        """
+        Inicializa o verificador
+
+        Args:
+            engine: Engine do SQLAlchemy (ex.: db.engine)
+        """
+        if engine.dialect.name != 'sqlite':
+            raise NotImplementedError('EXPLAIN QUERY PLAN só é suportado no SQLite')
+        self.engine = engine
+        self.resultados: List[Dict[str, Any]] = []
+        self._capturadas = None
+
+    @contextmanager
+    def capturar(self, rotulo: str, permitir_varredura: bool = False):
+        """
+        Registra e analisa as consultas executadas dentro do bloco
+
+        Args:
+            rotulo (str): Nome da operação (ex.: 'UsuarioRepository.buscar_ativos')
+            permitir_varredura (bool): Se True, varreduras completas são aceitas
+        """
+        capturadas = self._capturadas = []
+
+        def registrar(conexao, cursor, comando, parametros, contexto, executemany):
+            if not executemany:
+                self._registrar(comando, parametros)
+
+        event.listen(self.engine, 'before_cursor_execute', registrar)
+        try:
+            yield
+        finally:
+            event.remove(self.engine, 'before_cursor_execute', registrar)
+            self._capturadas = None
+
+        for comando, parametros in capturadas:
+            plano = self.explicar(comando, parametros)
+            varreduras = [
+                encontrada.group(1)
+                for encontrada in (_VARREDURA_COMPLETA.match(passo) for passo in plano)
+                if encontrada
+            ]
+            self.resultados.append({
+                'rotulo': rotulo,
+                'sql': comando,
+                'plano': plano,
+                'varreduras': varreduras,
+                'permitida': permitir_varredura,
+            })
+
+    def rastrear(self, conexao) -> None:
+        """Inclui nas capturas os comandos de uma conexão sqlite3 aberta diretamente"""
+        conexao.set_trace_callback(self._registrar)
+
+    def _registrar(self, comando: str, parametros=()) -> None:
+        if self._capturadas is not None and comando.lstrip().upper().startswith(_COMANDOS_ANALISADOS):
+            self._capturadas.append((comando, parametros))
+
+    def explicar(self, comando: str, parametros=()) -> List[str]:
+        """Retorna os passos do plano de execução de um comando"""
+        conexao = self.engine.raw_connection()
+        try:
+            cursor = conexao.cursor()
+            cursor.execute(f'EXPLAIN QUERY PLAN {comando}', parametros or ())
+            return [linha[-1] for linha in cursor.fetchall()]
+        finally:
+            conexao.close()
+
+    def falhas(self) -> List[Dict[str, Any]]:
+        """Consultas com varredura completa que não foram permitidas"""
+        return [r for r in self.resultados if r['varreduras'] and not r['permitida']]
+
+    def relatorio(self) -> str:
+        """Texto com o plano de cada consulta analisada"""
+        linhas = []
+        for resultado in self.resultados:
+            if resultado['varreduras']:
+                situacao = 'VARREDURA (permitida)' if resultado['permitida'] else 'VARREDURA'
+            else:
+                situacao = 'ok'
+            linhas.append(f"[{situacao}] {resultado['rotulo']}")
+            linhas.append(f"    {' '.join(resultado['sql'].split())}")
+            linhas.extend(f'    -> {passo}' for passo in resultado['plano'])
+        return '\n'.join(linhas)
+
+    def verificar(self) -> None:
+        """
+        Raises:
+            VarreduraCompletaError: Se alguma consulta não permitida varreu uma tabela inteira
+        """
+        falhas = self.falhas()
+        if falhas:
+            detalhes = '; '.join(f"{f['rotulo']} ({', '.join(f['varreduras'])})" for f in falhas)
+            raise VarreduraCompletaError(f'Varredura completa de tabela em: {detalhes}')
@@ -0,0 +1,92 @@
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Sequence
+
+from sqlalchemy import Date, DateTime, inspect
+
+
+class SerializadorModelo:
+    """
+    Converte instâncias (ou linhas) de um modelo em dicionários
+
+    Tudo o que não depende da linha é calculado uma única vez por modelo:
+    a tupla de colunas, o attrgetter que lê todos os atributos em uma só
+    chamada, as colunas omitidas e as posições das colunas de data. Com
+    isso, serializar uma linha é ler a tupla de valores e montar o
+    dicionário.
+
+    Os valores saem com os tipos do modelo (datetime, date...), como no
+    to_dict original; com datas_iso=True as datas são convertidas para
+    texto ISO 8601 na mesma passada, para respostas JSON.
+
+    `serializar_linhas` recebe tuplas na ordem de `colunas` (ex.: o
+    resultado de db.session.query(*serializador.colunas)), evitando criar
+    instâncias do ORM em listagens grandes.
+    """
+
+    def __init__(self, model, excluir: Sequence[str] = ()):
+        """
+        Inicializa o serializador
+
+        Args:
+            model: Classe do modelo SQLAlchemy
+            excluir (Sequence[str]): Colunas que não aparecem no dicionário (ex.: 'senha_hash')
+        """
+        mapper = inspect(model)
+        self.model = model
+        self.colunas = tuple(
+            coluna for coluna in mapper.local_table.columns if coluna.name not in excluir
+        )
+        self.campos = tuple(coluna.name for coluna in self.colunas)
+        self._datas = tuple(
+            posicao for posicao, coluna in enumerate(self.colunas)
+            if isinstance(coluna.type, (Date, DateTime))
+        )
+        chaves = [mapper.get_property_by_column(coluna).key for coluna in self.colunas]
+        if len(chaves) == 1:
+            ler = attrgetter(chaves[0])
+            self._ler = lambda instancia: (ler(instancia),)
+        else:
+            self._ler = attrgetter(*chaves)
+
+    def serializar(self, instancia: Any, datas_iso: bool = False) -> Dict[str, Any]:
+        """Converte uma instância do modelo em dicionário"""
+        return self.serializar_linha(self._ler(instancia), datas_iso)
+
+    def serializar_linha(self, linha: Sequence[Any], datas_iso: bool = False) -> Dict[str, Any]:
+        """Converte uma tupla de valores (na ordem de `colunas`) em dicionário"""
+        if datas_iso and self._datas:
+            linha = self._datas_em_iso(linha)
+        return dict(zip(self.campos, linha))
+
+    def serializar_linhas(self, linhas: Iterable[Sequence[Any]], datas_iso: bool = False) -> List[Dict[str, Any]]:
+        """Converte várias tuplas de valores (na ordem de `colunas`) em dicionários"""
+        campos = self.campos
+        if not (datas_iso and self._datas):
+            return [dict(zip(campos, linha)) for linha in linhas]
+        converter = self._datas_em_iso
+        return [dict(zip(campos, converter(linha))) for linha in linhas]
+
+    def serializar_muitos(self, itens: Iterable[Any], datas_iso: bool = False) -> List[Dict[str, Any]]:
+        """
+        Converte instâncias do modelo ou tuplas de valores em dicionários
+
+        Args:
+            itens: Instâncias do modelo ou linhas na ordem de `colunas`
+            datas_iso (bool): Converte as datas para texto ISO 8601
+
+        Returns:
+            List[Dict]: Um dicionário por item
+        """
+        itens = list(itens)
+        if itens and isinstance(itens[0], self.model):
+            ler = self._ler
+            return self.serializar_linhas((ler(instancia) for instancia in itens), datas_iso)
+        return self.serializar_linhas(itens, datas_iso)
+
+    def _datas_em_iso(self, linha: Sequence[Any]) -> List[Any]:
+        linha = list(linha)
+        for posicao in self._datas:
+            valor = linha[posicao]
+            if valor is not None:
+                linha[posicao] = valor.isoformat()
+        return linha
@@ -0,0 +1,109 @@
+"""
+Benchmark da inserção em lote
+
+Compara BaseRepository.bulk_create (uma instância do ORM por linha +
+add_all) com BaseRepository.bulk_insert (insert() do Core com executemany
+por lote), em um banco SQLite temporário. Cada tamanho roda em um
+subprocesso com banco próprio.
+
+Uso:
+    python benchmarks/benchmark_bulk_insert.py [linhas ...] [--sem-antigo]
+
+Padrão: 10000 100000 1000000 linhas.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+TAMANHO_LOTE = 5000
+
+
+def gerar_linhas(total):
+    """Simula as linhas de um extrato bancário já normalizadas"""
+    inicio = datetime(2024, 1, 1)
+    for i in range(total):
+        yield {
+            'usuario_id': 1,
+            'categoria_id': i % 8 + 1,
+            'descricao': f'Transação {i}',
+            'valor': round((i % 500) * 1.37, 2),
+            'data_transacao': inicio + timedelta(minutes=i),
+        }
+
+
+def executar(modo, total):
+    from flask import Flask
+    from app import db
+    from app.repositories.base_repository import BaseRepository
+
+    class TransacaoBenchmark(db.Model):
+        __tablename__ = 'transacoes_benchmark'
+        id = db.Column(db.Integer, primary_key=True)
+        usuario_id = db.Column(db.Integer, nullable=False)
+        categoria_id = db.Column(db.Integer, nullable=False)
+        descricao = db.Column(db.String(200))
+        valor = db.Column(db.Float, nullable=False)
+        data_transacao = db.Column(db.DateTime, nullable=False)
+        created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    class TransacaoBenchmarkRepository(BaseRepository):
+        def __init__(self):
+            super().__init__(TransacaoBenchmark)
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        app = Flask(__name__)
+        app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(diretorio, 'bench.db')}"
+        db.init_app(app)
+
+        with app.app_context():
+            db.create_all()
+            repositorio = TransacaoBenchmarkRepository()
+
+            inicio = time.perf_counter()
+            if modo == 'bulk_create':
+                repositorio.bulk_create(list(gerar_linhas(total)))
+            elif modo == 'bulk_insert':
+                repositorio.bulk_insert(gerar_linhas(total), batch_size=TAMANHO_LOTE)
+            else:
+                repositorio.bulk_insert(gerar_linhas(total), batch_size=TAMANHO_LOTE, returning=True)
+            segundos = time.perf_counter() - inicio
+
+            assert repositorio.count() == total
+
+    print(json.dumps({'segundos': segundos}))
+
+
+def medir(modo, total):
+    saida = subprocess.run(
+        [sys.executable, __file__, '--modo', modo, str(total)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(saida.strip().splitlines()[-1])['segundos']
+
+
+def main():
+    argumentos = sys.argv[1:]
+    if argumentos and argumentos[0] == '--modo':
+        executar(argumentos[1], int(argumentos[2]))
+        return
+
+    sem_antigo = '--sem-antigo' in argumentos
+    tamanhos = [int(a) for a in argumentos if not a.startswith('--')] or [10_000, 100_000, 1_000_000]
+    modos = ['bulk_insert', 'bulk_insert+returning'] if sem_antigo else \
+        ['bulk_create', 'bulk_insert', 'bulk_insert+returning']
+
+    print(f"{'linhas':>10} {'modo':>22} {'tempo (s)':>10} {'linhas/s':>12}")
+    for total in tamanhos:
+        for modo in modos:
+            segundos = medir(modo, total)
+            print(f"{total:>10} {modo:>22} {segundos:>10.2f} {total / segundos:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Microbenchmarks do CaretakerUsuario
+
+Mede o custo por operação de salvar (com histórico cheio, ou seja, com
+remoção do memento mais antigo), desfazer, refazer e salvar após desfazer
+(descartando os estados futuros) para várias capacidades de histórico.
+Com o buffer circular o tempo por operação não deve crescer com a
+capacidade.
+
+Uso:
+    python benchmarks/benchmark_caretaker_usuario.py [repeticoes]
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.caretaker_usuario import CaretakerUsuario
+from app.models.usuario_memento import UsuarioMemento
+
+CAPACIDADES = (50, 500, 5000)
+
+
+class UsuarioFalso:
+    """Usuário mínimo com a interface usada pelo caretaker"""
+
+    def __init__(self):
+        self.telefone = '0'
+
+    def criar_memento(self, anterior=None):
+        return UsuarioMemento('Maria', 'maria@anotaai.com', None, self.telefone,
+                              'Rua das Palmeiras, 1234', True, anterior=anterior)
+
+    def restaurar_memento(self, memento):
+        self.telefone = memento.telefone
+
+
+def historico_cheio(capacidade):
+    caretaker = CaretakerUsuario(max_historico=capacidade)
+    usuario = UsuarioFalso()
+    for i in range(capacidade):
+        usuario.telefone = str(i)
+        caretaker.salvar_estado(usuario)
+    return caretaker, usuario
+
+
+def medir(capacidade, repeticoes):
+    caretaker, usuario = historico_cheio(capacidade)
+    resultados = {}
+
+    resultados['salvar (cheio)'] = timeit.timeit(lambda: caretaker.salvar_estado(usuario), number=repeticoes)
+
+    def desfazer_refazer():
+        caretaker.desfazer(usuario)
+        caretaker.refazer(usuario)
+    resultados['desfazer+refazer'] = timeit.timeit(desfazer_refazer, number=repeticoes)
+
+    def salvar_apos_desfazer():
+        caretaker.desfazer(usuario)
+        caretaker.desfazer(usuario)
+        caretaker.salvar_estado(usuario)
+    resultados['salvar após desfazer'] = timeit.timeit(salvar_apos_desfazer, number=repeticoes)
+
+    resultados['obter_memento_atual'] = timeit.timeit(caretaker.obter_memento_atual, number=repeticoes)
+
+    return {nome: segundos / repeticoes * 1e9 for nome, segundos in resultados.items()}
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    por_capacidade = {capacidade: medir(capacidade, repeticoes) for capacidade in CAPACIDADES}
+
+    operacoes = list(next(iter(por_capacidade.values())))
+    print(f"{'operação':<24}" + ''.join(f'{f"cap={c}":>14}' for c in CAPACIDADES) + '   (ns/op)')
+    for operacao in operacoes:
+        print(f'{operacao:<24}' + ''.join(f'{por_capacidade[c][operacao]:>14.0f}' for c in CAPACIDADES))
+
+
+if __name__ == '__main__':
+    main()
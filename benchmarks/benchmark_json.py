@@ -0,0 +1,78 @@
+"""
+Benchmark da serialização JSON das listagens
+
+Compara jsonify com o provedor padrão do Flask, jsonify com
+ProvedorJSONRapido (orjson) e resposta_json_em_fluxo, medindo o tempo
+até o primeiro byte e o tempo total para consumir a resposta.
+
+Uso:
+    python benchmarks/benchmark_json.py [transacoes]
+"""
+import os
+import sys
+import time
+
+from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.json_rapido import ProvedorJSONRapido, orjson, resposta_json_em_fluxo
+
+REPETICOES = 5
+
+
+def gerar_transacoes(total):
+    return [
+        {
+            'id': i,
+            'descricao': f'Transação {i}',
+            'valor': round(i * 0.37 % 1000, 2),
+            'tipo': 'despesa' if i % 3 else 'receita',
+            'data_transacao': '2025-08-25T10:00:00',
+            'categoria_id': i % 10 + 1,
+            'categoria_nome': 'Alimentação',
+        }
+        for i in range(total)
+    ]
+
+
+def medir(app, criar_resposta):
+    """Melhor de REPETICOES: (primeiro byte, total) em segundos"""
+    melhor = None
+    for _ in range(REPETICOES):
+        with app.test_request_context():
+            inicio = time.perf_counter()
+            iterador = iter(criar_resposta().response)
+            next(iterador)
+            primeiro_byte = time.perf_counter() - inicio
+            for _ in iterador:
+                pass
+            total = time.perf_counter() - inicio
+        if melhor is None or total < melhor[1]:
+            melhor = (primeiro_byte, total)
+    return melhor
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    transacoes = gerar_transacoes(total)
+    print(f'Transações: {total} | orjson: {"sim" if orjson else "não (json padrão)"}')
+
+    padrao = Flask('padrao')
+    padrao.json = DefaultJSONProvider(padrao)
+    rapido = Flask('rapido')
+    rapido.json = ProvedorJSONRapido(rapido)
+
+    modos = [
+        ('jsonify padrão', padrao, lambda: jsonify(transacoes)),
+        ('jsonify rápido', rapido, lambda: jsonify(transacoes)),
+        ('fluxo', rapido, lambda: resposta_json_em_fluxo(transacoes)),
+    ]
+    for nome, app, criar_resposta in modos:
+        primeiro_byte, total_segundos = medir(app, criar_resposta)
+        print(f'{nome:>15}: primeiro byte {primeiro_byte:.4f}s | total {total_segundos:.4f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark da geração de relatórios CSV
+
+Compara o caminho antigo (lista materializada + DictWriter.writerows)
+com o modo em blocos de RelatorioCsvStrategy, medindo o pico de RSS e o
+tempo até o primeiro byte. Cada modo roda em um subprocesso para que o
+pico de memória de um não contamine o outro.
+
+Uso:
+    python benchmarks/benchmark_relatorio_csv.py [linhas]
+"""
+import csv
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def gerar_linhas(total):
+    """Simula um cursor do banco retornando uma linha por vez"""
+    for i in range(total):
+        yield {
+            'id': i,
+            'descricao': f'Transação {i}',
+            'valor': round(i * 0.37 % 1000, 2),
+            'tipo': 'despesa' if i % 3 else 'receita',
+            'data_transacao': '2025-08-25T10:00:00',
+            'categoria_nome': 'Alimentação',
+        }
+
+
+def modo_materializado(total, destino):
+    inicio = time.perf_counter()
+    dados = list(gerar_linhas(total))
+    with open(destino, 'w', newline='', encoding='utf-8') as arquivo:
+        writer = csv.DictWriter(arquivo, fieldnames=dados[0].keys())
+        writer.writeheader()
+        writer.writerows(dados)
+    # O arquivo só pode ser enviado depois de totalmente escrito
+    return time.perf_counter() - inicio
+
+
+def modo_stream(total, destino):
+    from app.repositories.strategies.estrategia_relatorio_csv import RelatorioCsvStrategy
+
+    inicio = time.perf_counter()
+    primeiro_byte = None
+    with open(destino, 'w', newline='', encoding='utf-8') as arquivo:
+        for bloco in RelatorioCsvStrategy().gerar_stream(gerar_linhas(total)):
+            if primeiro_byte is None:
+                primeiro_byte = time.perf_counter() - inicio
+            arquivo.write(bloco)
+    return primeiro_byte
+
+
+def executar_modo(modo, total):
+    with tempfile.TemporaryDirectory() as diretorio:
+        destino = os.path.join(diretorio, 'relatorio.csv')
+        inicio = time.perf_counter()
+        primeiro_byte = {'materializado': modo_materializado, 'stream': modo_stream}[modo](total, destino)
+        total_segundos = time.perf_counter() - inicio
+    pico_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({
+        'modo': modo,
+        'primeiro_byte_s': round(primeiro_byte, 4),
+        'total_s': round(total_segundos, 4),
+        'pico_rss_mb': round(pico_kb / 1024, 1),
+    }))
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == '--modo':
+        executar_modo(sys.argv[2], int(sys.argv[3]))
+        return
+
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f'Linhas: {total}')
+    for modo in ('materializado', 'stream'):
+        saida = subprocess.run(
+            [sys.executable, __file__, '--modo', modo, str(total)],
+            check=True, capture_output=True, text=True
+        ).stdout
+        resultado = json.loads(saida.strip().splitlines()[-1])
+        print(f"{resultado['modo']:>14}: primeiro byte {resultado['primeiro_byte_s']:.4f}s | "
+              f"total {resultado['total_s']:.4f}s | pico RSS {resultado['pico_rss_mb']:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
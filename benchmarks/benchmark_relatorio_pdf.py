@@ -0,0 +1,86 @@
+"""
+Benchmark da geração de relatórios PDF
+
+Compara o caminho antigo (uma única Table do reportlab com todas as
+linhas, paginada pelo SimpleDocTemplate) com o modo paginado em blocos
+de RelatorioPdfStrategy, para 10 mil e 100 mil linhas por padrão.
+
+Uso:
+    python benchmarks/benchmark_relatorio_pdf.py [linhas ...] [--sem-antigo]
+"""
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def gerar_linhas(total):
+    for i in range(total):
+        yield {
+            'id': i,
+            'descricao': f'Transação {i}',
+            'valor': round(i * 0.37 % 1000, 2),
+            'tipo': 'despesa' if i % 3 else 'receita',
+            'data_transacao': '2025-08-25',
+            'categoria_nome': 'Alimentação',
+        }
+
+
+def caminho_antigo(total, destino):
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, Table
+
+    dados = list(gerar_linhas(total))
+    doc = SimpleDocTemplate(destino, pagesize=A4)
+    colunas = list(dados[0].keys())
+    dados_tabela = [colunas]
+    for linha in dados:
+        dados_tabela.append([str(linha.get(col, '')) for col in colunas])
+    doc.build([Table(dados_tabela)])
+
+
+def caminho_paginado(total, destino):
+    from app.repositories.strategies.estrategia_relatorio_pdf import RelatorioPdfStrategy
+
+    RelatorioPdfStrategy().gerar_relatorio(gerar_linhas(total), destino)
+
+
+def executar_caso(nome, total):
+    funcao = {'antigo': caminho_antigo, 'paginado': caminho_paginado}[nome]
+    with tempfile.TemporaryDirectory() as diretorio:
+        destino = os.path.join(diretorio, 'relatorio.pdf')
+        inicio = time.perf_counter()
+        funcao(total, destino)
+        segundos = time.perf_counter() - inicio
+    pico_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({'segundos': round(segundos, 2), 'pico_rss_mb': round(pico_mb, 1)}))
+
+
+def main():
+    if len(sys.argv) > 3 and sys.argv[1] == '--caso':
+        executar_caso(sys.argv[2], int(sys.argv[3]))
+        return
+
+    argumentos = [a for a in sys.argv[1:] if not a.startswith('--')]
+    totais = [int(a) for a in argumentos] or [10_000, 100_000]
+    caminhos = ['paginado'] if '--sem-antigo' in sys.argv else ['antigo', 'paginado']
+
+    for total in totais:
+        for nome in caminhos:
+            # Subprocesso por caso para que o pico de RSS seja medido isoladamente
+            saida = subprocess.run(
+                [sys.executable, __file__, '--caso', nome, str(total)],
+                check=True, capture_output=True, text=True
+            ).stdout
+            resultado = json.loads(saida.strip().splitlines()[-1])
+            print(f"{total:>8} linhas | {nome:>8}: {resultado['segundos']:8.2f}s | "
+                  f"pico RSS {resultado['pico_rss_mb']:8.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark de memória dos mementos de usuário
+
+Mede os bytes por memento em um histórico de 50 alterações de perfil em
+que apenas um campo muda a cada salvamento (o caso comum), comparando a
+representação antiga (objeto com __dict__ e cópia de todos os campos) com
+o UsuarioMemento atual (slots + compartilhamento com o memento anterior).
+
+Uso:
+    python benchmarks/benchmark_usuario_memento.py [mementos]
+"""
+import os
+import sys
+import tracemalloc
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.usuario_memento import UsuarioMemento
+
+
+class UsuarioMementoAntigo:
+    """Representação anterior: um __dict__ por memento"""
+
+    def __init__(self, nome, email, data_nascimento=None, telefone=None,
+                 endereco=None, ativo=True, timestamp=None):
+        self._nome = nome
+        self._email = email
+        self._data_nascimento = data_nascimento
+        self._telefone = telefone
+        self._endereco = endereco
+        self._ativo = ativo
+        self._timestamp = timestamp or datetime.now()
+
+
+def estado(i):
+    # Cada salvamento recebe strings novas (como ao ler o formulário ou o banco);
+    # apenas o telefone muda de fato.
+    return dict(
+        nome=''.join(['Maria ', 'da Silva']),
+        email=''.join(['maria', '@anotaai.com']),
+        data_nascimento=date(1990, 5, 17),
+        telefone=f'(11) 9{i:04d}-0000',
+        endereco=''.join(['Rua das Palmeiras, 1234, apto 56 - ', 'Jardim Paulista, São Paulo - SP']),
+        ativo=True,
+    )
+
+
+def medir(criar, total):
+    tracemalloc.start()
+    antes, _ = tracemalloc.get_traced_memory()
+    historico = []
+    anterior = None
+    for i in range(total):
+        anterior = criar(estado(i), anterior)
+        historico.append(anterior)
+    depois, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (depois - antes) / total
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    antigo = medir(lambda dados, anterior: UsuarioMementoAntigo(**dados), total)
+    atual = medir(lambda dados, anterior: UsuarioMemento(**dados, anterior=anterior), total)
+    print(f'Mementos: {total}')
+    print(f'  antigo: {antigo:8.1f} bytes/memento')
+    print(f'   atual: {atual:8.1f} bytes/memento ({atual / antigo:.0%} do antigo)')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,5 @@
 import os
-from decouple import config
+from decouple import Csv, config
 
 # Caminho base do projeto
 BASE_DIR = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
@@ -8,13 +8,130 @@ DATA_DIR = os.path.join(BASE_DIR, 'data')
 # Garantir que o diretório data existe
 os.makedirs(DATA_DIR, exist_ok=True)
 
+def opcoes_engine(uri, pool_size=5, max_overflow=10, pool_recycle=-1, pool_timeout=30,
+                  pool_pre_ping=False, statement_timeout=0):
+    """
+    Monta o SQLALCHEMY_ENGINE_OPTIONS para a URI do banco
+    
+    Args:
+        uri (str): URI do banco
+        pool_size (int): Conexões mantidas abertas no pool
+        max_overflow (int): Conexões extras permitidas acima de pool_size
+        pool_recycle (int): Segundos até reciclar uma conexão (-1 = nunca)
+        pool_timeout (int): Segundos esperando uma conexão livre do pool
+        pool_pre_ping (bool): Testa a conexão antes de entregá-la
+        statement_timeout (int): Milissegundos de espera por trava (SQLite) ou
+                                 tempo máximo de um comando (PostgreSQL); 0 = padrão
+    
+    Returns:
+        dict: Opções repassadas ao create_engine
+    """
+    # SQLite em memória usa um pool próprio (uma conexão por thread)
+    if uri.startswith('sqlite') and (uri in ('sqlite://', 'sqlite:///') or ':memory:' in uri):
+        return {}
+    
+    opcoes = {
+        'pool_size': pool_size,
+        'max_overflow': max_overflow,
+        'pool_recycle': pool_recycle,
+        'pool_timeout': pool_timeout,
+        'pool_pre_ping': pool_pre_ping,
+    }
+    if statement_timeout and uri.startswith('sqlite'):
+        opcoes['connect_args'] = {'timeout': statement_timeout / 1000}
+    elif statement_timeout and uri.startswith('postgresql'):
+        opcoes['connect_args'] = {'options': f'-c statement_timeout={statement_timeout}'}
+    return opcoes
+
+def opcoes_pool(padrao_pool_size, padrao_max_overflow, padrao_recycle, padrao_pre_ping):
+    """Parâmetros do pool do ambiente, sobrescrevíveis por variáveis de ambiente"""
+    return {
+        'pool_size': config('DB_POOL_SIZE', default=padrao_pool_size, cast=int),
+        'max_overflow': config('DB_MAX_OVERFLOW', default=padrao_max_overflow, cast=int),
+        'pool_recycle': config('DB_POOL_RECYCLE', default=padrao_recycle, cast=int),
+        'pool_timeout': config('DB_POOL_TIMEOUT', default=30, cast=int),
+        'pool_pre_ping': config('DB_POOL_PRE_PING', default=padrao_pre_ping, cast=bool),
+        'statement_timeout': config('DB_STATEMENT_TIMEOUT', default=5000, cast=int),
+    }
+
+def binds_leitura(uri_leitura, pool):
+    """SQLALCHEMY_BINDS com a réplica de leitura, se houver URI"""
+    if not uri_leitura:
+        return {}
+    return {'leitura': {'url': uri_leitura, **opcoes_engine(uri_leitura, **pool)}}
+
+POOL_PADRAO = opcoes_pool(5, 10, -1, False)
+POOL_PRODUCAO = opcoes_pool(10, 20, 1800, True)
+
 class Config:
     SECRET_KEY = config('SECRET_KEY', default='dev-secret-key')
+    # E-mails dos usuários com acesso às rotas de diagnóstico (/api/sistema/...)
+    ADMINS = config('ADMINS', default='', cast=Csv())
     # Usar caminho absoluto para o banco de dados
     DB_PATH = os.path.join(DATA_DIR, "anota_ai.db")
     SQLALCHEMY_DATABASE_URI = config('DATABASE_URL', default=f'sqlite:///{DB_PATH}')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = config('SQLALCHEMY_ECHO', default=False, cast=bool)
+    
+    # Pool de conexões
+    SQLALCHEMY_ENGINE_OPTIONS = opcoes_engine(SQLALCHEMY_DATABASE_URI, **POOL_PADRAO)
+    
+    # PRAGMAs aplicados a cada nova conexão SQLite: WAL permite leituras
+    # concorrentes com um escritor, synchronous=NORMAL é seguro em WAL e
+    # evita um fsync por commit, busy_timeout espera a trava em vez de
+    # falhar com "database is locked"
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': config('SQLITE_MMAP_SIZE', default=256 * 1024 * 1024, cast=int),
+        'busy_timeout': POOL_PADRAO['statement_timeout'],
+    }
+    
+    # Réplica de leitura opcional, usada pelas leituras dos repositórios e
+    # relatórios. Com SQLite pode ser uma cópia do arquivo aberta somente
+    # para leitura: sqlite:///file:/caminho/anota_ai.db?mode=ro&uri=true
+    DATABASE_READ_URL = config('DATABASE_READ_URL', default='')
+    SQLALCHEMY_BINDS = binds_leitura(DATABASE_READ_URL, POOL_PADRAO)
+    SQLITE_PRAGMAS_LEITURA = {
+        'query_only': 'ON',
+        'mmap_size': SQLITE_PRAGMAS['mmap_size'],
+        'busy_timeout': SQLITE_PRAGMAS['busy_timeout'],
+    }
+    # Segundos em que um usuário continua lendo do primário após escrever
+    DB_JANELA_LEITURA_PRIMARIO = config('DB_JANELA_LEITURA_PRIMARIO', default=5, cast=int)
+    
+    # Cache das respostas do dashboard no servidor: 'memoria' (por processo),
+    # 'sqlite' (arquivo em CACHE_RESPOSTAS_URL compartilhado pelos workers da
+    # máquina) ou 'redis' (URL do servidor em CACHE_RESPOSTAS_URL)
+    CACHE_RESPOSTAS_BACKEND = config('CACHE_RESPOSTAS_BACKEND', default='memoria')
+    CACHE_RESPOSTAS_URL = config('CACHE_RESPOSTAS_URL', default=os.path.join(DATA_DIR, 'cache_respostas.db'))
+    CACHE_RESPOSTAS_TTL = config('CACHE_RESPOSTAS_TTL', default=60, cast=int)
+    CACHE_RESPOSTAS_MAX_ITENS = config('CACHE_RESPOSTAS_MAX_ITENS', default=5000, cast=int)
+    
+    # Versões dos dados usadas nos ETags (cache_http): 'memoria' (por processo,
+    # só para um único worker), 'sqlite' ou 'redis' (compartilhadas entre os
+    # workers, URL em VERSOES_DADOS_URL)
+    VERSOES_DADOS_BACKEND = config('VERSOES_DADOS_BACKEND', default='memoria')
+    VERSOES_DADOS_URL = config('VERSOES_DADOS_URL', default=os.path.join(DATA_DIR, 'versoes_dados.db'))
+    
+    # Cache de segundo nível dos repositórios (get_by_id/get_by_field/fast_count):
+    # '' (desligado), 'memoria' (por processo, só para um único worker),
+    # 'sqlite' ou 'redis' (compartilhados, URL em REPOSITORIO_CACHE_URL)
+    REPOSITORIO_CACHE_BACKEND = config('REPOSITORIO_CACHE_BACKEND', default='')
+    REPOSITORIO_CACHE_URL = config('REPOSITORIO_CACHE_URL', default=os.path.join(DATA_DIR, 'cache_repositorios.db'))
+    REPOSITORIO_CACHE_TTL = config('REPOSITORIO_CACHE_TTL', default=300, cast=int)
+    REPOSITORIO_CACHE_MAX_ITENS = config('REPOSITORIO_CACHE_MAX_ITENS', default=10000, cast=int)
+    
+    # Eventos do dashboard (SSE) entre workers: '' (cada processo avisa só
+    # as próprias conexões) ou 'redis' (pub/sub na URL EVENTOS_FANOUT_URL)
+    EVENTOS_FANOUT = config('EVENTOS_FANOUT', default='')
+    EVENTOS_FANOUT_URL = config('EVENTOS_FANOUT_URL', default='redis://localhost:6379/0')
+    
+    # Exportação de relatórios em segundo plano (/api/relatorios): 'threads'
+    # (padrão; a consulta de transações lê os stores em memória do processo
+    # web) ou 'processos' (para consultas que leem só o banco)
+    RELATORIOS_EXECUTOR = config('RELATORIOS_EXECUTOR', default='threads')
+    RELATORIOS_DIRETORIO = config('RELATORIOS_DIRETORIO', default=os.path.join(DATA_DIR, 'relatorios'))
 
 class DevelopmentConfig(Config):
     DEBUG = True
@@ -22,10 +139,15 @@ class DevelopmentConfig(Config):
 
 class ProductionConfig(Config):
     DEBUG = False
+    SQLALCHEMY_ENGINE_OPTIONS = opcoes_engine(Config.SQLALCHEMY_DATABASE_URI, **POOL_PRODUCAO)
+    SQLALCHEMY_BINDS = binds_leitura(Config.DATABASE_READ_URL, POOL_PRODUCAO)
 
 class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    SQLALCHEMY_ENGINE_OPTIONS = opcoes_engine(SQLALCHEMY_DATABASE_URI)
+    SQLALCHEMY_BINDS = {}
+    CACHE_RESPOSTAS_BACKEND = 'memoria'
     WTF_CSRF_ENABLED = False
 
 config_dict = {
@@ -35,4 +157,10 @@ config_dict = {
 }
 
 def get_config():
-    return config_dict.get(config('FLASK_ENV', default='development'), DevelopmentConfig)
+    """
+    Classe de configuração do ambiente escolhido em FLASK_ENV
+    
+    Sem FLASK_ENV usa Config, sem DEBUG nem SQLALCHEMY_ECHO forçados;
+    um nome desconhecido também cai em Config.
+    """
+    return config_dict.get(config('FLASK_ENV', default=''), Config)
@@ -0,0 +1,42 @@
+"""esquema inicial
+
+Revision ID: 1c5e8b0f9a24
+Revises:
+Create Date: 2026-10-18 14:00:00
+
+Tabelas dos modelos existentes, sem os índices secundários (criados na
+revisão seguinte). Bancos criados antes com db.create_all() já têm o
+esquema completo: marque-os com `flask db stamp head` em vez de aplicar
+as revisões.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1c5e8b0f9a24'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'usuarios',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('nome', sa.String(length=100), nullable=False),
+        sa.Column('email', sa.String(length=120), nullable=False),
+        sa.Column('senha_hash', sa.String(length=255), nullable=False),
+        sa.Column('data_nascimento', sa.Date(), nullable=True),
+        sa.Column('telefone', sa.String(length=20), nullable=True),
+        sa.Column('endereco', sa.Text(), nullable=True),
+        sa.Column('ativo', sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('email'),
+    )
+
+
+def downgrade():
+    op.drop_table('usuarios')
@@ -0,0 +1,40 @@
+"""indices compostos e de created_at/updated_at
+
+Revision ID: 3f9c2a7d41b8
+Revises: 1c5e8b0f9a24
+Create Date: 2026-10-18 14:30:00
+
+Os índices são criados sem verificar se já existem: um índice que falha
+interrompe a migração em vez de ficar faltando. Bancos criados com
+db.create_all() já têm todos eles; marque-os com `flask db stamp head`.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9c2a7d41b8'
+down_revision = '1c5e8b0f9a24'
+branch_labels = None
+depends_on = None
+
+
+# tabela -> [(nome do índice, colunas)]
+INDICES = {
+    'usuarios': [
+        ('ix_usuarios_ativo_id', ['ativo', 'id']),
+        ('ix_usuarios_created_at', ['created_at']),
+        ('ix_usuarios_updated_at', ['updated_at']),
+    ],
+}
+
+
+def upgrade():
+    for tabela, indices in INDICES.items():
+        for nome, colunas in indices:
+            op.create_index(nome, tabela, colunas)
+
+
+def downgrade():
+    for tabela, indices in INDICES.items():
+        for nome, _ in indices:
+            op.drop_index(nome, table_name=tabela)
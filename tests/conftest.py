@@ -0,0 +1,48 @@
+import os
+
+os.environ['FLASK_ENV'] = 'testing'
+
+import pytest
+
+from app import USUARIO_DEMO, create_app
+
+
+@pytest.fixture
+def app():
+    return create_app()
+
+
+@pytest.fixture
+def cliente_logado(client):
+    """Cliente de teste com a sessão do usuário demo"""
+    with client.session_transaction() as sessao:
+        sessao['_user_id'] = USUARIO_DEMO.get_id()
+        sessao['_fresh'] = True
+    return client
+
+
+@pytest.fixture
+def banco(app):
+    """Esquema criado no SQLite em memória da configuração de testes"""
+    from app import db
+
+    with app.app_context():
+        db.create_all()
+        yield db
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def transacao():
+    """Fábrica de transações em dicionário, como guardadas pelos stores
+
+    Os campos não informados recebem uma despesa de R$ 5,00 do usuário 1.
+    """
+    def criar(id=None, data='2026-10-01', valor=5.0, **campos):
+        dados = {'id': id, 'descricao': 'Café', 'valor': valor, 'tipo': 'despesa',
+                 'data_transacao': data, 'categoria_id': 1, 'usuario_id': 1}
+        dados.update(campos)
+        return dados
+
+    return criar
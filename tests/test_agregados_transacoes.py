@@ -0,0 +1,52 @@
+from app import USUARIO_DEMO
+from app.stores import AgregadosTransacoes
+
+
+def test_totais_separados_por_dono(transacao):
+    agregados = AgregadosTransacoes()
+    agregados.registrar(transacao(valor=100.0))
+    agregados.registrar(transacao(valor=50.0, tipo='receita'))
+    agregados.registrar(transacao(valor=30.0, usuario_id=2))
+
+    assert agregados.totais_mes(1, '2026-10') == {'receitas': 50.0, 'despesas': 100.0, 'quantidade': 2}
+    assert agregados.totais_mes(2, '2026-10') == {'receitas': 0.0, 'despesas': 30.0, 'quantidade': 1}
+    assert agregados.totais_usuario(3)['quantidade'] == 0
+
+
+def test_remover_descarta_chaves_vazias(transacao):
+    agregados = AgregadosTransacoes()
+    despesa = transacao(valor=10.1)
+    agregados.registrar(despesa)
+    agregados.remover(despesa)
+
+    assert agregados.totais_mes(1, '2026-10') == {'receitas': 0.0, 'despesas': 0.0, 'quantidade': 0}
+    assert agregados.totais_por_categoria(1, '2026-10') == {}
+
+
+def test_substituir_move_entre_meses_categorias_e_donos(transacao):
+    agregados = AgregadosTransacoes()
+    anterior = transacao(valor=40.0)
+    agregados.registrar(anterior)
+    agregados.substituir(anterior, transacao(data='2026-11-01', valor=25.0, usuario_id=2, categoria_id=3))
+
+    assert agregados.totais_mes(1, '2026-10')['quantidade'] == 0
+    assert agregados.totais_mes(2, '2026-11')['despesas'] == 25.0
+    assert agregados.totais_por_categoria(2, '2026-11') == {
+        3: {'receitas': 0.0, 'despesas': 25.0, 'quantidade': 1}
+    }
+
+
+def test_transacao_criada_pela_api_guarda_o_dono(cliente_logado):
+    from app.routes.dashboard_api import AGREGADOS_TRANSACOES, TRANSACOES_FICTICIAS
+
+    mes = '2026-01'
+    antes = AGREGADOS_TRANSACOES.totais_mes(USUARIO_DEMO.id, mes)['quantidade']
+    resposta = cliente_logado.post('/api/despesas', json={
+        'descricao': 'Teste', 'valor': 12.5, 'tipo': 'despesa',
+        'data_transacao': '2026-01-15T10:00:00', 'categoria_id': 1
+    })
+
+    assert resposta.status_code == 201
+    criada = TRANSACOES_FICTICIAS.obter(resposta.get_json()['data']['id'])
+    assert criada['usuario_id'] == USUARIO_DEMO.id
+    assert AGREGADOS_TRANSACOES.totais_mes(USUARIO_DEMO.id, mes)['quantidade'] == antes + 1
@@ -0,0 +1,72 @@
+import time
+
+import pytest
+from flask import Flask, session
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import column, table, text
+
+from app.utils.banco import BIND_LEITURA, SessaoRoteada, leitura_replica, somente_primario
+
+
+@pytest.fixture
+def banco_replica(tmp_path):
+    """Aplicação isolada com primário e réplica em arquivos diferentes, cada um identificado em 'origem'"""
+    aplicacao = Flask(__name__)
+    aplicacao.config.update(
+        SECRET_KEY='teste',
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'primario.db'}",
+        SQLALCHEMY_BINDS={BIND_LEITURA: f"sqlite:///{tmp_path / 'replica.db'}"},
+        DB_JANELA_LEITURA_PRIMARIO=5,
+    )
+    banco = SQLAlchemy(aplicacao, session_options={'class_': SessaoRoteada})
+    with aplicacao.app_context():
+        for nome, engine in (('primario', banco.engine), ('replica', banco.engines[BIND_LEITURA])):
+            with engine.begin() as conexao:
+                conexao.execute(text('CREATE TABLE origem (nome TEXT)'))
+                conexao.execute(text('INSERT INTO origem VALUES (:nome)'), {'nome': nome})
+    with aplicacao.test_request_context():
+        yield banco
+        banco.session.remove()
+
+
+def origem(banco):
+    return banco.session.execute(text('SELECT nome FROM origem LIMIT 1')).scalar()
+
+
+def test_leituras_vao_para_a_replica_so_quando_pedido(banco_replica):
+    assert origem(banco_replica) == 'primario'
+    with leitura_replica():
+        assert origem(banco_replica) == 'replica'
+        with somente_primario():
+            assert origem(banco_replica) == 'primario'
+
+
+@pytest.mark.parametrize('comando', [
+    text("INSERT INTO origem VALUES ('novo')"),
+    table('origem', column('nome')).insert().values(nome='novo'),
+])
+def test_depois_de_escrever_a_sessao_le_do_primario(banco_replica, comando):
+    banco_replica.session.execute(comando)
+
+    with leitura_replica():
+        assert origem(banco_replica) == 'primario'
+    assert session['_primario_ate'] > time.time()
+
+
+def test_janela_de_leitura_no_primario_entre_requisicoes(banco_replica):
+    session['_primario_ate'] = time.time() + 5
+    with leitura_replica():
+        assert origem(banco_replica) == 'primario'
+
+    session['_primario_ate'] = time.time() - 1
+    with leitura_replica():
+        assert origem(banco_replica) == 'replica'
+
+
+def test_sem_replica_configurada_usa_o_primario(app, banco):
+    from app.models import Usuario
+    from app.repositories import UsuarioRepository
+
+    Usuario(nome='Ana', email='ana@anotaai.com', senha='x').save()
+    with leitura_replica():
+        assert UsuarioRepository().exists(email='ana@anotaai.com')
@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.models import Usuario
+from app.repositories import UsuarioRepository
+
+
+def linhas(*emails, nome='Usuário'):
+    return [{'nome': nome, 'email': email, 'senha_hash': 'x'} for email in emails]
+
+
+def nomes_por_email(banco):
+    return dict(banco.session.query(Usuario.email, Usuario.nome).all())
+
+
+def test_returning_devolve_ids_na_ordem_da_entrada(banco):
+    emails = [f'u{i}@anotaai.com' for i in (5, 1, 4, 2, 3)]
+
+    ids = UsuarioRepository().bulk_insert(linhas(*emails), batch_size=2, returning=True)
+
+    por_id = dict(banco.session.query(Usuario.id, Usuario.email).all())
+    assert [por_id[id] for id in ids] == emails
+
+
+def test_falha_em_um_lote_desfaz_todos(banco):
+    with pytest.raises(IntegrityError):
+        UsuarioRepository().bulk_insert(linhas('a@x.com', 'b@x.com', 'c@x.com', 'a@x.com'), batch_size=2)
+
+    assert banco.session.query(Usuario).count() == 0
+
+
+def test_commit_por_lote_mantem_lotes_anteriores(banco):
+    with pytest.raises(IntegrityError):
+        UsuarioRepository().bulk_insert(linhas('a@x.com', 'b@x.com', 'c@x.com', 'a@x.com'),
+                                        batch_size=2, commit_per_batch=True)
+
+    assert banco.session.query(Usuario).count() == 2
+
+
+def test_upsert_nativo(banco):
+    repositorio = UsuarioRepository()
+    repositorio.bulk_insert(linhas('a@x.com', 'b@x.com'))
+
+    repositorio.bulk_insert(linhas('b@x.com', 'c@x.com', nome='Novo'), upsert=True,
+                            conflict_columns=('email',), update_columns=('nome',))
+
+    assert nomes_por_email(banco) == {'a@x.com': 'Usuário', 'b@x.com': 'Novo', 'c@x.com': 'Novo'}
+
+
+def test_upsert_generico_para_bancos_sem_on_conflict(banco):
+    repositorio = UsuarioRepository()
+    repositorio.NATIVE_UPSERT_DIALECTS = ()
+    [id_b] = repositorio.bulk_insert(linhas('b@x.com'), returning=True)
+
+    ids = repositorio.bulk_insert(linhas('c@x.com', 'b@x.com', nome='Novo'), upsert=True,
+                                  conflict_columns=('email',), update_columns=('nome',), returning=True)
+
+    assert nomes_por_email(banco) == {'b@x.com': 'Novo', 'c@x.com': 'Novo'}
+    assert ids[1] == id_b
+    assert banco.session.get(Usuario, ids[0]).email == 'c@x.com'
+
+
+def test_returning_sem_suporte_a_executemany(banco, monkeypatch):
+    monkeypatch.setattr(banco.engine.dialect, 'insert_executemany_returning', False)
+
+    ids = UsuarioRepository().bulk_insert(linhas('a@x.com', 'b@x.com'), returning=True)
+
+    assert [banco.session.get(Usuario, id).email for id in ids] == ['a@x.com', 'b@x.com']
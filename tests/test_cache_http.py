@@ -0,0 +1,72 @@
+import pytest
+from flask_login import login_user
+
+from app import USUARIO_DEMO, UsuarioFicticio
+from app.utils.cache import CacheMemoria, CacheSqlite
+from app.utils.cache_http import VERSOES_DADOS, VersoesDados, etag_dados
+
+
+def test_etag_e_304_ate_a_proxima_escrita(cliente_logado):
+    primeira = cliente_logado.get('/api/categorias/1')
+    assert primeira.status_code == 200
+    assert primeira.headers['Cache-Control'] == 'private, no-cache'
+    etag = primeira.headers['ETag']
+
+    revalidada = cliente_logado.get('/api/categorias/1', headers={'If-None-Match': etag})
+    assert revalidada.status_code == 304
+    assert revalidada.data == b''
+
+    cliente_logado.post('/categorias/create')
+    alterada = cliente_logado.get('/api/categorias/1', headers={'If-None-Match': etag})
+    assert alterada.status_code == 200
+    assert alterada.headers['ETag'] != etag
+
+
+def test_etag_depende_da_rota_e_do_usuario(app):
+    def etag(caminho, usuario, por_usuario=True):
+        with app.app_context(), app.test_request_context(caminho):
+            login_user(usuario)
+            return etag_dados('categorias', por_usuario=por_usuario)
+
+    outro = UsuarioFicticio(2, 'bia@anotaai.com', 'Bia')
+    assert etag('/api/categorias/1', USUARIO_DEMO) == etag('/api/categorias/1', USUARIO_DEMO)
+    assert etag('/api/categorias/1', USUARIO_DEMO) != etag('/api/categorias/2', USUARIO_DEMO)
+    assert etag('/api/categorias/1', USUARIO_DEMO) != etag('/api/categorias/1', outro)
+    assert etag('/api/dicas', USUARIO_DEMO, False) == etag('/api/dicas', outro, False)
+
+
+def test_respostas_de_erro_nao_recebem_etag(cliente_logado):
+    resposta = cliente_logado.get('/api/categorias/999')
+    assert resposta.status_code == 404
+    assert 'ETag' not in resposta.headers
+
+
+def test_versoes_compartilhadas_entre_processos(tmp_path):
+    # Dois "workers" com backends próprios apontando para o mesmo arquivo
+    caminho = str(tmp_path / 'versoes.db')
+    worker_a = VersoesDados(CacheSqlite(caminho, ttl=None))
+    worker_b = VersoesDados(CacheSqlite(caminho, ttl=None))
+
+    assert worker_a.obter('transacoes') == worker_b.obter('transacoes')
+    anterior = worker_b.obter('transacoes')
+    worker_a.incrementar('transacoes')
+    assert worker_b.obter('transacoes') != anterior
+    assert worker_b.obter('transacoes') == worker_a.obter('transacoes')
+
+
+def test_versoes_em_memoria_sao_do_processo():
+    worker_a, worker_b = VersoesDados(), VersoesDados()
+    assert worker_a.obter('transacoes') != worker_b.obter('transacoes')
+
+
+def test_versao_descartada_do_backend_gera_uma_nova():
+    versoes = VersoesDados(CacheMemoria(ttl=None))
+    anterior = versoes.obter('transacoes')
+    versoes.backend.limpar()
+    assert versoes.obter('transacoes') != anterior
+
+
+def test_backend_desconhecido(app):
+    with pytest.raises(ValueError):
+        VERSOES_DADOS.configurar({'VERSOES_DADOS_BACKEND': 'memcached'})
+    VERSOES_DADOS.configurar(app.config)
@@ -0,0 +1,148 @@
+import pytest
+from flask import Flask, jsonify, request
+from flask_login import LoginManager, UserMixin, login_required
+
+from app import USUARIO_DEMO
+from app.utils.cache import CacheMemoria, CacheSqlite
+from app.utils.cache_respostas import CacheRespostas
+
+
+class Usuario(UserMixin):
+    def __init__(self, id):
+        self.id = id
+
+
+def criar_aplicacao(cache):
+    """Aplicação mínima: o usuário vem do cabeçalho X-Usuario e cada rota conta suas execuções"""
+    aplicacao = Flask(__name__)
+    gerenciador = LoginManager(aplicacao)
+    gerenciador.request_loader(lambda req: Usuario(req.headers['X-Usuario']) if 'X-Usuario' in req.headers else None)
+    execucoes = {'saldo': 0, 'falha': 0, 'fluxo': 0}
+
+    @aplicacao.route('/saldo')
+    @login_required
+    @cache.em_cache('transacoes')
+    def saldo():
+        execucoes['saldo'] += 1
+        return jsonify(execucao=execucoes['saldo'], pagina=request.args.get('pagina'))
+
+    @aplicacao.route('/falha')
+    @cache.em_cache('transacoes')
+    def falha():
+        execucoes['falha'] += 1
+        return jsonify(error='indisponível'), 503
+
+    @aplicacao.route('/fluxo')
+    @cache.em_cache('transacoes')
+    def fluxo():
+        execucoes['fluxo'] += 1
+        return aplicacao.response_class(iter([b'[', b']']), mimetype='application/json')
+
+    cache.registrar_rotas(aplicacao)
+    return aplicacao, execucoes
+
+
+@pytest.fixture
+def cache():
+    return CacheRespostas(CacheMemoria(ttl=60))
+
+
+def get(cliente, caminho, usuario='1'):
+    return cliente.get(caminho, headers={'X-Usuario': usuario}).get_json()
+
+
+def test_resposta_reaproveitada_por_usuario_e_argumentos(cache):
+    aplicacao, execucoes = criar_aplicacao(cache)
+    cliente = aplicacao.test_client()
+
+    assert get(cliente, '/saldo') == get(cliente, '/saldo') == {'execucao': 1, 'pagina': None}
+    assert get(cliente, '/saldo?pagina=2')['execucao'] == 2
+    assert get(cliente, '/saldo', usuario='2')['execucao'] == 3
+    assert execucoes['saldo'] == 3
+
+    rotas = cache.estatisticas()['rotas']
+    assert rotas['saldo'] == {'acertos': 1, 'falhas': 3, 'taxa_acerto': 0.25}
+
+
+def test_invalidar_descarta_so_as_respostas_do_usuario(cache):
+    aplicacao, execucoes = criar_aplicacao(cache)
+    cliente = aplicacao.test_client()
+    get(cliente, '/saldo', usuario='1')
+    get(cliente, '/saldo', usuario='12')
+
+    cache.invalidar('transacoes', '1')
+    assert get(cliente, '/saldo', usuario='1')['execucao'] == 3
+    assert get(cliente, '/saldo', usuario='12')['execucao'] == 2
+
+    cache.invalidar('transacoes')
+    assert get(cliente, '/saldo', usuario='12')['execucao'] == 4
+    cache.invalidar('categorias')
+    assert get(cliente, '/saldo', usuario='12')['execucao'] == 4
+
+
+def test_erros_e_respostas_em_fluxo_nao_sao_guardados(cache):
+    aplicacao, execucoes = criar_aplicacao(cache)
+    cliente = aplicacao.test_client()
+    for _ in range(2):
+        assert cliente.get('/falha').status_code == 503
+        assert cliente.get('/fluxo').data == b'[]'
+
+    assert execucoes['falha'] == execucoes['fluxo'] == 2
+
+
+def test_invalidacao_vale_para_todos_os_processos_com_backend_sqlite(tmp_path):
+    caminho = str(tmp_path / 'respostas.db')
+    worker_a, execucoes_a = criar_aplicacao(CacheRespostas(CacheSqlite(caminho, ttl=60)))
+    worker_b, execucoes_b = criar_aplicacao(cache_b := CacheRespostas(CacheSqlite(caminho, ttl=60)))
+
+    get(worker_a.test_client(), '/saldo')
+    assert get(worker_b.test_client(), '/saldo')['execucao'] == 1
+    assert execucoes_b['saldo'] == 0
+
+    cache_b.invalidar('transacoes', '1')
+    assert get(worker_a.test_client(), '/saldo')['execucao'] == 2
+
+
+def test_escrita_na_api_invalida_o_resumo_do_dashboard(cliente_logado):
+    antes = cliente_logado.get('/api/dashboard/resumo').get_json()
+    assert cliente_logado.get('/api/dashboard/resumo').get_json() == antes
+
+    criada = cliente_logado.post('/api/despesas', json={
+        'descricao': 'Invalidação do cache', 'valor': 12.5, 'categoria_id': 1
+    }).get_json()['data']
+    try:
+        depois = cliente_logado.get('/api/dashboard/resumo').get_json()
+        assert depois['transacoes_recentes'][0]['id'] == criada['id']
+        assert depois['despesas_mes'] == pytest.approx(antes['despesas_mes'] + 12.5)
+    finally:
+        cliente_logado.delete(f"/api/despesas/{criada['id']}")
+
+
+def test_estatisticas_restritas_a_administradores(app, cliente_logado):
+    assert cliente_logado.get('/api/sistema/cache').status_code == 403
+    app.config['ADMINS'] = ['demo@anotaai.com']
+    assert 'rotas' in cliente_logado.get('/api/sistema/cache').get_json()
+
+
+@pytest.mark.parametrize('url', ['/api/dashboard/resumo', '/api/dashboard'])
+def test_transacoes_recentes_so_do_usuario(cliente_logado, url):
+    from app.routes.dashboard_api import (
+        AGREGADOS_TRANSACOES, INDICE_DEDUPLICACAO, RELATORIO_COLUNAR, TRANSACOES_FICTICIAS,
+        TRAVA_TRANSACOES, gravar_transacao
+    )
+
+    # Escrita de outro usuário invalida só o cache dele: a lista do demo não pode depender dela
+    alheia = {'usuario_id': USUARIO_DEMO.id + 1, 'descricao': 'De outro usuário', 'valor': 1.0,
+              'tipo': 'despesa', 'data_transacao': '2999-01-01', 'categoria_id': 1}
+    with TRAVA_TRANSACOES:
+        gravar_transacao(alheia)
+    try:
+        recentes = cliente_logado.get(url).get_json()['transacoes_recentes']
+        assert recentes
+        assert all(transacao['usuario_id'] == USUARIO_DEMO.id for transacao in recentes)
+    finally:
+        with TRAVA_TRANSACOES:
+            TRANSACOES_FICTICIAS.remover(alheia['id'])
+            AGREGADOS_TRANSACOES.remover(alheia)
+            RELATORIO_COLUNAR.remover(alheia['id'])
+            INDICE_DEDUPLICACAO.remover(alheia)
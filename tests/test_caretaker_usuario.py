@@ -0,0 +1,93 @@
+import pytest
+
+from app.models import Usuario
+from app.models.caretaker_usuario import CaretakerUsuario
+
+
+@pytest.fixture
+def usuario():
+    usuario = Usuario('Nome 0', 'ana@anotaai.com', 'senha')
+    usuario.id = 1
+    return usuario
+
+
+def salvar_nomes(caretaker, usuario, quantidade):
+    for i in range(quantidade):
+        usuario.nome = f'Nome {i}'
+        caretaker.salvar_estado(usuario)
+
+
+def test_desfazer_e_refazer(usuario):
+    caretaker = CaretakerUsuario()
+    salvar_nomes(caretaker, usuario, 3)
+
+    assert caretaker.desfazer(usuario) and usuario.nome == 'Nome 1'
+    assert caretaker.desfazer(usuario) and usuario.nome == 'Nome 0'
+    assert not caretaker.desfazer(usuario)
+    assert caretaker.refazer(usuario) and usuario.nome == 'Nome 1'
+
+
+def test_salvar_apos_desfazer_descarta_estados_futuros(usuario):
+    caretaker = CaretakerUsuario()
+    salvar_nomes(caretaker, usuario, 3)
+    caretaker.desfazer(usuario)
+    usuario.nome = 'Novo'
+    caretaker.salvar_estado(usuario)
+
+    assert [m.nome for m in caretaker.obter_historico()] == ['Nome 0', 'Nome 1', 'Novo']
+    assert not caretaker.pode_refazer()
+
+
+def test_estados_descartados_liberam_as_posicoes(usuario):
+    caretaker = CaretakerUsuario(max_historico=5)
+    salvar_nomes(caretaker, usuario, 4)
+    caretaker.navegar_para(1, usuario)
+    caretaker.salvar_estado(usuario)
+
+    assert sum(memento is not None for memento in caretaker._buffer) == 3
+
+
+@pytest.mark.parametrize('max_historico', [0, -1])
+def test_max_historico_invalido(max_historico):
+    with pytest.raises(ValueError):
+        CaretakerUsuario(max_historico=max_historico)
+
+
+def test_max_historico_um(usuario):
+    caretaker = CaretakerUsuario(max_historico=1)
+    salvar_nomes(caretaker, usuario, 3)
+
+    assert [m.nome for m in caretaker.obter_historico()] == ['Nome 2']
+    assert not caretaker.desfazer(usuario)
+
+
+def test_buffer_cheio_descarta_os_mais_antigos(usuario):
+    caretaker = CaretakerUsuario(max_historico=3)
+    salvar_nomes(caretaker, usuario, 5)
+
+    assert [m.nome for m in caretaker.obter_historico()] == ['Nome 2', 'Nome 3', 'Nome 4']
+    assert caretaker.obter_indice_atual() == 2
+    assert caretaker.navegar_para(0, usuario) and usuario.nome == 'Nome 2'
+    assert not caretaker.navegar_para(3, usuario)
+
+
+def test_desfazer_depois_de_dar_a_volta_no_buffer(usuario):
+    caretaker = CaretakerUsuario(max_historico=3)
+    salvar_nomes(caretaker, usuario, 4)
+    caretaker.desfazer(usuario)
+    caretaker.desfazer(usuario)
+    usuario.nome = 'Depois'
+    caretaker.salvar_estado(usuario)
+    salvar_nomes(caretaker, usuario, 2)
+
+    assert [m.nome for m in caretaker.obter_historico()] == ['Depois', 'Nome 0', 'Nome 1']
+
+
+def test_limpar_historico(usuario):
+    caretaker = CaretakerUsuario()
+    salvar_nomes(caretaker, usuario, 2)
+    caretaker.limpar_historico()
+
+    assert caretaker.obter_tamanho_historico() == 0
+    assert caretaker.obter_memento_atual() is None
+    assert caretaker.obter_estatisticas()['primeiro_memento'] is None
@@ -0,0 +1,56 @@
+import pytest
+
+from app.models import Usuario
+from app.models.caretaker_usuario import CaretakerUsuario
+from app.models.caretaker_usuario_persistente import CaretakerUsuarioPersistente
+from app.repositories import HistoricoUsuarioRepository
+
+
+@pytest.fixture
+def usuario():
+    usuario = Usuario('Nome 0', 'ana@anotaai.com', 'senha', endereco='Rua Longa, ' + 'x' * 100)
+    usuario.id = 1
+    return usuario
+
+
+@pytest.fixture
+def caretaker(tmp_path):
+    return CaretakerUsuarioPersistente(HistoricoUsuarioRepository(str(tmp_path / 'historico.db')), max_historico=3)
+
+
+def salvar_nomes(caretaker, usuario, quantidade):
+    for i in range(quantidade):
+        usuario.nome = f'Nome {i}'
+        caretaker.salvar_estado(usuario)
+
+
+def test_desfazer_refazer_e_retencao(caretaker, usuario):
+    salvar_nomes(caretaker, usuario, 4)
+
+    assert [m.nome for m in caretaker.obter_historico(1)] == ['Nome 1', 'Nome 2', 'Nome 3']
+    assert caretaker.desfazer(usuario) and usuario.nome == 'Nome 2'
+    assert caretaker.pode_refazer(1)
+    assert caretaker.refazer(usuario) and usuario.nome == 'Nome 3'
+    assert not caretaker.refazer(usuario)
+
+
+def test_historico_isolado_por_usuario(caretaker, usuario):
+    salvar_nomes(caretaker, usuario, 2)
+
+    assert caretaker.obter_historico(2) == []
+    assert caretaker.obter_memento_atual(2) is None
+    caretaker.limpar_historico(1)
+    assert not caretaker.pode_desfazer(1)
+
+
+def test_historico_compartilha_valores_como_o_caretaker_em_memoria(caretaker, usuario):
+    salvar_nomes(caretaker, usuario, 3)
+    em_memoria = CaretakerUsuario()
+    salvar_nomes(em_memoria, usuario, 3)
+
+    persistido = caretaker.obter_historico(1)
+    memoria = em_memoria.obter_historico()
+
+    assert [m.to_dict()['nome'] for m in persistido] == [m.nome for m in memoria]
+    assert persistido[2].endereco is persistido[0].endereco
+    assert memoria[2].endereco is memoria[0].endereco
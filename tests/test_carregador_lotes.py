@@ -0,0 +1,81 @@
+from flask import g
+
+from app.routes import dashboard_api
+from app.utils.carregador_lotes import CarregadorLotes, carregador_da_requisicao
+
+
+class FuncaoLote:
+    """Função de lote que registra as chaves recebidas em cada chamada"""
+
+    def __init__(self, valores):
+        self.valores = valores
+        self.chamadas = []
+
+    def __call__(self, chaves):
+        self.chamadas.append(list(chaves))
+        return {chave: self.valores[chave] for chave in chaves if chave in self.valores}
+
+
+def test_carregar_muitos_resolve_em_um_lote():
+    funcao = FuncaoLote({1: 'a', 2: 'b'})
+    carregador = CarregadorLotes(funcao)
+
+    assert carregador.carregar_muitos([1, 2, 1, 3]) == {1: 'a', 2: 'b', 3: None}
+    assert funcao.chamadas == [[1, 2, 3]]
+    assert carregador.lotes == 1
+
+
+def test_chaves_ja_resolvidas_nao_sao_buscadas_de_novo():
+    funcao = FuncaoLote({1: 'a', 2: 'b'})
+    carregador = CarregadorLotes(funcao)
+    carregador.carregar_muitos([1, 3])
+
+    assert carregador.carregar(1) == 'a'
+    assert carregador.carregar(3) is None
+    carregador.preparar([1, 2])
+    carregador.despachar()
+    carregador.despachar()
+
+    assert funcao.chamadas == [[1, 3], [2]]
+
+
+def test_limpar_descarta_o_valor_em_cache():
+    funcao = FuncaoLote({1: 'a'})
+    carregador = CarregadorLotes(funcao)
+    carregador.carregar(1)
+    funcao.valores[1] = 'novo'
+
+    carregador.limpar(1)
+    assert carregador.carregar(1) == 'novo'
+    assert len(funcao.chamadas) == 2
+
+
+def test_carregador_compartilhado_na_requisicao(app):
+    funcao = FuncaoLote({})
+    # Cada requisição tem seu próprio contexto da aplicação (e seu próprio g)
+    with app.app_context(), app.test_request_context():
+        assert carregador_da_requisicao('x', funcao) is carregador_da_requisicao('x', funcao)
+        assert carregador_da_requisicao('y', funcao) is not carregador_da_requisicao('x', funcao)
+        assert 'x' in g._carregadores_lotes
+    with app.app_context(), app.test_request_context():
+        assert 'x' not in g.get('_carregadores_lotes', {})
+
+
+def test_fora_do_contexto_cria_um_carregador_por_chamada():
+    funcao = FuncaoLote({})
+    assert carregador_da_requisicao('x', funcao) is not carregador_da_requisicao('x', funcao)
+
+
+def test_listagem_resolve_as_categorias_em_um_lote(cliente_logado, monkeypatch):
+    funcao = FuncaoLote(dashboard_api.CATEGORIAS_POR_ID)
+    monkeypatch.setattr(dashboard_api, 'carregar_categorias', funcao)
+
+    resposta = cliente_logado.get('/api/despesas?per_page=20')
+
+    transacoes = resposta.get_json()
+    assert resposta.status_code == 200
+    assert len(funcao.chamadas) == 1
+    assert all(
+        t['categoria_nome'] == dashboard_api.CATEGORIAS_POR_ID[t['categoria_id']]['nome']
+        for t in transacoes if t['categoria_id'] in dashboard_api.CATEGORIAS_POR_ID
+    )
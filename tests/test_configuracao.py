@@ -0,0 +1,47 @@
+from sqlalchemy import create_engine, text
+
+from app.utils.banco import aplicar_pragmas_sqlite, estatisticas_pool
+from config.settings import Config, DevelopmentConfig, TestingConfig, get_config
+
+
+def test_sem_flask_env_nao_forca_debug_nem_echo(monkeypatch):
+    monkeypatch.delenv('FLASK_ENV', raising=False)
+    monkeypatch.delenv('SQLALCHEMY_ECHO', raising=False)
+
+    configuracao = get_config()
+    assert configuracao is Config
+    assert not getattr(configuracao, 'DEBUG', False)
+    assert configuracao.SQLALCHEMY_ECHO is False
+
+
+def test_flask_env_escolhe_o_ambiente(monkeypatch):
+    monkeypatch.setenv('FLASK_ENV', 'development')
+    assert get_config() is DevelopmentConfig
+    monkeypatch.setenv('FLASK_ENV', 'testing')
+    assert get_config() is TestingConfig
+
+
+def test_pragmas_aplicados_em_cada_conexao(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'banco.db'}")
+    aplicar_pragmas_sqlite(engine, Config.SQLITE_PRAGMAS)
+
+    with engine.connect() as conexao:
+        assert conexao.execute(text('PRAGMA journal_mode')).scalar() == 'wal'
+        assert conexao.execute(text('PRAGMA synchronous')).scalar() == 1  # NORMAL
+        # Integridade referencial continua com o padrão do SQLite (desligada)
+        assert conexao.execute(text('PRAGMA foreign_keys')).scalar() == 0
+    assert estatisticas_pool(engine)['banco'] == 'sqlite'
+
+
+def test_pool_restrito_a_administradores(app, cliente_logado):
+    assert cliente_logado.get('/api/sistema/pool').status_code == 403
+
+    app.config['ADMINS'] = ['demo@anotaai.com']
+    resposta = cliente_logado.get('/api/sistema/pool')
+    assert resposta.status_code == 200
+    assert 'pool' in resposta.get_json()
+
+
+def test_pool_liberado_em_modo_debug(app, cliente_logado):
+    app.debug = True
+    assert cliente_logado.get('/api/sistema/pool').status_code == 200
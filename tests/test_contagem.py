@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import event
+
+from app.models import Usuario
+from app.repositories import BaseRepository, UsuarioRepository
+from app.utils.cache import CacheMemoria
+
+
+@pytest.fixture
+def comandos(banco):
+    """SQL executado no banco durante o teste"""
+    executados = []
+
+    def registrar(conexao, cursor, comando, parametros, contexto, executemany):
+        executados.append(comando)
+
+    event.listen(banco.engine, 'before_cursor_execute', registrar)
+    yield executados
+    event.remove(banco.engine, 'before_cursor_execute', registrar)
+
+
+@pytest.fixture
+def usuarios(banco):
+    for nome, email, ativo in (('Ana', 'ana@x.com', True), ('Bia', 'bia@x.com', True), ('Caio', 'caio@x.com', False)):
+        usuario = Usuario(nome=nome, email=email, senha='x')
+        usuario.ativo = ativo
+        banco.session.add(usuario)
+    banco.session.commit()
+    return UsuarioRepository()
+
+
+def test_exists_usa_exists_sem_carregar_a_linha(usuarios, comandos):
+    assert usuarios.exists(email='ana@x.com')
+    assert not usuarios.exists(email='ninguem@x.com')
+
+    assert len(comandos) == 2
+    assert all(comando.startswith('SELECT EXISTS (SELECT 1') for comando in comandos)
+
+
+def test_fast_count_sem_cache_conta_no_banco(usuarios, comandos):
+    assert usuarios.fast_count() == 3
+    assert usuarios.fast_count(ativo=False) == 1
+    assert usuarios.fast_count() == 3
+    assert sum('count(' in comando.lower() for comando in comandos) == 3
+
+
+def test_fast_count_em_cache_e_ajustado_pelas_escritas(usuarios, comandos, monkeypatch):
+    monkeypatch.setattr(BaseRepository, 'cache', CacheMemoria())
+    assert usuarios.fast_count() == 3
+    assert usuarios.fast_count(ativo=True) == 2
+
+    usuarios.create(nome='Duda', email='duda@x.com', senha='x')
+    caio = usuarios.get_by_field('email', 'caio@x.com')
+    usuarios.update(caio, ativo=True)
+
+    assert usuarios.fast_count() == 4
+    assert usuarios.fast_count(ativo=True) == 4
+    assert sum('count(' in comando.lower() for comando in comandos) == 2
+
+
+def test_paginacao_usa_fast_count(usuarios, monkeypatch):
+    monkeypatch.setattr(BaseRepository, 'cache', CacheMemoria())
+    pagina = usuarios.get_paginated(page=1, per_page=2)
+    assert pagina.total == 3
+    assert len(pagina.items) == 2
+
+    assert usuarios.get_paginated(page=1, per_page=2, count=False).total is None
+    assert usuarios.get_keyset_paginated(per_page=2, with_count=True, ativo=False)['total'] == 1
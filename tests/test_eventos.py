@@ -0,0 +1,115 @@
+import json
+
+import pytest
+from flask_login import login_user
+
+from app import USUARIO_DEMO, create_app
+from app.utils.eventos import EVENTO_RESINCRONIZAR, BarramentoEventos, BARRAMENTO_EVENTOS
+
+
+def assinaturas_abertas():
+    return BARRAMENTO_EVENTOS.estatisticas()['assinaturas']
+
+
+def ler_evento(fluxo):
+    """Próximo evento do fluxo SSE, ignorando os comentários de ping"""
+    while True:
+        bloco = next(fluxo).decode('utf-8')
+        if bloco.startswith('event:'):
+            tipo, dados = bloco.strip().split('\n')
+            return tipo[len('event: '):], json.loads(dados[len('data: '):])
+
+
+def test_publicar_entrega_apenas_ao_canal():
+    barramento = BarramentoEventos()
+    with barramento.assinar('usuario:1') as assinatura, barramento.assinar('usuario:2') as outra:
+        barramento.publicar('usuario:1', {'tipo': 'transacao_excluida', 'id': 1})
+
+        assert assinatura.proximo(timeout=1) == {'tipo': 'transacao_excluida', 'id': 1}
+        assert outra.proximo(timeout=0.01) is None
+    assert barramento.estatisticas()['assinaturas'] == 0
+
+
+def test_assinatura_atrasada_recebe_resincronizar():
+    barramento = BarramentoEventos()
+    with barramento.assinar('usuario:1', max_pendentes=2) as assinatura:
+        for id in range(5):
+            barramento.publicar('usuario:1', {'tipo': 'transacao_excluida', 'id': id})
+
+        assert assinatura.proximo(timeout=1) == EVENTO_RESINCRONIZAR
+        assert assinatura.proximo(timeout=0.01) is None
+
+
+@pytest.fixture
+def aplicacao():
+    # Sem a fixture `app` do pytest-flask, que mantém um contexto de requisição
+    # aberto e embaralharia os contextos do fluxo com os das outras requisições
+    return create_app()
+
+
+@pytest.fixture
+def cliente_sse(aplicacao):
+    cliente = aplicacao.test_client()
+    with cliente.session_transaction() as sessao:
+        sessao['_user_id'] = USUARIO_DEMO.get_id()
+    return cliente
+
+
+def test_fluxo_so_assina_ao_ser_consumido(aplicacao):
+    antes = assinaturas_abertas()
+    with aplicacao.test_request_context('/api/dashboard/eventos'):
+        login_user(USUARIO_DEMO)
+        resposta = aplicacao.view_functions['dashboard_api.dashboard_eventos']()
+
+        # Cliente que desconecta antes do primeiro envio não deixa assinatura
+        assert assinaturas_abertas() == antes
+        resposta.close()
+    assert assinaturas_abertas() == antes
+
+
+def test_fluxo_cancela_assinatura_ao_fechar(cliente_sse):
+    antes = assinaturas_abertas()
+    resposta = cliente_sse.get('/api/dashboard/eventos', buffered=False)
+    fluxo = iter(resposta.response)
+
+    assert resposta.mimetype == 'text/event-stream'
+    assert next(fluxo) == b'retry: 5000\n\n'
+    assert assinaturas_abertas() == antes + 1
+    resposta.close()
+    assert assinaturas_abertas() == antes
+
+
+def test_eventos_trazem_transacao_com_categoria(cliente_sse):
+    resposta = cliente_sse.get('/api/dashboard/eventos', buffered=False)
+    fluxo = iter(resposta.response)
+    next(fluxo)
+    try:
+        criada = cliente_sse.post('/api/despesas', json={
+            'descricao': 'Mercado', 'valor': 50, 'tipo': 'despesa',
+            'data_transacao': '2026-10-18', 'categoria_id': 2
+        }).get_json()['data']
+        tipo, evento = ler_evento(fluxo)
+        assert tipo == 'transacao_criada'
+        assert evento['transacao']['id'] == criada['id']
+        assert evento['transacao']['categoria_nome'] == 'Transporte'
+        assert set(evento['resumo']) == {'receitas_mes', 'despesas_mes'}
+
+        cliente_sse.put(f"/api/despesas/{criada['id']}", json={'categoria_id': 3})
+        tipo, evento = ler_evento(fluxo)
+        assert tipo == 'transacao_atualizada'
+        assert evento['transacao']['categoria_nome'] == 'Moradia'
+
+        cliente_sse.delete(f"/api/despesas/{criada['id']}")
+        tipo, evento = ler_evento(fluxo)
+        assert (tipo, evento['id']) == ('transacao_excluida', criada['id'])
+    finally:
+        resposta.close()
+
+
+def test_resumo_lista_recentes_com_categoria(cliente_logado):
+    resumo = cliente_logado.get('/api/dashboard/resumo').get_json()
+    nomes = {categoria['id']: categoria['nome'] for categoria in cliente_logado.get('/api/categorias').get_json()}
+
+    assert len(resumo['transacoes_recentes']) <= 10
+    for transacao in resumo['transacoes_recentes']:
+        assert transacao['categoria_nome'] == nomes[transacao['categoria_id']]
@@ -0,0 +1,111 @@
+import io
+import threading
+from datetime import date
+
+from app.importacao import ClassificadorCategorias, Deduplicador, ImportadorExtrato, IndiceDeduplicacao
+from app.stores import AgregadosTransacoes, RelatorioColunar, TransacaoStore
+
+CATEGORIAS = [{'id': 1, 'nome': 'Alimentação', 'cor': '#FF6384', 'tipo': 'despesa'}]
+
+
+def extrato(*linhas):
+    texto = 'data;descricao;valor\n' + ''.join(f'{linha}\n' for linha in linhas)
+    return io.BytesIO(texto.encode('utf-8'))
+
+
+def importar(arquivo, indice, tamanho_lote=1):
+    """Importa gravando cada lote no próprio índice, como a rota de importação"""
+    gravadas = []
+
+    def gravar_lote(lote):
+        for lancamento in lote:
+            indice.registrar(lancamento)
+        gravadas.extend(lote)
+
+    importador = ImportadorExtrato(ClassificadorCategorias(CATEGORIAS), gravar_lote, tamanho_lote)
+    return importador.importar(arquivo, 'csv', indice), gravadas
+
+
+def test_indice_conta_chaves_e_ids_externos(transacao):
+    indice = IndiceDeduplicacao([transacao(), transacao(), transacao(id_externo='X1')])
+    chave = Deduplicador.chave(transacao())
+
+    assert indice.quantidade(chave) == 2
+    assert indice.contem_id_externo('X1')
+
+    indice.remover(transacao())
+    indice.remover(transacao(id_externo='X1'))
+    assert indice.quantidade(chave) == 1
+    assert not indice.contem_id_externo('X1')
+
+
+def test_importacao_compara_com_as_existentes_antes_dos_lotes_gravados(transacao):
+    # Três cafés no extrato e um já gravado: os lotes gravados durante a
+    # importação entram no índice, mas não contam como existentes
+    indice = IndiceDeduplicacao([transacao()])
+    resultado, gravadas = importar(
+        extrato('01/10/2026;Café;-5,00', '01/10/2026;Café;-5,00', '01/10/2026;Café;-5,00'),
+        indice
+    )
+
+    assert resultado['importadas'] == 2
+    assert resultado['duplicadas'] == 1
+    assert len(gravadas) == 2
+    assert indice.quantidade(Deduplicador.chave(transacao())) == 3
+
+
+def test_reimportar_o_mesmo_extrato_nao_duplica():
+    indice = IndiceDeduplicacao()
+    arquivo = ('01/10/2026;Café;-5,00', '02/10/2026;Almoço;-30,00')
+    importar(extrato(*arquivo), indice)
+
+    resultado, gravadas = importar(extrato(*arquivo), indice)
+    assert resultado['duplicadas'] == 2
+    assert gravadas == []
+
+
+def test_deduplicador_aceita_lista_de_transacoes(transacao):
+    deduplicador = Deduplicador([transacao(id_externo='X1')])
+
+    assert deduplicador.duplicado(transacao(id_externo='X1'))
+    assert not deduplicador.duplicado(transacao(id_externo='X2'))
+    assert deduplicador.duplicado(transacao(id_externo='X2'))
+
+
+def test_stores_com_trava_compartilhada_entre_threads(transacao):
+    trava = threading.RLock()
+    store = TransacaoStore(trava=trava)
+    agregados = AgregadosTransacoes(trava=trava)
+    relatorio = RelatorioColunar(CATEGORIAS, trava=trava)
+    erros = []
+
+    def escrever(inicio):
+        for i in range(inicio, inicio + 500):
+            with trava:
+                nova = store.adicionar(transacao(id=i, data=f'2026-10-{i % 28 + 1:02d}'))
+                agregados.registrar(nova)
+                relatorio.adicionar(nova)
+            if i % 3 == 0:
+                with trava:
+                    removida = store.remover(i)
+                    agregados.remover(removida)
+                    relatorio.remover(i)
+
+    def ler():
+        for _ in range(300):
+            with trava:
+                quantidade = len(store)
+                if not (len(store.listar()) == quantidade == len(relatorio)
+                        == agregados.totais_usuario(1)['quantidade']):
+                    erros.append(quantidade)
+
+    threads = [threading.Thread(target=escrever, args=(inicio,)) for inicio in (1, 1001)]
+    threads.append(threading.Thread(target=ler))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert erros == []
+    assert len(store) == len(relatorio) == 667
+    assert relatorio.resumo_mes(1, date(2026, 10, 1))['total_despesas'] == 3335.0
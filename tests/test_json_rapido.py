@@ -0,0 +1,93 @@
+import json
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+from flask.json.provider import DefaultJSONProvider
+
+from app.utils import json_rapido
+from app.utils.json_rapido import ProvedorJSONRapido, resposta_json_em_fluxo
+
+DADOS = {
+    'b': 1,
+    'a': [1.5, None, True, 'ação'],
+    'quando': datetime(2026, 10, 18, 10, 30, tzinfo=timezone.utc),
+    'dia': date(2026, 10, 18),
+    'valor': Decimal('10.50'),
+    'id': uuid.UUID(int=1),
+}
+
+
+@pytest.mark.parametrize('sort_keys', [True, False])
+def test_mesmo_json_do_provedor_padrao(app, sort_keys):
+    rapido, padrao = ProvedorJSONRapido(app), DefaultJSONProvider(app)
+    rapido.sort_keys = padrao.sort_keys = sort_keys
+
+    assert json.loads(rapido.dumps(DADOS)) == json.loads(padrao.dumps(DADOS))
+    assert list(json.loads(rapido.dumps(DADOS))) == list(json.loads(padrao.dumps(DADOS)))
+
+
+def test_chaves_nao_texto(app):
+    rapido, padrao = ProvedorJSONRapido(app), DefaultJSONProvider(app)
+    rapido.sort_keys = padrao.sort_keys = False
+
+    assert rapido.dumps({3: 'a', None: 'b'}) == '{"3":"a","null":"b"}'
+    assert json.loads(padrao.dumps({3: 'a', None: 'b'})) == {'3': 'a', 'null': 'b'}
+
+
+def test_inteiro_grande_usa_o_json_padrao(app):
+    assert ProvedorJSONRapido(app).dumps_bytes({'n': 2 ** 70}) == b'{"n": 1180591620717411303424}'
+
+
+def test_sem_orjson_usa_o_json_padrao(app, monkeypatch):
+    monkeypatch.setattr(json_rapido, 'orjson', None)
+    provedor = ProvedorJSONRapido(app)
+
+    assert provedor.dumps(DADOS) == DefaultJSONProvider(app).dumps(DADOS)
+    assert provedor.loads('{"a": 1}') == {'a': 1}
+    with app.test_request_context():
+        assert provedor.response({'a': 1}).get_json() == {'a': 1}
+
+
+def test_jsonify_usa_o_provedor_rapido(app):
+    assert isinstance(app.json, ProvedorJSONRapido)
+    with app.test_request_context():
+        resposta = app.json.response({'dia': date(2026, 10, 18)})
+    assert resposta.mimetype == 'application/json'
+    assert resposta.get_json() == {'dia': 'Sun, 18 Oct 2026 00:00:00 GMT'}
+
+
+def resposta_em_fluxo(app, itens, **opcoes):
+    with app.test_request_context():
+        resposta = resposta_json_em_fluxo(itens, **opcoes)
+        assert resposta.is_streamed
+        return b''.join(resposta.response)
+
+
+def test_fluxo_emite_um_array_valido_em_blocos(app):
+    lidos = []
+
+    def itens():
+        for numero in range(7):
+            lidos.append(numero)
+            yield {'n': numero}
+
+    corpo = resposta_em_fluxo(app, itens(), tamanho_bloco=3,
+                              transformar_lote=lambda bloco: [dict(item, lote=len(bloco)) for item in bloco])
+
+    assert json.loads(corpo) == [{'n': n, 'lote': 3 if n < 6 else 1} for n in range(7)]
+    assert lidos == list(range(7))
+
+
+@pytest.mark.parametrize('itens', [[], [{}], [[]]])
+def test_fluxo_com_listas_vazias_ou_itens_vazios(app, itens):
+    assert json.loads(resposta_em_fluxo(app, itens)) == itens
+
+
+def test_rota_de_categorias_em_fluxo(cliente_logado):
+    from app.routes.dashboard_api import CATEGORIAS_FICTICIAS
+
+    resposta = cliente_logado.get('/api/categorias')
+    assert resposta.status_code == 200
+    assert resposta.get_json() == CATEGORIAS_FICTICIAS
@@ -0,0 +1,36 @@
+import os
+
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from flask_migrate import downgrade, stamp, upgrade
+from sqlalchemy import inspect
+from sqlalchemy.exc import OperationalError
+
+from app import db
+
+DIRETORIO = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'migrations')
+
+
+def test_upgrade_em_banco_vazio_cria_o_esquema_dos_modelos(app):
+    with app.app_context():
+        upgrade(directory=DIRETORIO)
+
+        with db.engine.connect() as conexao:
+            assert compare_metadata(MigrationContext.configure(conexao), db.metadata) == []
+        assert {indice['name'] for indice in inspect(db.engine).get_indexes('usuarios')} == {
+            'ix_usuarios_ativo_id', 'ix_usuarios_created_at', 'ix_usuarios_updated_at'
+        }
+
+        downgrade(directory=DIRETORIO, revision='base')
+        assert 'usuarios' not in inspect(db.engine).get_table_names()
+
+
+def test_indice_existente_interrompe_a_migracao(app):
+    # Índices criados fora da migração: falha em vez de marcar a revisão sem criá-los
+    with app.app_context():
+        db.create_all()
+        stamp(directory=DIRETORIO, revision='1c5e8b0f9a24')
+        with pytest.raises(OperationalError, match='ix_usuarios'):
+            upgrade(directory=DIRETORIO)
+        db.drop_all()
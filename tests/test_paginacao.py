@@ -0,0 +1,73 @@
+import base64
+import json
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.models import Usuario
+from app.repositories import UsuarioRepository
+from app.utils.paginacao import CursorInvalidoError, codificar_cursor, decodificar_cursor
+
+
+def cursor_bruto(valor):
+    return base64.urlsafe_b64encode(json.dumps(valor).encode()).decode().rstrip('=')
+
+
+def test_cursor_preserva_tipos():
+    valores = [datetime(2026, 10, 18, 12, 30), date(2026, 10, 18), 'texto', 7]
+
+    assert decodificar_cursor(codificar_cursor(valores)) == valores
+
+
+@pytest.mark.parametrize('cursor', [
+    '***',
+    cursor_bruto({'nao': 'lista'}),
+    cursor_bruto([{'dt': 'ontem'}, 1]),
+    cursor_bruto([{'d': '2026-13-40'}]),
+    cursor_bruto([{'dt': 123}]),
+])
+def test_cursor_malformado(cursor):
+    with pytest.raises(CursorInvalidoError):
+        decodificar_cursor(cursor)
+
+
+def test_keyset_percorre_todas_as_paginas(banco):
+    inicio = datetime(2026, 1, 1)
+    for i in range(7):
+        usuario = Usuario(f'Usuário {i}', f'usuario{i}@anotaai.com', 'senha')
+        usuario.created_at = inicio + timedelta(days=i % 3)
+        banco.session.add(usuario)
+    banco.session.commit()
+    repositorio = UsuarioRepository()
+
+    vistos, cursor = [], None
+    while True:
+        pagina = repositorio.get_keyset_paginated(cursor=cursor, per_page=3)
+        vistos.extend(usuario.id for usuario in pagina['items'])
+        cursor = pagina['next_cursor']
+        if not pagina['has_next']:
+            break
+
+    esperado = sorted(range(1, 8), key=lambda id: ((id - 1) % 3, id), reverse=True)
+    assert vistos == esperado
+    assert cursor is None
+
+
+def test_keyset_rejeita_cursor_com_colunas_a_mais(banco):
+    with pytest.raises(CursorInvalidoError):
+        UsuarioRepository().get_keyset_paginated(cursor=codificar_cursor([1, 2, 3]))
+
+
+def test_api_despesas_por_cursor(cliente_logado):
+    primeira = cliente_logado.get('/api/despesas?cursor=&per_page=5').get_json()
+    segunda = cliente_logado.get(f"/api/despesas?cursor={primeira['proximo_cursor']}&per_page=5").get_json()
+
+    chaves = [(t['data_transacao'], t['id']) for t in primeira['transacoes'] + segunda['transacoes']]
+    assert chaves == sorted(chaves, reverse=True)
+    assert len(set(chaves)) == 10
+
+
+def test_api_cursor_invalido(cliente_logado):
+    resposta = cliente_logado.get(f"/api/despesas?cursor={cursor_bruto([{'dt': 'x'}, 1])}")
+
+    assert resposta.status_code == 400
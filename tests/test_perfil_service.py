@@ -0,0 +1,50 @@
+import pytest
+
+from app.models import Usuario
+from app.models.caretaker_usuario import CaretakerUsuario
+from app.models.caretaker_usuario_persistente import CaretakerUsuarioPersistente
+from app.repositories import HistoricoUsuarioRepository
+from app.services import PerfilService
+
+
+@pytest.fixture
+def usuario_id(banco):
+    return Usuario(nome='Ana', email='ana@anotaai.com', senha='segredo').save().id
+
+
+@pytest.fixture
+def caretaker_persistente(tmp_path):
+    return CaretakerUsuarioPersistente(HistoricoUsuarioRepository(str(tmp_path / 'historico.db')))
+
+
+@pytest.mark.parametrize('caretaker', ['memoria', 'persistente'])
+def test_desfazer_e_refazer_com_os_dois_caretakers(caretaker_persistente, usuario_id, caretaker):
+    servico = PerfilService(CaretakerUsuario() if caretaker == 'memoria' else caretaker_persistente)
+    servico.atualizar_perfil(usuario_id, {'nome': 'Beatriz'})
+
+    assert servico.pode_desfazer(usuario_id)
+    assert servico.desfazer_alteracao(usuario_id).nome == 'Ana'
+    assert servico.refazer_alteracao(usuario_id).nome == 'Beatriz'
+    assert [estado['nome'] for estado in servico.obter_historico_alteracoes(usuario_id)] == ['Ana', 'Beatriz']
+
+
+def test_falha_ao_gravar_o_usuario_devolve_o_cursor(banco, caretaker_persistente, usuario_id, monkeypatch):
+    servico = PerfilService(caretaker_persistente)
+    servico.atualizar_perfil(usuario_id, {'nome': 'Beatriz'})
+
+    def falhar(usuario, **dados):
+        raise RuntimeError('banco indisponível')
+
+    monkeypatch.setattr(servico.usuario_repository, 'update', falhar)
+    with pytest.raises(RuntimeError):
+        servico.desfazer_alteracao(usuario_id)
+
+    assert caretaker_persistente.obter_memento_atual(usuario_id).nome == 'Beatriz'
+    assert servico.obter_usuario_por_id(usuario_id).nome == 'Beatriz'
+    assert not servico.pode_refazer(usuario_id)
+
+
+@pytest.mark.parametrize('max_historico', [0, -1])
+def test_max_historico_invalido(tmp_path, max_historico):
+    with pytest.raises(ValueError):
+        CaretakerUsuarioPersistente(HistoricoUsuarioRepository(str(tmp_path / 'historico.db')), max_historico)
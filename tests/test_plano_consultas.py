@@ -0,0 +1,50 @@
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine, text
+
+import verificar_planos
+from app.utils.plano_consultas import VarreduraCompletaError, VerificadorPlanos
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'planos.db'}")
+    with engine.begin() as conexao:
+        conexao.execute(text('CREATE TABLE itens (id INTEGER PRIMARY KEY, nome TEXT)'))
+    yield engine
+    engine.dispose()
+
+
+def test_detecta_varredura_completa(engine):
+    verificador = VerificadorPlanos(engine)
+    with verificador.capturar('por_id'):
+        with engine.connect() as conexao:
+            conexao.execute(text('SELECT nome FROM itens WHERE id = :id'), {'id': 1})
+    with verificador.capturar('por_nome'):
+        with engine.connect() as conexao:
+            conexao.execute(text('SELECT id FROM itens WHERE nome = :nome'), {'nome': 'a'})
+
+    assert [f['rotulo'] for f in verificador.falhas()] == ['por_nome']
+    with pytest.raises(VarreduraCompletaError):
+        verificador.verificar()
+
+
+def test_rastrear_conexao_sqlite3(engine):
+    verificador = VerificadorPlanos(engine)
+    conexao = sqlite3.connect(engine.url.database)
+    try:
+        verificador.rastrear(conexao)
+        conexao.execute('SELECT id FROM itens WHERE nome = ?', ('fora da captura',))
+        with verificador.capturar('sqlite3', permitir_varredura=True):
+            conexao.execute('SELECT id FROM itens WHERE nome = ?', ('a',))
+    finally:
+        conexao.close()
+
+    assert len(verificador.resultados) == 1
+    assert verificador.resultados[0]['varreduras'] == ['itens']
+    assert verificador.falhas() == []
+
+
+def test_consultas_dos_repositorios_usam_indices():
+    assert verificar_planos.main() == 0
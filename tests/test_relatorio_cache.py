@@ -0,0 +1,96 @@
+import os
+import threading
+import time
+
+from app.services.relatorio_cache import CacheRelatorios
+
+
+def gravar(conteudo):
+    def gerar(destino):
+        with open(destino, 'w') as arquivo:
+            arquivo.write(conteudo)
+        return destino
+    return gerar
+
+
+def test_chave_depende_de_todos_os_parametros():
+    chave = CacheRelatorios.gerar_chave(1, 'Csv', {'mes': '2026-10', 'tipo': 'despesa'}, 3)
+
+    assert chave == CacheRelatorios.gerar_chave(1, 'Csv', {'tipo': 'despesa', 'mes': '2026-10'}, 3)
+    assert chave != CacheRelatorios.gerar_chave(1, 'Csv', {'mes': '2026-10', 'tipo': 'despesa'}, 4)
+    assert chave != CacheRelatorios.gerar_chave(2, 'Csv', {'mes': '2026-10', 'tipo': 'despesa'}, 3)
+
+
+def test_obter_ou_gerar_reaproveita_o_arquivo(tmp_path):
+    cache = CacheRelatorios(str(tmp_path))
+    chamadas = []
+
+    def gerar(destino):
+        chamadas.append(destino)
+        return gravar('a,b')(destino)
+
+    caminho, do_cache = cache.obter_ou_gerar('chave', 'csv', gerar)
+    assert (do_cache, open(caminho).read()) == (False, 'a,b')
+    assert cache.obter_ou_gerar('chave', 'csv', gerar) == (caminho, True)
+    assert len(chamadas) == 1
+    assert cache.estatisticas()['taxa_acerto'] == 0.5
+
+
+def test_falha_na_geracao_nao_deixa_arquivo(tmp_path):
+    cache = CacheRelatorios(str(tmp_path))
+
+    assert cache.obter_ou_gerar('vazio', 'csv', lambda destino: None) == (None, False)
+    assert os.listdir(tmp_path) == []
+
+
+def test_remove_os_menos_usados_ao_exceder_o_tamanho(tmp_path):
+    cache = CacheRelatorios(str(tmp_path), tamanho_maximo=10)
+    cache.obter_ou_gerar('antigo', 'csv', gravar('x' * 6))
+    os.utime(cache.caminho('antigo', 'csv'), (time.time() - 60, time.time() - 60))
+
+    cache.obter_ou_gerar('novo', 'csv', gravar('y' * 6))
+
+    assert cache.obter('antigo', 'csv') is None
+    assert cache.obter('novo', 'csv') is not None
+
+
+def test_arquivo_recem_gerado_maior_que_o_limite_nao_e_removido(tmp_path):
+    cache = CacheRelatorios(str(tmp_path), tamanho_maximo=10)
+    cache.obter_ou_gerar('pequeno', 'csv', gravar('x' * 4))
+
+    caminho, _ = cache.obter_ou_gerar('grande', 'csv', gravar('y' * 20))
+
+    assert os.path.exists(caminho)
+    assert cache.obter('pequeno', 'csv') is None
+
+
+def test_travas_das_chaves_sao_descartadas(tmp_path):
+    cache = CacheRelatorios(str(tmp_path))
+    liberar = threading.Event()
+
+    def gerar_lento(destino):
+        liberar.wait(5)
+        return gravar('a')(destino)
+
+    threads = [
+        threading.Thread(target=cache.obter_ou_gerar, args=('chave', 'csv', gerar_lento))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    liberar.set()
+    for thread in threads:
+        thread.join()
+    cache.obter_ou_gerar('vazio', 'csv', lambda destino: None)
+
+    assert cache.falhas == 2
+    assert cache._travas == {}
+
+
+def test_invalidar(tmp_path):
+    cache = CacheRelatorios(str(tmp_path))
+    cache.obter_ou_gerar('chave', 'csv', gravar('a'))
+    cache.invalidar('chave', 'csv')
+    cache.invalidar('chave', 'csv')
+
+    assert cache.obter('chave', 'csv') is None
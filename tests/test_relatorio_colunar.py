@@ -0,0 +1,108 @@
+from datetime import date
+
+import pytest
+
+from app import USUARIO_DEMO
+from app.stores import RelatorioColunar
+
+CATEGORIAS = [
+    {'id': 1, 'nome': 'Alimentação', 'cor': '#FF6B6B'},
+    {'id': 2, 'nome': 'Transporte', 'cor': '#4ECDC4'},
+]
+
+
+@pytest.fixture
+def relatorio(transacao):
+    return RelatorioColunar(CATEGORIAS, [
+        transacao(1, '2026-10-05', 100.0),
+        transacao(2, '2026-10-06', 40.0, categoria_id=2),
+        transacao(3, '2026-10-07', 3000.0, tipo='receita'),
+        transacao(4, '2026-09-10', 20.0),
+    ])
+
+
+def test_resumo_mes(relatorio):
+    assert relatorio.resumo_mes(1, date(2026, 10, 18)) == {
+        'total_receitas': 3000.0,
+        'total_despesas': 140.0,
+        'saldo_mes': 2860.0,
+        'maior_despesa_id': 1,
+        'categoria_maior_gasto': 'Alimentação'
+    }
+
+
+def test_relatorio_mensal_agrupa_despesas_por_categoria(relatorio):
+    grafico = relatorio.relatorio_mensal(1, date(2026, 10, 18), meses=2)
+
+    assert grafico['labels'] == ['Set', 'Out']
+    assert grafico['dados'] == {'Alimentação': [20.0, 100.0], 'Transporte': [0.0, 40.0]}
+
+
+def test_relatorios_consideram_apenas_o_usuario(relatorio, transacao):
+    relatorio.adicionar(transacao(5, '2026-10-05', 500.0, usuario_id=2))
+    relatorio.adicionar(transacao(6, '2026-10-06', 70.0, categoria_id=2, usuario_id=2))
+
+    assert relatorio.resumo_mes(1, date(2026, 10, 18))['total_despesas'] == 140.0
+    assert relatorio.resumo_mes(2, date(2026, 10, 18)) == {
+        'total_receitas': 0.0,
+        'total_despesas': 570.0,
+        'saldo_mes': -570.0,
+        'maior_despesa_id': 5,
+        'categoria_maior_gasto': 'Alimentação'
+    }
+    assert relatorio.relatorio_semanal(2, date(2026, 10, 18), semanas=2)['dados'] == {
+        'Alimentação': [500.0, 0.0], 'Transporte': [70.0, 0.0]
+    }
+    assert relatorio.relatorio_diario(3, date(2026, 10, 5))['categorias'] == []
+
+
+def test_remover_move_ultima_linha(relatorio, transacao):
+    relatorio.remover(1)
+
+    assert len(relatorio) == 3
+    assert relatorio.resumo_mes(1, date(2026, 10, 1))['total_despesas'] == 40.0
+    relatorio.atualizar(transacao(4, '2026-10-01', 5.0))
+    assert relatorio.resumo_mes(1, date(2026, 10, 1))['total_despesas'] == 45.0
+
+
+def test_data_invalida_nao_ocupa_posicao(relatorio, transacao):
+    with pytest.raises(ValueError):
+        relatorio.adicionar(transacao(5, '18/10/2026', 999.0))
+
+    assert len(relatorio) == 4
+    assert relatorio.resumo_mes(1, date(2026, 10, 1))['total_despesas'] == 140.0
+    relatorio.adicionar(transacao(5, '2026-10-08', 10.0))
+    assert relatorio.resumo_mes(1, date(2026, 10, 1))['total_despesas'] == 150.0
+
+
+def test_atualizar_com_campo_invalido_mantem_linha(relatorio):
+    with pytest.raises(KeyError):
+        relatorio.atualizar({'id': 1, 'data_transacao': '2026-10-05', 'valor': 1.0, 'categoria_id': 1, 'usuario_id': 1})
+
+    assert relatorio.resumo_mes(1, date(2026, 10, 1))['total_despesas'] == 140.0
+
+
+@pytest.mark.parametrize('data', ['18/10/2026', '20261018', '2026-W42-1', '2026-10-18 10:30', '2026-02-30'])
+@pytest.mark.parametrize('metodo, url', [('post', '/api/despesas'), ('put', '/api/despesas/1')])
+def test_api_rejeita_data_invalida_sem_gravar(cliente_logado, metodo, url, data):
+    from app.routes.dashboard_api import AGREGADOS_TRANSACOES, RELATORIO_COLUNAR, TRANSACOES_FICTICIAS
+
+    antes = (len(TRANSACOES_FICTICIAS), len(RELATORIO_COLUNAR),
+             AGREGADOS_TRANSACOES.totais_usuario(USUARIO_DEMO.id))
+    original = dict(TRANSACOES_FICTICIAS.obter(1))
+
+    resposta = getattr(cliente_logado, metodo)(url, json={
+        'descricao': 'Inválida', 'valor': 10, 'tipo': 'despesa', 'data_transacao': data
+    })
+
+    assert resposta.status_code == 400
+    assert (len(TRANSACOES_FICTICIAS), len(RELATORIO_COLUNAR),
+            AGREGADOS_TRANSACOES.totais_usuario(USUARIO_DEMO.id)) == antes
+    assert TRANSACOES_FICTICIAS.obter(1) == original
+
+
+@pytest.mark.parametrize('data', ['2026-10-18', '2026-10-18T10:30', '2026-10-18T10:30:00.123456'])
+def test_validar_data_aceita_forma_estendida(data):
+    from app.routes.dashboard_api import validar_data_transacao
+
+    assert validar_data_transacao(data) == data
@@ -0,0 +1,37 @@
+import csv
+
+from app.repositories.strategies import RelatorioCsvStrategy
+
+
+def linhas(quantidade):
+    return ({'id': i, 'descricao': f'Item {i}', 'valor': i * 1.5} for i in range(quantidade))
+
+
+def test_gerar_stream_escreve_em_blocos_com_cabecalho_unico():
+    blocos = list(RelatorioCsvStrategy(tamanho_lote=2).gerar_stream(linhas(5)))
+
+    assert len(blocos) == 3
+    assert blocos[0].startswith('id,descricao,valor\r\n')
+    assert sum(bloco.count('descricao') for bloco in blocos) == 1
+    assert ''.join(blocos).count('\r\n') == 6
+
+
+def test_gerar_stream_sem_dados():
+    assert list(RelatorioCsvStrategy().gerar_stream([])) == []
+
+
+def test_gerar_relatorio_aceita_iterador(tmp_path):
+    destino = tmp_path / 'relatorio.csv'
+
+    assert RelatorioCsvStrategy(tamanho_lote=3).gerar_relatorio(linhas(10), str(destino)) == str(destino)
+    with open(destino, newline='', encoding='utf-8') as arquivo:
+        lidas = list(csv.DictReader(arquivo))
+    assert len(lidas) == 10
+    assert lidas[9] == {'id': '9', 'descricao': 'Item 9', 'valor': '13.5'}
+
+
+def test_gerar_relatorio_sem_dados_nao_cria_arquivo(tmp_path):
+    destino = tmp_path / 'vazio.csv'
+
+    assert RelatorioCsvStrategy().gerar_relatorio([], str(destino)) is None
+    assert not destino.exists()
@@ -0,0 +1,33 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from openpyxl import load_workbook
+
+from app.repositories.strategies import RelatorioExcelStrategy
+
+
+def test_gera_planilha_a_partir_de_iterador(tmp_path):
+    destino = str(tmp_path / 'relatorio.xlsx')
+    linhas = ({'id': i, 'valor': Decimal('1.50') * i, 'data': date(2026, 10, i + 1)} for i in range(3))
+
+    assert RelatorioExcelStrategy().gerar_relatorio(linhas, destino) == destino
+
+    planilha = load_workbook(destino, read_only=True)['Relatório']
+    valores = list(planilha.values)
+    assert valores[0] == ('id', 'valor', 'data')
+    assert valores[3] == (2, 3.0, datetime(2026, 10, 3))
+
+
+def test_valor_celula():
+    converter = RelatorioExcelStrategy._valor_celula
+    assert converter(Decimal('2.25')) == 2.25
+    assert converter(datetime(2026, 1, 1, tzinfo=timezone.utc)).tzinfo is None
+    assert converter(['a']) == "['a']"
+    assert converter(None) is None
+
+
+def test_sem_dados_nao_gera_arquivo(tmp_path):
+    destino = tmp_path / 'vazio.xlsx'
+
+    assert RelatorioExcelStrategy().gerar_relatorio(iter([]), str(destino)) is None
+    assert not destino.exists()
@@ -0,0 +1,152 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from flask import has_app_context
+
+from app.services import relatorio_jobs
+from app.services.relatorio_jobs import (
+    CONCLUIDO, ERRO, EXECUTANDO, FilaRelatorios, _carregar_consulta, _conectar, registrar_consulta
+)
+
+
+@registrar_consulta('testes_numeros')
+def numeros(quantidade):
+    return ({'numero': i} for i in range(quantidade))
+
+
+@registrar_consulta('testes_contexto')
+def contexto():
+    return [{'contexto': has_app_context()}]
+
+
+class ExecutorImediato:
+    """Executa o job na própria thread do teste"""
+
+    def submit(self, funcao, *args):
+        funcao(*args)
+
+    def shutdown(self, wait=True):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def executor_imediato(monkeypatch):
+    monkeypatch.setattr(FilaRelatorios, '_obter_executor', lambda self: ExecutorImediato())
+
+
+def inserir_job(fila, job_id, consulta, status=EXECUTANDO, atualizado_em=None, tentativas=0):
+    antigo = (atualizado_em or datetime.now() - timedelta(hours=1)).isoformat()
+    with _conectar(fila.caminho_banco) as conexao:
+        conexao.execute(
+            'INSERT INTO relatorio_jobs (id, usuario_id, formato, consulta, parametros, tentativas, status, '
+            'progresso, criado_em, atualizado_em) VALUES (?, 1, ?, ?, ?, ?, ?, 0, ?, ?)',
+            (job_id, 'csv', consulta, json.dumps({'quantidade': 3}), tentativas, status, antigo, antigo)
+        )
+
+
+def test_enviar_executa_consulta_registrada(tmp_path):
+    fila = FilaRelatorios(str(tmp_path))
+
+    job_id = fila.enviar('csv', 'testes_numeros', {'quantidade': 5}, usuario_id=1)
+
+    job = fila.obter(job_id)
+    assert job['status'] == CONCLUIDO
+    assert job['progresso'] == 5
+    assert job['consulta'] == 'testes_numeros'
+    with open(fila.caminho_arquivo(job_id), encoding='utf-8') as arquivo:
+        assert arquivo.read().splitlines() == ['numero', '0', '1', '2', '3', '4']
+
+
+@pytest.mark.parametrize('consulta', ['os:system', 'nao_registrada'])
+def test_enviar_rejeita_consulta_nao_registrada(tmp_path, consulta):
+    with pytest.raises(ValueError):
+        FilaRelatorios(str(tmp_path)).enviar('csv', consulta, {'command': 'true'})
+
+
+def test_carregar_consulta_so_resolve_registradas():
+    assert _carregar_consulta('testes_numeros', 'os') is numeros
+    with pytest.raises(ValueError):
+        _carregar_consulta('system', 'os')
+
+
+def test_jobs_orfaos_sao_retomados_na_inicializacao(tmp_path):
+    inserir_job(FilaRelatorios(str(tmp_path)), 'orfao', 'testes_numeros')
+    inserir_job(FilaRelatorios(str(tmp_path)), 'recente', 'testes_numeros', atualizado_em=datetime.now())
+
+    fila = FilaRelatorios(str(tmp_path))
+
+    assert fila.obter('orfao')['status'] == CONCLUIDO
+    assert fila.obter('orfao')['tentativas'] == 1
+    assert fila.obter('recente')['status'] == EXECUTANDO
+
+
+def test_jobs_orfaos_expiram(tmp_path):
+    fila = FilaRelatorios(str(tmp_path))
+    inserir_job(fila, 'sem_consulta', 'removida')
+    inserir_job(fila, 'esgotado', 'testes_numeros', tentativas=relatorio_jobs.MAX_TENTATIVAS - 1)
+
+    assert fila.retomar_orfaos() == 0
+    assert fila.obter('sem_consulta')['status'] == ERRO
+    assert fila.obter('esgotado')['status'] == ERRO
+    assert fila.retomar_orfaos() == 0
+
+
+def test_obter_filtra_pelo_dono(tmp_path):
+    fila = FilaRelatorios(str(tmp_path))
+    job_id = fila.enviar('csv', 'testes_numeros', {'quantidade': 1}, usuario_id=1)
+
+    assert fila.obter(job_id, 1)['id'] == job_id
+    assert fila.obter(job_id, 2) is None
+    assert fila.caminho_arquivo(job_id, 2) is None
+    assert fila.caminho_arquivo(job_id, 1) == fila.obter(job_id)['arquivo']
+
+
+@pytest.mark.parametrize('processos', [True, False])
+def test_consulta_roda_no_contexto_da_aplicacao(tmp_path, app, processos):
+    # Em processos o job cria a própria aplicação; em threads usa a recebida
+    fila = FilaRelatorios(str(tmp_path), processos=processos, aplicacao=app)
+
+    job_id = fila.enviar('csv', 'testes_contexto')
+
+    with open(fila.caminho_arquivo(job_id), encoding='utf-8') as arquivo:
+        assert arquivo.read().splitlines() == ['contexto', 'True']
+
+
+@pytest.fixture
+def cliente_relatorios(app, cliente_logado, tmp_path):
+    app.config['RELATORIOS_DIRETORIO'] = str(tmp_path)
+    return cliente_logado
+
+
+def test_api_exporta_transacoes_do_usuario(cliente_relatorios):
+    resposta = cliente_relatorios.post('/api/relatorios', json={'formato': 'csv', 'inicio': '2000-01-01'})
+    assert resposta.status_code == 202
+    job_id = resposta.get_json()['data']['id']
+
+    job = cliente_relatorios.get(f'/api/relatorios/{job_id}').get_json()
+    assert job['status'] == CONCLUIDO
+    assert job['progresso'] > 0
+    assert 'arquivo' not in job
+
+    arquivo = cliente_relatorios.get(f'/api/relatorios/{job_id}/arquivo')
+    assert arquivo.status_code == 200
+    linhas = arquivo.get_data(as_text=True).splitlines()
+    assert linhas[0] == 'data,descricao,categoria,tipo,valor'
+    assert len(linhas) == job['progresso'] + 1
+
+
+@pytest.mark.parametrize('corpo', [{'formato': 'docx'}, {'inicio': '20260101'}])
+def test_api_rejeita_pedido_invalido(cliente_relatorios, corpo):
+    assert cliente_relatorios.post('/api/relatorios', json=corpo).status_code == 400
+
+
+def test_api_nao_mostra_job_de_outro_usuario(app, cliente_relatorios):
+    from app.routes.dashboard_api import servico_relatorios
+
+    with app.test_request_context():
+        fila = servico_relatorios()._obter_fila()
+    job_id = fila.enviar('csv', 'testes_numeros', {'quantidade': 1}, usuario_id=2)
+
+    assert cliente_relatorios.get(f'/api/relatorios/{job_id}').status_code == 404
+    assert cliente_relatorios.get(f'/api/relatorios/{job_id}/arquivo').status_code == 404
@@ -0,0 +1,49 @@
+from app.repositories.strategies import RelatorioPdfStrategy
+
+
+def linhas(quantidade, descricao='Item'):
+    return ({'id': i, 'descricao': f'{descricao} {i}'} for i in range(quantidade))
+
+
+def test_gera_pdf_com_uma_pagina_por_bloco(tmp_path):
+    destino = str(tmp_path / 'relatorio.pdf')
+
+    assert RelatorioPdfStrategy(linhas_por_pagina=10).gerar_relatorio(linhas(25), destino) == destino
+    with open(destino, 'rb') as arquivo:
+        assert arquivo.read().count(b'/Type /Page\n') == 3
+
+
+def test_texto_longo_e_quebrado_sem_perder_dados():
+    estrategia = RelatorioPdfStrategy()
+    texto = 'palavra ' * 20
+
+    celula = estrategia._celula(texto, 30)
+
+    assert len(celula) > 1
+    assert all(len(linha) <= 30 for linha in celula)
+    assert ' '.join(celula).split() == texto.split()
+
+
+def test_truncar_e_opcional():
+    celula = RelatorioPdfStrategy(truncar=True)._celula('abcdefghij', 5)
+
+    assert celula == ['abcd…']
+
+
+def test_registro_mais_alto_que_a_pagina_e_dividido():
+    estrategia = RelatorioPdfStrategy(linhas_por_pagina=3)
+    registros = [{'texto': 'a'}, {'texto': '1\n2\n3\n4\n5'}, {'texto': 'b'}]
+
+    paginas = list(estrategia._paginas(iter(registros), ['texto'], [10]))
+
+    assert [[parte[0] for parte in pagina] for pagina in paginas] == [
+        [['a']], [['1', '2', '3']], [['4', '5'], ['b']]
+    ]
+
+
+def test_larguras_calculadas_por_relatorio():
+    curtas = RelatorioPdfStrategy._larguras_colunas(['a', 'b'], [{'a': 'x', 'b': 'y'}], 100)
+    longas = RelatorioPdfStrategy._larguras_colunas(['a', 'b'], [{'a': 'x' * 40, 'b': 'y'}], 100)
+
+    assert curtas == [50.0, 50.0]
+    assert longas[0] > longas[1]
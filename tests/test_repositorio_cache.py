@@ -0,0 +1,88 @@
+import pytest
+
+from app.models import Usuario
+from app.repositories import BaseRepository, UsuarioRepository
+from app.utils.cache import CacheMemoria
+
+
+@pytest.fixture
+def cache(banco, monkeypatch):
+    """Liga o cache em memória dos repositórios só durante o teste"""
+    cache = CacheMemoria()
+    monkeypatch.setattr(BaseRepository, 'cache', cache)
+    return cache
+
+
+def criar_usuario(email='ana@anotaai.com', nome='Ana'):
+    return Usuario(nome=nome, email=email, senha='segredo').save()
+
+
+def nova_requisicao(banco):
+    """Descarta o mapa de identidade, como acontece ao fim de cada requisição"""
+    banco.session.remove()
+
+
+def test_cache_desligado_sem_configuracao(app):
+    assert BaseRepository.cache is None
+
+
+def test_backend_desconhecido(app):
+    with pytest.raises(ValueError):
+        BaseRepository.configurar_cache({'REPOSITORIO_CACHE_BACKEND': 'memcached'})
+    BaseRepository.configurar_cache(app.config)
+
+
+def test_update_do_modelo_invalida_get_by_id(banco, cache):
+    repositorio = UsuarioRepository()
+    usuario_id = criar_usuario().id
+    nova_requisicao(banco)
+    assert repositorio.get_by_id(usuario_id).nome == 'Ana'
+
+    nova_requisicao(banco)
+    repositorio.get_by_id(usuario_id).update(nome='Ana Maria')
+
+    nova_requisicao(banco)
+    assert repositorio.get_by_id(usuario_id).nome == 'Ana Maria'
+
+
+def test_escrita_direta_na_sessao_invalida_get_by_field(banco, cache):
+    repositorio = UsuarioRepository()
+    criar_usuario()
+    nova_requisicao(banco)
+    usuario = repositorio.buscar_por_email('ana@anotaai.com')
+
+    usuario.email = 'ana.maria@anotaai.com'
+    banco.session.commit()
+
+    nova_requisicao(banco)
+    assert repositorio.buscar_por_email('ana@anotaai.com') is None
+    assert repositorio.buscar_por_email('ana.maria@anotaai.com').nome == 'Ana'
+
+
+def test_save_e_delete_do_modelo_ajustam_fast_count(banco, cache):
+    repositorio = UsuarioRepository()
+    criar_usuario()
+    assert repositorio.fast_count() == 1
+
+    outro_id = criar_usuario('bia@anotaai.com', 'Bia').id
+    assert repositorio.fast_count() == 2
+
+    nova_requisicao(banco)
+    banco.session.get(Usuario, outro_id).delete()
+    assert repositorio.fast_count() == 1
+
+
+def test_rollback_descarta_as_alteracoes_anotadas(banco, cache):
+    repositorio = UsuarioRepository()
+    usuario_id = criar_usuario().id
+    nova_requisicao(banco)
+    repositorio.get_by_id(usuario_id)
+    assert repositorio.fast_count() == 1
+
+    banco.session.add(Usuario(nome='Bia', email='bia@anotaai.com', senha='x'))
+    banco.session.flush()
+    banco.session.rollback()
+    criar_usuario('caio@anotaai.com', 'Caio')
+
+    assert repositorio.fast_count() == 2
+    assert cache.obter(repositorio._id_key(usuario_id), None) is not None
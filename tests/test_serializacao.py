@@ -0,0 +1,48 @@
+from datetime import date, datetime
+
+from app.models import Usuario
+from app.repositories import UsuarioRepository
+
+
+def criar_usuario(banco):
+    usuario = Usuario(nome='Ana', email='ana@x.com', senha='segredo', data_nascimento=date(1990, 5, 17))
+    banco.session.add(usuario)
+    banco.session.commit()
+    return usuario
+
+
+def test_to_dict_mantem_os_tipos_das_colunas_e_oculta_a_senha(banco):
+    usuario = criar_usuario(banco)
+    esperado = {coluna.name: getattr(usuario, coluna.name) for coluna in Usuario.__table__.columns}
+    del esperado['senha_hash']
+
+    dados = usuario.to_dict()
+    assert dados == esperado
+    assert isinstance(dados['created_at'], datetime)
+    assert dados['data_nascimento'] == date(1990, 5, 17)
+
+
+def test_datas_iso_para_respostas_json(banco):
+    dados = criar_usuario(banco).to_dict(datas_iso=True)
+
+    assert dados['data_nascimento'] == '1990-05-17'
+    assert datetime.fromisoformat(dados['created_at'])
+
+
+def test_to_dicts_de_instancias_e_de_tuplas(banco):
+    usuario = criar_usuario(banco)
+    colunas = Usuario.serializador().colunas
+    linhas = banco.session.query(*colunas).all()
+
+    assert Usuario.to_dicts(linhas) == Usuario.to_dicts([usuario]) == [usuario.to_dict()]
+    assert Usuario.to_dicts(linhas, datas_iso=True) == [usuario.to_dict(datas_iso=True)]
+    assert Usuario.to_dicts([]) == []
+
+
+def test_get_dicts_filtra_sem_instanciar_o_orm(banco):
+    usuario = criar_usuario(banco)
+    repositorio = UsuarioRepository()
+
+    assert repositorio.get_dicts(email='ana@x.com') == [usuario.to_dict()]
+    assert repositorio.get_dicts(True, email='ana@x.com')[0]['data_nascimento'] == '1990-05-17'
+    assert repositorio.get_dicts(email='ninguem@x.com') == []
@@ -0,0 +1,88 @@
+import pytest
+
+from app.stores import TransacaoStore
+
+
+@pytest.fixture
+def store(transacao):
+    return TransacaoStore([
+        transacao(1, '2026-10-01', categoria_id=1),
+        transacao(2, '2026-10-03', categoria_id=2),
+        transacao(3, '2026-10-02', categoria_id=1),
+    ])
+
+
+def test_listar_ordena_da_mais_recente_para_a_mais_antiga(store):
+    assert [t['id'] for t in store.listar()] == [2, 3, 1]
+    assert [t['id'] for t in store.listar(1, 2)] == [3]
+    assert [t['id'] for t in store.listar_por_categoria(1)] == [3, 1]
+
+
+def test_adicionar_atribui_id_sequencial(store, transacao):
+    nova = store.adicionar(transacao(data='2026-10-04'))
+    assert nova['id'] == 4
+    assert store.obter(4) is nova
+    assert store.listar(0, 1) == [nova]
+
+
+def test_adicionar_id_repetido_falha(store, transacao):
+    with pytest.raises(ValueError):
+        store.adicionar(transacao(1))
+
+
+def test_data_invalida_nao_desincroniza_indices(store, transacao):
+    with pytest.raises(TypeError):
+        store.adicionar(transacao(data=20261004))
+
+    assert len(store) == 3
+    assert len(store.listar()) == 3
+    assert 4 not in store
+
+
+def test_sem_categoria_nao_desincroniza_indices(store, transacao):
+    dados = transacao(data='2026-10-04')
+    del dados['categoria_id']
+    with pytest.raises(KeyError):
+        store.adicionar(dados)
+
+    assert len(store) == len(store.listar()) == 3
+
+
+def test_atualizar_reposiciona_nos_indices(store):
+    store.atualizar(1, {'data_transacao': '2026-10-05', 'categoria_id': 2})
+
+    assert [t['id'] for t in store.listar()] == [1, 2, 3]
+    assert [t['id'] for t in store.listar_por_categoria(1)] == [3]
+    assert [t['id'] for t in store.listar_por_categoria(2)] == [1, 2]
+
+
+def test_atualizar_com_data_invalida_mantem_transacao(store):
+    with pytest.raises(TypeError):
+        store.atualizar(1, {'data_transacao': None})
+
+    assert store.obter(1)['data_transacao'] == '2026-10-01'
+    assert [t['id'] for t in store.listar()] == [2, 3, 1]
+
+
+def test_remover(store):
+    assert store.remover(3)['id'] == 3
+    assert store.remover(3) is None
+    assert [t['id'] for t in store.listar()] == [2, 1]
+    assert [t['id'] for t in store.listar_por_categoria(1)] == [1]
+
+
+def test_listar_apos_chave_e_desde(store):
+    assert [t['id'] for t in store.listar_apos_chave(None, 2)] == [2, 3]
+    assert [t['id'] for t in store.listar_apos_chave(('2026-10-02', 3), 2)] == [1]
+    assert [t['id'] for t in store.listar_desde('2026-10-02')] == [2, 3]
+
+
+def test_listar_por_usuario(store, transacao):
+    store.adicionar(transacao(data='2026-10-04', usuario_id=2))
+    store.atualizar(1, {'usuario_id': 2})
+
+    assert [t['id'] for t in store.listar_por_usuario(2)] == [4, 1]
+    assert [t['id'] for t in store.listar_por_usuario(2, 0, 1)] == [4]
+    assert [t['id'] for t in store.listar_por_usuario(1)] == [2, 3]
+    store.remover(4)
+    assert [t['id'] for t in store.listar_por_usuario(2)] == [1]
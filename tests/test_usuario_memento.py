@@ -0,0 +1,46 @@
+from datetime import date, datetime
+
+import pytest
+
+from app.models import Usuario
+from app.models.usuario_memento import UsuarioMemento
+
+
+@pytest.fixture
+def usuario():
+    usuario = Usuario('Ana', 'ana@anotaai.com', 'senha', data_nascimento=date(1990, 1, 2),
+                      telefone='1199999', endereco='Rua A, ' + 'x' * 200)
+    usuario.id = 1
+    return usuario
+
+
+def test_memento_guarda_e_restaura_o_estado(usuario):
+    memento = usuario.criar_memento()
+    usuario.nome = 'Outra'
+    usuario.ativo = False
+
+    usuario.restaurar_memento(memento)
+
+    assert (usuario.nome, usuario.ativo) == ('Ana', True)
+    assert memento.to_dict()['data_nascimento'] == date(1990, 1, 2)
+    assert isinstance(memento.timestamp, datetime)
+
+
+def test_memento_nao_tem_dict():
+    memento = UsuarioMemento('Ana', 'ana@anotaai.com')
+
+    assert not hasattr(memento, '__dict__')
+    with pytest.raises(AttributeError):
+        memento.nome = 'Outra'
+
+
+def test_valores_iguais_sao_compartilhados_com_o_anterior(usuario):
+    primeiro = usuario.criar_memento()
+    usuario.endereco = ''.join(['Rua A, ', 'x' * 200])
+    segundo = usuario.criar_memento(anterior=primeiro)
+    usuario.telefone = '1188888'
+    terceiro = usuario.criar_memento(anterior=segundo)
+
+    assert segundo._valores is primeiro._valores
+    assert terceiro.endereco is primeiro.endereco
+    assert terceiro.telefone == '1188888'
@@ -0,0 +1,140 @@
+"""
+Verifica o plano de execução das consultas dos repositórios
+
+Cria um banco SQLite em memória com o esquema dos modelos (e um arquivo
+temporário para o histórico de perfil), executa cada consulta dos
+repositórios com EXPLAIN QUERY PLAN e termina com código 1 se alguma fizer
+varredura completa de tabela sem estar marcada como permitida. Pensado para
+rodar no CI a cada alteração de modelo ou consulta.
+
+Uso:
+    python verificar_planos.py [-v]
+"""
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+
+from flask import Flask
+from sqlalchemy import create_engine
+
+from app import db
+from app.models import Usuario
+from app.repositories import HistoricoUsuarioRepository, UsuarioRepository
+from app.utils.plano_consultas import VerificadorPlanos
+
+TOTAL_USUARIOS = 50
+
+
+def popular(total):
+    db.session.add_all([
+        Usuario(nome=f'Usuário {i}', email=f'usuario{i}@anotaai.com', senha='senha')
+        for i in range(total)
+    ])
+    db.session.commit()
+    db.session.execute(db.text('ANALYZE'))
+
+
+def consultas_usuarios(repositorio):
+    """(rótulo, chamada, permitir_varredura) das consultas do UsuarioRepository"""
+    pagina = repositorio.get_keyset_paginated(per_page=10)
+    return [
+        ('get_by_id', lambda: repositorio.get_by_id(1), False),
+        ('get_by_field(email)', lambda: repositorio.get_by_field('email', 'usuario1@anotaai.com'), False),
+        ('exists(email)', lambda: repositorio.exists(email='usuario1@anotaai.com'), False),
+        ('buscar_por_email', lambda: repositorio.buscar_por_email('usuario2@anotaai.com'), False),
+        ('buscar_ativos', repositorio.buscar_ativos, False),
+        ('buscar_inativos', repositorio.buscar_inativos, False),
+        ('email_existe', lambda: repositorio.email_existe('usuario3@anotaai.com', excluir_id=3), False),
+        ('get_keyset_paginated', lambda: repositorio.get_keyset_paginated(per_page=10), False),
+        ('get_keyset_paginated(cursor)',
+         lambda: repositorio.get_keyset_paginated(cursor=pagina['next_cursor'], per_page=10), False),
+        # Leem a tabela inteira por definição
+        ('get_all', repositorio.get_all, True),
+        ('count', repositorio.count, True),
+        ('get_paginated', lambda: repositorio.get_paginated(page=2, per_page=10), True),
+    ]
+
+
+class HistoricoRastreado(HistoricoUsuarioRepository):
+    """HistoricoUsuarioRepository com as conexões sqlite3 incluídas na captura do verificador"""
+
+    def __init__(self, caminho_banco, verificador):
+        self.verificador = verificador
+        super().__init__(caminho_banco)
+
+    @contextmanager
+    def _conectar(self):
+        with super()._conectar() as conexao:
+            self.verificador.rastrear(conexao)
+            yield conexao
+
+
+def consultas_historico(repositorio):
+    """(rótulo, chamada, permitir_varredura) das consultas do HistoricoUsuarioRepository"""
+    estado = {'nome': 'Usuário', 'email': 'usuario@anotaai.com'}
+    return [
+        ('anexar', lambda: repositorio.anexar(1, estado, max_historico=5), False),
+        ('mover(-1)', lambda: repositorio.mover(1, -1), False),
+        ('mover(+1)', lambda: repositorio.mover(1, 1), False),
+        ('listar', lambda: repositorio.listar(1), False),
+        ('obter_atual', lambda: repositorio.obter_atual(1), False),
+        ('contar_vizinhos', lambda: repositorio.contar_vizinhos(1), False),
+        ('limpar', lambda: repositorio.limpar(2), False),
+    ]
+
+
+def verificar_historico(verificador_principal):
+    """Analisa as consultas do histórico em um arquivo temporário, somando os resultados"""
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = os.path.join(diretorio, 'historico.db')
+        engine = create_engine(f'sqlite:///{caminho}')
+        try:
+            verificador = VerificadorPlanos(engine)
+            repositorio = HistoricoRastreado(caminho, verificador)
+            for usuario_id in range(1, TOTAL_USUARIOS + 1):
+                for _ in range(3):
+                    repositorio.anexar(usuario_id, {'nome': f'Usuário {usuario_id}'}, max_historico=5)
+            with repositorio._conectar() as conexao:
+                conexao.execute('ANALYZE')
+
+            for rotulo, chamada, permitir in consultas_historico(repositorio):
+                with verificador.capturar(f'HistoricoUsuarioRepository.{rotulo}', permitir_varredura=permitir):
+                    chamada()
+        finally:
+            engine.dispose()
+    verificador_principal.resultados.extend(verificador.resultados)
+
+
+def main():
+    detalhado = '-v' in sys.argv[1:]
+
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    db.init_app(app)
+
+    with app.app_context():
+        db.create_all()
+        popular(TOTAL_USUARIOS)
+
+        verificador = VerificadorPlanos(db.engine)
+        # Sem cache de segundo nível, para que toda leitura chegue ao banco
+        repositorio = UsuarioRepository()
+        repositorio.cache = None
+
+        for rotulo, chamada, permitir in consultas_usuarios(repositorio):
+            db.session.expunge_all()
+            with verificador.capturar(f'UsuarioRepository.{rotulo}', permitir_varredura=permitir):
+                chamada()
+
+        verificar_historico(verificador)
+
+        falhas = verificador.falhas()
+        if detalhado or falhas:
+            print(verificador.relatorio())
+        print(f'{len(verificador.resultados)} consultas analisadas, {len(falhas)} com varredura completa')
+        return 1 if falhas else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())